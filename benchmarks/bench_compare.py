@@ -0,0 +1,188 @@
+"""Run the same workload against two targets side by side (A/B).
+
+    python -m benchmarks.bench_compare local production
+    python -m benchmarks.bench_compare local production -c 8 -n 25 --rounds 6 --auth \
+        --path /api/video/list --path /api/video/view/v2/1
+
+Targets are config.settings environment profiles or base URLs (a URL uses
+the default profile's credentials and pool sizes). Rounds alternate between
+the targets, so drift in network or backend load hits both alike; each round
+runs ``-c`` workers for ``-n`` requests after a warm-up. A delta is flagged
+when the p50 confidence intervals don't overlap.
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+
+from config.settings import ENVIRONMENTS, environment
+from utils.api_client import APIClient
+from utils.bench import summarize_latencies
+from utils.load import run_concurrently
+
+DEFAULT_PATHS = ["/api/video/list", "/api/video/view/v2/1"]
+
+
+def resolve_target(spec):
+    if spec in ENVIRONMENTS:
+        return environment(spec)
+    return {**environment(), "name": spec, "base_url": spec.rstrip("/")}
+
+
+def make_client(profile, concurrency):
+    return APIClient(
+        profile["base_url"],
+        pool_connections=profile["pool_connections"],
+        pool_maxsize=max(concurrency, profile["pool_maxsize"]),
+        max_retries=profile["max_retries"],
+        timeout=profile["timeout"],
+    )
+
+
+def login(client, profile):
+    response = client.post(
+        "/api/auth/login",
+        json={"email": profile["user_email"], "password": profile["user_password"]},
+    )
+    if response.status_code != 200:
+        raise RuntimeError(f"{profile['name']}: login failed ({response.status_code})")
+    return response.json()["data"]["accessToken"]
+
+
+def run_round(client, headers, paths, concurrency, iterations, warmup, latencies, statuses):
+    def worker(w):
+        worker_client = client.fork()
+
+        def call(i):
+            path = paths[(w + i) % len(paths)]
+            start = time.perf_counter()
+            response = worker_client.get(path, headers=headers)
+            if i >= 0:
+                latencies[path].append((time.perf_counter() - start) * 1000)
+                statuses[path][response.status_code] += 1
+
+        return call
+
+    workers = [("round", worker(w)) for w in range(concurrency)]
+    result = run_concurrently(workers, iterations=iterations, warmup=warmup)["round"]
+    return result["count"], result["wall_s"], result["errors"]
+
+
+def _overlap(a, b):
+    return a is None or b is None or a[0] <= b[1] and b[0] <= a[1]
+
+
+def compare(targets, paths, concurrency, iterations, rounds, warmup, auth):
+    runs = []
+    for profile in targets:
+        client = make_client(profile, concurrency)
+        headers = {"Authorization": f"Bearer {login(client, profile)}"} if auth else {}
+        runs.append(
+            {
+                "profile": profile,
+                "client": client,
+                "headers": headers,
+                "latencies": defaultdict(list),
+                "statuses": defaultdict(lambda: defaultdict(int)),
+                "requests": 0,
+                "wall_s": 0.0,
+                "errors": [],
+            }
+        )
+    for _ in range(rounds):
+        for run in runs:
+            count, wall, errors = run_round(
+                run["client"], run["headers"], paths, concurrency, iterations, warmup,
+                run["latencies"], run["statuses"],
+            )
+            run["requests"] += count
+            run["wall_s"] += wall
+            run["errors"] += errors
+    for run in runs:
+        run["client"].transport.close()
+
+    report = {"targets": [], "paths": {}}
+    for run in runs:
+        report["targets"].append(
+            {
+                "name": run["profile"]["name"],
+                "base_url": run["profile"]["base_url"],
+                "rps": run["requests"] / run["wall_s"] if run["wall_s"] else 0.0,
+                "errors": len(run["errors"]),
+                "first_errors": run["errors"][:3],
+            }
+        )
+    for path in paths:
+        a, b = (summarize_latencies(run["latencies"][path]) for run in runs)
+        report["paths"][path] = {
+            "a": a,
+            "b": b,
+            "statuses": [dict(run["statuses"][path]) for run in runs],
+            "delta_p50_pct": (b["p50_ms"] - a["p50_ms"]) / a["p50_ms"] * 100
+            if a["count"] and b["count"]
+            else None,
+            "significant": a["count"] > 0
+            and b["count"] > 0
+            and not _overlap(a["p50_ci_ms"], b["p50_ci_ms"]),
+        }
+    return report
+
+
+def format_report(report):
+    a, b = report["targets"]
+    lines = [f"A = {a['name']} ({a['base_url']})", f"B = {b['name']} ({b['base_url']})", ""]
+    lines.append(
+        f"{'path':<32} {'A p50':>8} {'B p50':>8} {'A p95':>8} {'B p95':>8} {'B vs A':>8}"
+    )
+    for path, row in report["paths"].items():
+        if row["delta_p50_pct"] is None:
+            lines.append(f"{path:<32} no samples")
+            continue
+        flag = " *" if row["significant"] else ""
+        lines.append(
+            f"{path:<32} {row['a']['p50_ms']:>8.1f} {row['b']['p50_ms']:>8.1f}"
+            f" {row['a']['p95_ms']:>8.1f} {row['b']['p95_ms']:>8.1f}"
+            f" {row['delta_p50_pct']:>+7.1f}%{flag}"
+        )
+    lines += [
+        "",
+        f"rps: A {a['rps']:.1f}, B {b['rps']:.1f}; errors: A {a['errors']}, B {b['errors']}",
+        "* p50 95% confidence intervals do not overlap",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("target_a", help="Environment profile or base URL")
+    parser.add_argument("target_b", help="Environment profile or base URL")
+    parser.add_argument("--path", action="append", dest="paths")
+    parser.add_argument("-c", "--concurrency", type=int, default=4)
+    parser.add_argument("-n", "--iterations", type=int, default=25, help="Requests per worker per round")
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed requests per worker per round")
+    parser.add_argument("--auth", action="store_true", help="Log in with each profile's user")
+    parser.add_argument("--json", help="Also write the comparison to this file")
+    args = parser.parse_args(argv)
+
+    targets = [resolve_target(args.target_a), resolve_target(args.target_b)]
+    report = compare(
+        targets,
+        args.paths or DEFAULT_PATHS,
+        args.concurrency,
+        args.iterations,
+        args.rounds,
+        args.warmup,
+        args.auth,
+    )
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Compare the same request workload with and without connection reuse.
+
+    python -m benchmarks.bench_connection_reuse -n 50
+    python -m benchmarks.bench_connection_reuse --base-url http://localhost:4000 \
+        --path /api/video/list --path /api/video/view/v2/1
+
+Modes:
+  keep-alive  one APIClient session, HTTP/1.1 persistent connections
+  fresh       the pool is emptied after every request, so each request pays
+              TCP connect (and TLS handshake for https) again
+  h2          the httpx backend, HTTP/2 over one connection (ALPN for https;
+              for a cleartext target such as
+              ``utils.mock_server --mode async --http2``
+              set VUT_HTTP2_PRIOR_KNOWLEDGE=1)
+
+Every mode counts connections and handshakes with utils.connstats, so the
+columns compare directly; ``protocol`` is what the responses actually used.
+"""
+
+import argparse
+import sys
+import time
+
+from config.settings import BASE_URL
+from utils.api_client import APIClient
+from utils.bench import summarize_latencies
+from utils.connstats import ConnectionStats
+
+DEFAULT_PATHS = ["/api/video/list", "/api/video/view/v2/99999"]
+
+
+MODES = {"keep-alive": "requests", "fresh": "requests", "h2": "httpx"}
+
+
+def run_mode(mode, base_url, paths, count, pool_maxsize):
+    stats = ConnectionStats()
+    client = APIClient(
+        base_url, pool_maxsize=pool_maxsize, connection_stats=stats, transport=MODES[mode]
+    )
+    latencies, protocols = [], set()
+    start = time.perf_counter()
+    for i in range(count):
+        t = time.perf_counter()
+        response = client.get(paths[i % len(paths)])
+        latencies.append((time.perf_counter() - t) * 1000)
+        protocols.add(getattr(response, "http_version", "HTTP/1.1"))
+        if mode == "fresh":
+            client.session.close()
+    wall = time.perf_counter() - start
+    client.transport.close()
+    return {
+        "mode": mode,
+        "protocol": "/".join(sorted(protocols)),
+        "wall_s": wall,
+        "rps": count / wall,
+        **summarize_latencies(latencies),
+        "totals": stats.totals(),
+        "stats": stats,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--path", action="append", dest="paths")
+    parser.add_argument("-n", "--requests", type=int, default=50)
+    parser.add_argument("--pool-maxsize", type=int, default=10)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("-v", "--verbose", action="store_true", help="Per-endpoint tables")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or DEFAULT_PATHS
+    print(f"{args.requests} requests to {args.base_url} over {len(paths)} endpoint(s)")
+    print(
+        f"{'mode':<12} {'rps':>8} {'p50 ms':>8} {'p99 ms':>8} {'conns':>6}"
+        f" {'tls':>5} {'tcp ms':>9} {'tls ms':>9}  protocol"
+    )
+    for mode in args.modes:
+        try:
+            result = run_mode(mode, args.base_url, paths, args.requests, args.pool_maxsize)
+        except RuntimeError as e:
+            print(f"{mode:<12} skipped: {e}")
+            continue
+        totals = result["totals"]
+        print(
+            f"{mode:<12} {result['rps']:>8.1f} {result['p50_ms']:>8.1f}"
+            f" {result['p99_ms']:>8.1f} {int(totals.get('connections', 0)):>6}"
+            f" {int(totals.get('tls_handshakes', 0)):>5}"
+            f" {totals.get('tcp_connect_ms', 0):>9.1f} {totals.get('tls_handshake_ms', 0):>9.1f}"
+            f"  {result['protocol']}"
+        )
+        if args.verbose:
+            print(result["stats"].format_report(), end="\n\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Measure the JSON parse overhead APIResponse saves.
+
+    python -m benchmarks.bench_json_parse --calls 3 --videos 10
+
+Tests call response.json() once to log the body and again for assertions.
+This compares plain requests.Response.json() against the memoized APIResponse,
+with the stdlib and (when installed) orjson/ujson decoders, on a video-list
+body shaped like the one /api/video/list returns. The suite projection uses
+the number of responses in the last run stored in the results database
+(``--suite-responses`` overrides it).
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+import requests
+
+from utils import response as response_module
+from utils.response import APIResponse, _pick_loads
+from utils.results_store import DEFAULT_DB_PATH, ResultStore
+
+
+def last_suite_responses(db_path=DEFAULT_DB_PATH):
+    """Responses received in the last recorded suite run, or None without one."""
+    if not os.path.exists(db_path):
+        return None
+    store = ResultStore(db_path)
+    try:
+        rows = store.history(limit=1)
+    finally:
+        store.close()
+    return sum(row["count"] for row in rows) or None
+
+
+def video_list_body(videos):
+    item = {
+        "video_id": 27,
+        "user_id": 24,
+        "title": "My First Processed Video",
+        "description": "This is a test upload after merging chunks",
+        "video_url": "/session_1755170052433/manifest.m3u8",
+        "duration": 120,
+        "thumbnail_img": "https://example.com/thumb.jpg",
+        "status": "completed",
+        "created_date": 1755170414476,
+        "updated_date": 1755170414476,
+        "storage": 300,
+        "views": 0,
+        "unique_video_key": "303482e81eb729fe33143e6a12a2e503",
+    }
+    body = {
+        "success": True,
+        "status": 200,
+        "page": 1,
+        "limit": videos,
+        "data": [dict(item, video_id=i) for i in range(videos)],
+    }
+    return json.dumps(body).encode()
+
+
+def make_response(content):
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    response.encoding = "utf-8"
+    return response
+
+
+def per_response_us(factory, calls, number):
+    def run():
+        response = factory()
+        for _ in range(calls):
+            response.json()
+
+    return min(timeit.repeat(run, number=number, repeat=5)) / number * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=3, help="json() calls per response")
+    parser.add_argument("--videos", type=int, default=10, help="Items in the list body")
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument(
+        "--requests", type=int, default=100_000, help="Request count to project savings for"
+    )
+    parser.add_argument(
+        "--suite-responses", type=int, help="Default: responses in the last stored suite run"
+    )
+    parser.add_argument("--results-db", default=DEFAULT_DB_PATH)
+    args = parser.parse_args(argv)
+    suite = args.suite_responses or last_suite_responses(args.results_db)
+
+    content = video_list_body(args.videos)
+    cases = [("requests.Response.json()", lambda: make_response(content))]
+    for backend in ("json", "orjson", "ujson"):
+        name, loads = _pick_loads(backend)
+        if name != backend:
+            continue
+
+        def factory(loads=loads):
+            response_module._loads = loads
+            return APIResponse(make_response(content))
+
+        cases.append((f"APIResponse [{backend}]", factory))
+
+    suite_note = (
+        f"suite run of {suite} responses" if suite
+        else f"no suite run in {args.results_db}, pass --suite-responses"
+    )
+    print(
+        f"body {len(content)} bytes, {args.calls} json() calls per response;"
+        f" projections: {suite_note}, {args.requests} load requests"
+    )
+    print(f"{'variant':<28} {'us/response':>12} {'suite ms':>10} {'load s':>10}")
+    baseline = None
+    for label, factory in cases:
+        us = per_response_us(factory, args.calls, args.number)
+        baseline = baseline or us
+        suite_ms = f"{us * suite / 1000:>10.2f}" if suite else f"{'-':>10}"
+        print(
+            f"{label:<28} {us:>12.1f} {suite_ms}"
+            f" {us * args.requests / 1e6:>10.2f}  ({baseline / us:.1f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
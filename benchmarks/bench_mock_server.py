@@ -0,0 +1,122 @@
+"""Requests/sec of utils.mock_server per endpoint and serving mode.
+
+    python -m benchmarks.bench_mock_server
+    python -m benchmarks.bench_mock_server --configs threaded async async:4 \
+        -d 3 -c 16 --client-processes 4 --endpoint "GET /api/video/list"
+
+Each config is ``mode[:workers]``. Load comes from ``--client-processes``
+processes with ``-c`` threads each, so the Python client is less likely to be
+the limit. The mock and its load share this machine's CPUs, so read the
+numbers as the mock's ceiling on this host: a client-side load test that
+gets close to them is measuring the stub, not the client.
+"""
+
+import argparse
+import multiprocessing
+import os
+import re
+import sys
+
+from utils.api_client import APIClient
+from utils.bench import summarize_latencies
+from utils.load import run_concurrently
+from utils.mock_server import MockServer, build_routes
+
+
+def spec_endpoints():
+    """``[(METHOD, concrete path)]`` for every operation in utils/api.json."""
+    return [
+        (method, re.sub(r"\{[^/]+?\}", "1", template))
+        for method, _, template, _, _ in build_routes()
+    ]
+
+
+def _client_process(base_url, method, path, threads, duration, warmup):
+    client = APIClient(base_url, pool_maxsize=threads, timeout=30)
+    body = {} if method in ("POST", "PUT", "PATCH") else None
+
+    def worker(_):
+        worker_client = client.fork()
+
+        def call(i):
+            response = worker_client.request(method, path, json=body)
+            assert response.status_code < 500, response.status_code
+
+        return call
+
+    result = run_concurrently(
+        [("load", worker(w)) for w in range(threads)], duration=duration, warmup=warmup
+    )["load"]
+    return result["latencies_ms"], result["wall_s"], len(result["errors"])
+
+
+def run_endpoint(base_url, method, path, processes, threads, duration, warmup):
+    context = multiprocessing.get_context("fork")
+    with context.Pool(processes) as pool:
+        parts = pool.starmap(
+            _client_process,
+            [(base_url, method, path, threads, duration, warmup)] * processes,
+        )
+    latencies = [ms for part, _, _ in parts for ms in part]
+    wall = max(wall for _, wall, _ in parts)
+    return {
+        "rps": len(latencies) / wall if wall else 0.0,
+        "errors": sum(errors for _, _, errors in parts),
+        **summarize_latencies(latencies),
+    }
+
+
+def parse_config(value):
+    mode, _, workers = value.partition(":")
+    return mode, int(workers or 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--configs", nargs="+", default=["threaded", "async", "async:2"])
+    parser.add_argument(
+        "--endpoint", action="append", dest="endpoints", metavar="'METHOD PATH'",
+        help="Default: every operation in utils/api.json",
+    )
+    parser.add_argument("-d", "--duration", type=float, default=2.0, help="Seconds per endpoint")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="Threads per client process")
+    parser.add_argument("--client-processes", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed requests per thread")
+    args = parser.parse_args(argv)
+
+    endpoints = (
+        [tuple(e.split(" ", 1)) for e in args.endpoints] if args.endpoints else spec_endpoints()
+    )
+    configs = [parse_config(c) for c in args.configs]
+    print(
+        f"{len(endpoints)} endpoint(s), {args.client_processes} client process(es) x "
+        f"{args.concurrency} threads, {args.duration:g}s each, {os.cpu_count()} CPU(s)"
+    )
+    header = f"{'endpoint':<48}" + "".join(f" {c:>16}" for c in args.configs)
+    print(header + "\n" + " " * 48 + "".join(f" {'rps / p50 ms':>16}" for _ in configs))
+    totals = {config: [] for config in args.configs}
+    rows = {endpoint: [] for endpoint in endpoints}
+    for name, (mode, workers) in zip(args.configs, configs):
+        with MockServer(mode=mode, workers=workers) as server:
+            for method, path in endpoints:
+                result = run_endpoint(
+                    server.url, method, path, args.client_processes,
+                    args.concurrency, args.duration, args.warmup,
+                )
+                rows[(method, path)].append(result)
+                totals[name].append(result["rps"])
+    for (method, path), results in rows.items():
+        cells = "".join(
+            f" {r['rps']:>8.0f} / {r.get('p50_ms', 0):>5.1f}" + ("!" if r["errors"] else "")
+            for r in results
+        )
+        print(f"{f'{method} {path}':<48}{cells}")
+    print(
+        f"{'lowest rps (mock ceiling)':<48}"
+        + "".join(f" {min(values):>16.0f}" for values in totals.values())
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Measure how long pytest takes to reach the first test.
+
+    python -m benchmarks.bench_startup -n 5 -k test_login_success
+
+Each repetition runs pytest in a fresh process with --startup-report and
+splits the time into interpreter/plugin start-up, collection, and the gap
+between collection and the first test's body (its fixture setup included).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PHASES = ("launch_to_conftest_ms", "conftest_to_collected_ms", "collected_to_first_test_ms")
+
+
+def run_once(select, extra_args=()):
+    with tempfile.TemporaryDirectory() as tmp:
+        report = os.path.join(tmp, "startup.json")
+        launched_at = time.time()
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "-q",
+                "-k",
+                select,
+                "--startup-report",
+                report,
+                "--no-results-db",
+                *extra_args,
+            ],
+            capture_output=True,
+            check=False,
+        )
+        if not os.path.exists(report):
+            raise RuntimeError(f"No test matched -k {select!r}; nothing was timed")
+        with open(report, encoding="utf-8") as f:
+            stamps = json.load(f)
+    return {
+        "launch_to_conftest_ms": (stamps["conftest_loaded_at"] - launched_at) * 1000,
+        "conftest_to_collected_ms": (
+            stamps["collection_finished_at"] - stamps["conftest_loaded_at"]
+        )
+        * 1000,
+        "collected_to_first_test_ms": (
+            stamps["first_test_at"] - stamps["collection_finished_at"]
+        )
+        * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    parser.add_argument("-k", dest="select", default="test_login_success")
+    args, extra = parser.parse_known_args(argv)
+
+    samples = [run_once(args.select, extra) for _ in range(args.repeat)]
+    print(f"{'phase':<28} {'median':>8} {'min':>8} {'max':>8}  (ms, n={args.repeat})")
+    for phase in PHASES:
+        values = [s[phase] for s in samples]
+        print(
+            f"{phase:<28} {statistics.median(values):>8.1f}"
+            f" {min(values):>8.1f} {max(values):>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Compare the requests and httpx backends under concurrency.
+
+    python -m benchmarks.bench_transport --base-url https://vut-backend.tcdev.site
+    python -m benchmarks.bench_transport -c 16 -n 50
+
+With an https target httpx negotiates HTTP/2 via ALPN. Without --base-url
+two in-process async utils.mock_server instances are started: HTTP/1.1 for
+requests and cleartext HTTP/2 (``http2=True``) for httpx, which then runs
+with VUT_HTTP2_PRIOR_KNOWLEDGE=1. If ``h2`` is missing, httpx falls back to
+the HTTP/1.1 mock. The protocol column shows what each backend actually used.
+
+Backends:
+  requests  one fork (own session and connection pool) per worker thread
+  httpx     one shared client; concurrent requests multiplex over HTTP/2
+"""
+
+import argparse
+import os
+import sys
+from collections import Counter
+
+from utils.api_client import APIClient
+from utils.load import run_concurrently
+from utils.mock_server import MockServer
+from utils.profiling import ClientProfiler
+
+DEFAULT_PATHS = ["/api/video/list", "/api/video/view/v2/1"]
+
+
+def run_backend(
+    backend, base_url, paths, concurrency, iterations, warmup, prior_knowledge=False
+):
+    previous = os.environ.get("VUT_HTTP2_PRIOR_KNOWLEDGE")
+    if prior_knowledge:
+        os.environ["VUT_HTTP2_PRIOR_KNOWLEDGE"] = "1"
+    try:
+        client = APIClient(base_url, pool_maxsize=concurrency, transport=backend)
+    finally:
+        if previous is None:
+            os.environ.pop("VUT_HTTP2_PRIOR_KNOWLEDGE", None)
+        else:
+            os.environ["VUT_HTTP2_PRIOR_KNOWLEDGE"] = previous
+    versions = []
+
+    def worker(w):
+        worker_client = client.fork()
+
+        def call(i):
+            response = worker_client.get(paths[(w + i) % len(paths)])
+            versions.append(getattr(response, "http_version", "HTTP/1.1"))
+            assert response.status_code < 500, response.status_code
+
+        return call
+
+    # Untimed warm-up requests per worker open the connections (and for httpx
+    # settle the protocol) before the clock starts.
+    workers = [(backend, worker(w)) for w in range(concurrency)]
+    result = run_concurrently(workers, iterations=iterations, warmup=warmup)[backend]
+    result["rps"] = result["count"] / result["wall_s"]
+    client.transport.close()
+    return result, Counter(versions)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=None, help="Default: in-process mock server")
+    parser.add_argument("--path", action="append", dest="paths")
+    parser.add_argument("-c", "--concurrency", type=int, default=8)
+    parser.add_argument("-n", "--iterations", type=int, default=50, help="Requests per worker")
+    parser.add_argument(
+        "--warmup", type=int, default=5, help="Untimed requests per worker first"
+    )
+    parser.add_argument("--backends", nargs="+", default=["requests", "httpx"])
+    parser.add_argument(
+        "--profile", metavar="DIR", help="Profile the client per backend (utils.profiling)"
+    )
+    args = parser.parse_args(argv)
+
+    paths = args.paths or DEFAULT_PATHS
+    servers = []
+    http2_seen = False
+    # backend -> (base URL, use HTTP/2 prior knowledge)
+    targets = {backend: (args.base_url, False) for backend in args.backends}
+    if args.base_url is None:
+        http1 = MockServer(mode="async").start()
+        servers.append(http1)
+        targets = {backend: (http1.url, False) for backend in args.backends}
+        if "httpx" in args.backends:
+            try:
+                h2c = MockServer(mode="async", http2=True).start()
+            except RuntimeError as e:
+                print(f"httpx uses the HTTP/1.1 mock: {e}")
+            else:
+                servers.append(h2c)
+                targets["httpx"] = (h2c.url, True)
+    try:
+        for backend, (base_url, prior_knowledge) in targets.items():
+            protocol = " (h2c prior knowledge)" if prior_knowledge else ""
+            print(
+                f"{backend}: {args.concurrency} workers x {args.iterations} requests"
+                f" to {base_url}{protocol}"
+            )
+        print(
+            f"{'backend':<10} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+            f" {'p50 95% CI':>15} {'errors':>6}  protocol"
+        )
+        for backend in args.backends:
+            profiler = None
+            if args.profile:
+                profiler = ClientProfiler(f"{args.profile}/{backend}").start()
+            base_url, prior_knowledge = targets[backend]
+            try:
+                result, versions = run_backend(
+                    backend,
+                    base_url,
+                    paths,
+                    args.concurrency,
+                    args.iterations,
+                    args.warmup,
+                    prior_knowledge,
+                )
+            except RuntimeError as e:
+                print(f"{backend:<10} skipped: {e}")
+                continue
+            finally:
+                if profiler is not None:
+                    print(f"{backend:<10} profile: {profiler.stop()['folded']}")
+            http2_seen = http2_seen or "HTTP/2" in versions
+            protocols = ", ".join(f"{v} x{n}" for v, n in versions.most_common())
+            low, high = result["p50_ci_ms"] or (0, 0)
+            print(
+                f"{backend:<10} {result['rps']:>8.1f} {result['p50_ms']:>8.2f}"
+                f" {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+                f" {f'{low:.2f}-{high:.2f}':>15} {len(result['errors']):>6}  {protocols}"
+            )
+    finally:
+        for server in servers:
+            server.stop()
+    if not http2_seen:
+        print("No response used HTTP/2; this run does not compare protocols")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
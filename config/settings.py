@@ -1 +1,74 @@
-BASE_URL = "https://vut-backend.tcdev.site"
+import os
+
+# Named targets, picked with VUT_ENV or pytest --env. VUT_BASE_URL,
+# VUT_USER_EMAIL, VUT_USER_PASSWORD, VUT_ADMIN_EMAIL and VUT_ADMIN_PASSWORD
+# override the chosen profile, e.g. for CI secrets.
+ENVIRONMENTS = {
+    "production": {
+        "base_url": "https://vut-backend.tcdev.site",
+        "user_email": "jaishree9898@gmail.com",
+        "user_password": "Admin@123",
+        "admin_email": "admin@gmail.com",
+        # Not stored here; set VUT_ADMIN_PASSWORD. Admin tests skip without it.
+        "admin_password": None,
+        "timeout": 30,  # seconds per request; None waits forever
+        "pool_connections": 10,
+        "pool_maxsize": 10,
+        "max_retries": 0,
+        # Port for utils.smtp_sink; None where emails go to real inboxes.
+        "smtp_sink_port": None,
+        # Whether tests marked bulk_upload may run: there is no delete
+        # endpoint, so the videos they upload stay (pytest --allow-bulk-uploads).
+        "bulk_uploads": False,
+    },
+    "local": {
+        # Backend from its repo with `npm run dev`; first server in utils/api.json.
+        "base_url": "http://localhost:4000",
+        "user_email": "jaishree9898@gmail.com",
+        "user_password": "Admin@123",
+        "admin_email": "admin@gmail.com",
+        "admin_password": None,
+        "timeout": 10,
+        "pool_connections": 10,
+        "pool_maxsize": 20,
+        "max_retries": 0,
+        # Run the backend with SMTP_HOST=127.0.0.1 SMTP_PORT=2525 (no TLS).
+        "smtp_sink_port": 2525,
+        "bulk_uploads": True,
+    },
+}
+_OVERRIDES = {
+    "base_url": "VUT_BASE_URL",
+    "user_email": "VUT_USER_EMAIL",
+    "user_password": "VUT_USER_PASSWORD",
+    "admin_email": "VUT_ADMIN_EMAIL",
+    "admin_password": "VUT_ADMIN_PASSWORD",
+}
+
+
+def environment(name=None):
+    """Settings of profile ``name`` (default ``$VUT_ENV`` or production) with env overrides."""
+    name = name or os.environ.get("VUT_ENV", "production")
+    try:
+        profile = dict(ENVIRONMENTS[name], name=name)
+    except KeyError:
+        raise ValueError(
+            f"Unknown environment {name!r}; choose from {sorted(ENVIRONMENTS)}"
+        ) from None
+    for key, variable in _OVERRIDES.items():
+        if os.environ.get(variable):
+            profile[key] = os.environ[variable]
+    return profile
+
+
+ENV = environment()
+BASE_URL = ENV["base_url"]
+TIMEOUT = ENV["timeout"]
+
+# requests connection pool (HTTPAdapter) settings used by APIClient.
+POOL_CONNECTIONS = ENV["pool_connections"]  # pools kept, one per host
+POOL_MAXSIZE = ENV["pool_maxsize"]  # connections kept alive per host
+MAX_RETRIES = ENV["max_retries"]  # int or urllib3 Retry; 0 keeps failures visible to tests
+
+# "requests" (HTTP/1.1, default) or "httpx" (HTTP/2, needs httpx[http2]).
+HTTP_BACKEND = os.environ.get("VUT_HTTP_BACKEND", "requests")
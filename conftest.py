@@ -1,35 +1,246 @@
 import os
+import time
+import allure
+import json
 import pytest
 import logging
-import sys
-from utils.api_client import APIClient
+import shutil
+import threading
+from config.settings import ENVIRONMENTS, environment as load_environment
+from utils.allure_perf import attach_request_metrics, write_performance_summary
+from utils.log import setup_logging
+from utils.metrics import MetricsRecorder, summarize
 from utils.utils import generate_account_status_name
 
-# 👇 Make sure the logs directory exists
-os.makedirs("logs", exist_ok=True)
-
-# ✅ Logging setup: log to both terminal and file
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(name)s - %(funcName)s:%(lineno)d - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),  # Terminal
-        logging.FileHandler("logs/test.log", mode="w"),  # File (overwrites each run)
-    ],
-)
+# Start of the startup timeline reported by --startup-report.
+_CONFTEST_LOADED_AT = time.time()
+
+# requests (via utils.api_client) and sqlite3 (via utils.results_store) are
+# imported where they are first needed so `pytest -k`/--collect-only stay fast.
+
+# ✅ Logging setup: log to both terminal and logs/test.log (JSON lines, overwritten
+# each run). Records go through a queue so formatting and file writes happen on
+# a background thread; bodies are redacted and capped (see utils/log.py).
+_log_listener = setup_logging("logs/test.log")
 logger = logging.getLogger(__name__)
 
+metrics_key = pytest.StashKey[MetricsRecorder]()
+connection_stats_key = pytest.StashKey[object]()
+startup_key = pytest.StashKey[dict]()
+snapshot_key = pytest.StashKey["SnapshotRecorder"]()
+executed_key = pytest.StashKey[dict]()
+profiler_key = pytest.StashKey["ClientProfiler"]()
+batcher_key = pytest.StashKey["MatrixBatcher"]()
+environment_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--env",
+        choices=sorted(ENVIRONMENTS),
+        default=None,
+        help="Target environment profile from config/settings.py: base URL, credentials, "
+        "timeout and pool sizes (default: $VUT_ENV or production).",
+    )
+    parser.addoption(
+        "--results-db",
+        default=None,
+        help="SQLite file that per-endpoint latency stats are appended to after each run "
+        "(default: $VUT_RESULTS_DB or perf-results/results.db).",
+    )
+    parser.addoption(
+        "--no-results-db",
+        action="store_true",
+        help="Do not record this run in the results database.",
+    )
+    parser.addoption(
+        "--slow-ms",
+        type=float,
+        default=1000.0,
+        help="Requests slower than this are reported under the Allure 'Performance' epic.",
+    )
+    parser.addoption(
+        "--profile-connections",
+        action="store_true",
+        help="Count new TCP connections and TLS handshakes per endpoint and report the reuse ratio.",
+    )
+    parser.addoption(
+        "--http-backend",
+        choices=("requests", "httpx"),
+        default=None,
+        help="HTTP client behind APIClient; httpx speaks HTTP/2 (default: $VUT_HTTP_BACKEND or requests).",
+    )
+    parser.addoption(
+        "--profile-client",
+        nargs="?",
+        const="perf-results/profile",
+        default=None,
+        metavar="DIR",
+        help="Profile the client side (cProfile, sampled stacks for flamegraphs, tracemalloc "
+        "top-N) and write the reports under DIR (default: perf-results/profile).",
+    )
+    parser.addoption(
+        "--run-perf",
+        action="store_true",
+        help="Run tests marked 'perf' (they seed data and take minutes).",
+    )
+    parser.addoption(
+        "--allow-bulk-uploads",
+        action="store_true",
+        help="Run tests marked 'bulk_upload' against an environment whose profile does not "
+        "allow them; the videos they upload cannot be deleted.",
+    )
+    parser.addoption(
+        "--affected-since",
+        default=None,
+        metavar="GIT_REF",
+        help="Only run tests affected by spec or source changes since GIT_REF; "
+        "falls back to the full suite when the endpoint map is stale.",
+    )
+    parser.addoption(
+        "--impact-map",
+        default=None,
+        help="Test-to-endpoint map written after each run and read by --affected-since "
+        "(default: $VUT_IMPACT_MAP or perf-results/test-endpoints.json).",
+    )
+    parser.addoption(
+        "--snapshot",
+        action="store_true",
+        help="Compare each test's response shapes with its stored snapshot; missing snapshots are recorded.",
+    )
+    parser.addoption(
+        "--snapshot-update",
+        action="store_true",
+        help="Re-record the snapshots of every test that runs (implies --snapshot).",
+    )
+    parser.addoption(
+        "--snapshot-dir",
+        default="snapshots",
+        help="Directory snapshots are stored in (default: snapshots).",
+    )
+    parser.addoption(
+        "--batch-matrices",
+        action="store_true",
+        help="Send the cases of tests marked 'batch' concurrently before they run; "
+        "each case still reports on its own (see utils/batch.py).",
+    )
+    parser.addoption(
+        "--startup-report",
+        default=None,
+        help="Write session startup timestamps as JSON to this file (used by benchmarks/bench_startup.py).",
+    )
+
+
+def pytest_configure(config):
+    config.stash[environment_key] = load_environment(config.getoption("--env"))
+    config.stash[metrics_key] = MetricsRecorder()
+    config.stash[startup_key] = {"conftest_loaded_at": _CONFTEST_LOADED_AT}
+    config.stash[executed_key] = {}
+    config.addinivalue_line(
+        "markers", "perf: latency/scaling benchmark, only runs with --run-perf"
+    )
+    config.addinivalue_line(
+        "markers",
+        "bulk_upload: uploads many videos; runs only where the environment allows it "
+        "(--env=local) or with --allow-bulk-uploads",
+    )
+    config.addinivalue_line(
+        "markers",
+        "batch: validation matrix whose cases can run concurrently with --batch-matrices",
+    )
+    if config.getoption("--snapshot") or config.getoption("--snapshot-update"):
+        from utils.snapshot import SnapshotRecorder
+
+        config.stash[snapshot_key] = SnapshotRecorder(
+            config.getoption("--snapshot-dir"),
+            update=config.getoption("--snapshot-update"),
+        )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--affected-since"):
+        _select_affected(config, items)
+    if not (
+        config.stash[environment_key]["bulk_uploads"]
+        or config.getoption("--allow-bulk-uploads")
+    ):
+        skip_bulk = pytest.mark.skip(
+            reason="uploads videos that cannot be deleted; use --env=local or "
+            "--allow-bulk-uploads"
+        )
+        for item in items:
+            if "bulk_upload" in item.keywords:
+                item.add_marker(skip_bulk)
+    if config.getoption("--run-perf"):
+        return
+    skip_perf = pytest.mark.skip(reason="perf benchmark, pass --run-perf to run")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+def _select_affected(config, items):
+    from utils.impact import DEFAULT_MAP_PATH, affected_tests, load_map
+
+    ref = config.getoption("--affected-since")
+    mapping = load_map(config.getoption("--impact-map") or DEFAULT_MAP_PATH)
+    selected, reason = affected_tests(
+        ref,
+        [item.nodeid for item in items],
+        mapping,
+        fixtures={item.nodeid: item.fixturenames for item in items},
+    )
+    if selected is None:
+        logger.info(f"Running the full suite ({reason})")
+        return
+    selected = set(selected)
+    deselected = [item for item in items if item.nodeid not in selected]
+    items[:] = [item for item in items if item.nodeid in selected]
+    config.hook.pytest_deselected(items=deselected)
+    logger.info(f"Affected since {ref}: {len(items)} test(s) selected, {reason}")
+
+
+def pytest_unconfigure(config):
+    _log_listener.stop()
+
+
+@pytest.fixture(scope="session")
+def environment(pytestconfig):
+    """The selected config.settings environment profile."""
+    return pytestconfig.stash[environment_key]
+
 
 @pytest.fixture(scope="session")
-def api_client():
-    return APIClient()
+def api_client(pytestconfig, environment):
+    from utils.api_client import APIClient
+
+    connection_stats = None
+    if pytestconfig.getoption("--profile-connections"):
+        from utils.connstats import ConnectionStats
+
+        connection_stats = pytestconfig.stash[connection_stats_key] = ConnectionStats()
+    client = APIClient(
+        base_url=environment["base_url"],
+        pool_connections=environment["pool_connections"],
+        pool_maxsize=environment["pool_maxsize"],
+        max_retries=environment["max_retries"],
+        timeout=environment["timeout"],
+        connection_stats=connection_stats,
+        transport=pytestconfig.getoption("--http-backend"),
+    )
+    client.listeners.append(pytestconfig.stash[metrics_key])
+    snapshots = pytestconfig.stash.get(snapshot_key, None)
+    if snapshots is not None:
+        client.listeners.append(snapshots)
+    return client
 
 
 @pytest.fixture(scope="session")
-def auth_token(api_client):
+def auth_token(api_client, environment):
+    """Logs in once, the first time a test actually requests the token."""
     payload = {
-        "email": "jaishree9898@gmail.com",
-        "password": "Admin@123",
+        "email": environment["user_email"],
+        "password": environment["user_password"],
     }
 
     headers = {"Content-Type": "application/json"}
@@ -43,9 +254,107 @@ def auth_token(api_client):
     return data["accessToken"]
 
 
+@pytest.fixture(scope="session")
+def admin_token(api_client, environment):
+    """Access token for the admin panel endpoints (/api/admin/...)."""
+    if not environment["admin_password"]:
+        pytest.skip(
+            f"No admin password for the {environment['name']} environment; "
+            "set VUT_ADMIN_PASSWORD"
+        )
+    payload = {
+        "email": environment["admin_email"],
+        "password": environment["admin_password"],
+    }
+
+    headers = {"Content-Type": "application/json"}
+    response = api_client.post("/api/admin/auth/login", json=payload, headers=headers)
+
+    assert response.status_code == 200, f"Admin login failed: {response.text}"
+
+    data = response.json().get("data", {})
+    assert "accessToken" in data
+
+    return data["accessToken"]
+
+
 # -------------------- Test Data Fixtures --------------------
 
 
+@pytest.fixture(scope="session")
+def run_id():
+    """Id shared by everything this session creates (see utils.factory.new_run_id)."""
+    from utils.factory import new_run_id
+
+    return new_run_id()
+
+
+@pytest.fixture
+def recording_id(run_id):
+    """A fresh run-scoped recording id, for tests that need no login or upload."""
+    from utils.factory import make_recording_id
+
+    return make_recording_id(run_id)
+
+
+@pytest.fixture(scope="session")
+def data_factory(api_client, auth_token, run_id):
+    """Session-scoped utils.factory.DataFactory; uploads are cleaned up at the end."""
+    from utils.factory import DataFactory
+
+    factory = DataFactory(api_client, auth_token, run_id)
+    yield factory
+    factory.cleanup()
+
+
+@pytest.fixture(scope="session")
+def mock_server():
+    """utils.mock_server.MockServer serving utils/api.json examples locally."""
+    from utils.mock_server import MockServer
+
+    with MockServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def smtp_sink(environment):
+    """utils.smtp_sink.SmtpSink on the profile's smtp_sink_port; skips without one."""
+    port = environment["smtp_sink_port"]
+    if port is None:
+        pytest.skip(f"No SMTP sink for the {environment['name']} environment (use --env=local)")
+    from utils.smtp_sink import SmtpSink
+
+    with SmtpSink(port=port) as sink:
+        yield sink
+
+
+@pytest.fixture
+def reset_token(api_client, smtp_sink, environment):
+    """Callable ``reset_token(email=None)``: request a reset link, return its token."""
+    from utils.smtp_sink import extract_reset_token
+
+    def issue(email=None):
+        email = email or environment["user_email"]
+        since = time.time()
+        response = api_client.post("/api/password/forgot", json={"email": email})
+        assert response.status_code == 201, f"Forgot password failed: {response.text}"
+        message = smtp_sink.wait_for(email, since=since)["message"]
+        token = extract_reset_token(message)
+        assert token, f"No reset link in {message['Subject']!r}"
+        return token
+
+    return issue
+
+
+@pytest.fixture
+def fault_proxy(mock_server):
+    """utils.fault_proxy.FaultProxy in front of the mock server, without rules."""
+    from utils.fault_proxy import FaultProxy
+
+    with FaultProxy(mock_server.url, seed=1234) as proxy:
+        yield proxy
+
+
 @pytest.fixture(scope="session")
 def account_status_name():
     """Generates a shared account status value for all tests."""
@@ -57,21 +366,182 @@ def account_status_name():
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_sessionstart(session):
-    """Clean up old Allure raw results and HTML report before test session starts."""
+    """Clear old Allure raw results before the session starts.
+
+    The old folder is renamed out of the way and deleted on a background
+    thread, so the first test does not wait for a large results tree to be
+    removed. Leftovers from an interrupted earlier run are swept up too.
+    """
     for folder in ["allure-results"]:
+        stale = [
+            name
+            for name in os.listdir(".")
+            if name.startswith(f"{folder}.old-") and os.path.isdir(name)
+        ]
         if os.path.exists(folder):
             try:
-                for filename in os.listdir(folder):
-                    file_path = os.path.join(folder, filename)
-                    if os.path.isfile(file_path) or os.path.islink(file_path):
-                        os.unlink(file_path)
-                    elif os.path.isdir(file_path):
-                        import shutil
-
-                        shutil.rmtree(file_path)
+                trash = f"{folder}.old-{os.getpid()}-{time.time_ns()}"
+                os.rename(folder, trash)
+                stale.append(trash)
                 logger.info(f"Cleared contents of '{folder}'")
-            except Exception as e:
+            except OSError as e:
                 logger.warning(f"Failed to clear contents of '{folder}': {e}")
-        else:
-            os.makedirs(folder)
-            logger.info(f"Created missing folder '{folder}'")
+        os.makedirs(folder, exist_ok=True)
+        if stale:
+            threading.Thread(
+                target=_remove_trees, args=(stale,), name="allure-cleanup"
+            ).start()
+
+
+def _remove_trees(paths):
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+# -------------------- Request Metrics & Result History --------------------
+
+
+def pytest_collection_finish(session):
+    session.config.stash[startup_key]["collection_finished_at"] = time.time()
+    profile_dir = session.config.getoption("--profile-client")
+    if profile_dir:
+        from utils.profiling import ClientProfiler
+
+        session.config.stash[profiler_key] = ClientProfiler(profile_dir).start()
+    if session.config.getoption("--batch-matrices"):
+        from utils.batch import MatrixBatcher
+
+        session.config.stash[batcher_key] = MatrixBatcher(session.items)
+
+
+def _record_first_test(config):
+    # Taken when the first test body starts, so fixture setup (logins,
+    # sessions) counts towards the time to the first test.
+    startup = config.stash[startup_key]
+    if "first_test_at" in startup:
+        return
+    startup["first_test_at"] = time.time()
+    logger.info(
+        "Startup: conftest to collected %.0f ms, collected to first test %.0f ms",
+        (startup["collection_finished_at"] - startup["conftest_loaded_at"]) * 1000,
+        (startup["first_test_at"] - startup["collection_finished_at"]) * 1000,
+    )
+    report = config.getoption("--startup-report")
+    if report:
+        with open(report, "w", encoding="utf-8") as f:
+            json.dump(startup, f)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    item.config.stash[metrics_key].current_test = item.nodeid
+    snapshots = item.config.stash.get(snapshot_key, None)
+    if snapshots is not None:
+        snapshots.current_test = item.nodeid
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    # Requests made while a fixture is set up are recorded against it, so the
+    # impact map can attribute them to every test that uses the fixture.
+    recorder = request.config.stash[metrics_key]
+    outer = recorder.current_fixture
+    recorder.current_fixture = fixturedef.argname
+    yield
+    recorder.current_fixture = outer
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    _record_first_test(item.config)
+    item.config.stash[executed_key][item.nodeid] = item.fixturenames
+    batcher = item.config.stash.get(batcher_key, None)
+    if batcher is not None:
+        batcher.before_call(item)
+    outcome = yield
+    if batcher is not None:
+        batcher.after_call(item)
+    attach_request_metrics(
+        item.config.stash[metrics_key].for_test(item.nodeid),
+        slow_ms=item.config.getoption("--slow-ms"),
+    )
+    snapshots = item.config.stash.get(snapshot_key, None)
+    if snapshots is None:
+        return
+    if outcome.excinfo is not None:
+        snapshots.discard(item.nodeid)
+        return
+    problems = snapshots.check(item.nodeid)
+    if problems:
+        from utils.snapshot import SnapshotMismatch
+
+        report = "\n\n".join(problems)
+        allure.attach(report, name="Snapshot diff", attachment_type=allure.attachment_type.TEXT)
+        outcome.force_exception(
+            SnapshotMismatch(
+                f"Responses differ from {item.config.getoption('--snapshot-dir')} "
+                f"(re-record with --snapshot-update):\n{report}"
+            )
+        )
+
+
+def _save_impact_map(config, recorder):
+    from utils.impact import DEFAULT_MAP_PATH, endpoints_by_test, save_map
+
+    tests = endpoints_by_test(recorder.records, config.stash[executed_key])
+    try:
+        save_map(tests, config.getoption("--impact-map") or DEFAULT_MAP_PATH)
+    except OSError as e:
+        logger.warning(f"Failed to save the test endpoint map: {e}")
+
+
+def pytest_sessionfinish(session):
+    """Summarize slow endpoints for Allure and append this run's statistics to the results database."""
+    config = session.config
+    profiler = config.stash.get(profiler_key, None)
+    if profiler is not None:
+        paths = profiler.stop()
+        logger.info(f"Client profile written to {os.path.dirname(paths['cprofile'])}: {sorted(paths)}")
+    recorder = config.stash.get(metrics_key, None)
+    if recorder is None or not recorder.records:
+        return
+    write_performance_summary(
+        getattr(config.option, "allure_report_dir", None),
+        recorder.records,
+        config.getoption("--slow-ms"),
+    )
+    connection_stats = config.stash.get(connection_stats_key, None)
+    if connection_stats is not None:
+        logger.info("Connection reuse per endpoint:\n" + connection_stats.format_report())
+    _save_impact_map(config, recorder)
+    if config.getoption("--no-results-db"):
+        return
+    from utils.results_store import DEFAULT_DB_PATH, ResultStore
+
+    startup = config.stash[startup_key]
+    run_metrics = {}
+    if connection_stats is not None:
+        totals = connection_stats.totals()
+        run_metrics["connections.opened"] = totals.get("connections", 0)
+        run_metrics["connections.tls_handshakes"] = totals.get("tls_handshakes", 0)
+        run_metrics["connections.tls_handshake_ms"] = totals.get("tls_handshake_ms", 0)
+    if "first_test_at" in startup:
+        run_metrics["startup.collection_ms"] = (
+            startup["collection_finished_at"] - startup["conftest_loaded_at"]
+        ) * 1000
+        run_metrics["startup.first_test_ms"] = (
+            startup["first_test_at"] - startup["collection_finished_at"]
+        ) * 1000
+    try:
+        store = ResultStore(config.getoption("--results-db") or DEFAULT_DB_PATH)
+        try:
+            run_id = store.add_run(
+                summarize(recorder.records),
+                base_url=config.stash[environment_key]["base_url"],
+                metrics=run_metrics,
+            )
+        finally:
+            store.close()
+        logger.info(f"Recorded run {run_id} in '{store.path}'")
+    except Exception as e:
+        logger.warning(f"Failed to record run statistics: {e}")
@@ -0,0 +1,152 @@
+import json
+import re
+
+import pytest
+import allure
+import logging
+
+from utils.bench import measure_steady
+from utils.utils import format_duration, parse_duration, parse_storage
+
+logger = logging.getLogger(__name__)
+
+STATISTICS_ENDPOINT = "/api/admin/dashboard/statistics"
+DURATION_FORMAT = re.compile(r"^\d+ hrs \d{1,2} min$")
+STORAGE_FORMAT = re.compile(r"^\d+(\.\d+)? (B|KB|MB|GB|TB)$")
+
+
+def _get_statistics(api_client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = api_client.get(STATISTICS_ENDPOINT, headers=headers)
+    assert response.status_code == 200, f"Statistics failed: {response.text}"
+    return response.json()["data"]
+
+
+def _seed_videos(data_factory, count, duration, storage):
+    """Upload ``count`` published videos with the given duration (s) and storage (bytes).
+
+    Uploads go through the data factory, so they carry the run id and are
+    cleaned up with the session's other test data.
+    """
+    for _ in range(count):
+        data_factory.create_video(
+            "stats seed",
+            duration=str(duration),
+            storage=storage,
+            recordingId=data_factory.recording_id(),
+        )
+
+
+@allure.title("Dashboard Statistics - Valid Admin Token")
+@allure.description(
+    "Fetch video statistics as admin and verify the aggregate fields and their formatting."
+)
+@pytest.mark.order(87)
+def test_dashboard_statistics_success(api_client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = api_client.get(STATISTICS_ENDPOINT, headers=headers)
+    logger.info(response.json())
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert data["message"] == "Video statistics retrieved successfully"
+
+    stats = data["data"]
+    assert isinstance(stats["total_videos"], int)
+    assert stats["total_videos"] >= 0
+    assert DURATION_FORMAT.match(stats["total_duration"]), stats["total_duration"]
+    assert STORAGE_FORMAT.match(stats["total_storage"]), stats["total_storage"]
+
+
+@allure.title("Dashboard Statistics - Missing Auth Token")
+@allure.description("Ensure the statistics endpoint rejects requests without a token.")
+@pytest.mark.order(88)
+def test_dashboard_statistics_missing_auth(api_client):
+    response = api_client.get(STATISTICS_ENDPOINT)
+    logger.info(response.json())
+
+    assert response.status_code == 401
+    data = response.json()
+    assert data["success"] is False
+    assert data["error"] == "Authorization token missing or invalid."
+
+
+@allure.title("Dashboard Statistics - Non-admin Token")
+@allure.description("A regular user's token must not grant access to admin statistics.")
+@pytest.mark.order(89)
+def test_dashboard_statistics_user_token(api_client, auth_token):
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    response = api_client.get(STATISTICS_ENDPOINT, headers=headers)
+    logger.info(response.json())
+
+    assert response.status_code in [401, 403]
+    assert response.json()["success"] is False
+
+
+@allure.title("Dashboard Statistics - Aggregates Match Seeded Videos")
+@allure.description(
+    "Seed videos with known duration and storage and verify total_videos, "
+    "total_duration and total_storage move by exactly the seeded amounts."
+)
+@pytest.mark.order(90)
+@pytest.mark.bulk_upload
+def test_dashboard_statistics_aggregates_after_seeding(
+    api_client, admin_token, data_factory
+):
+    count, duration, storage = 4, 15 * 60, 256 * 1024**2  # 1 hr and 1 GB in total
+    before = _get_statistics(api_client, admin_token)
+    logger.info(f"Statistics before seeding: {before}")
+
+    _seed_videos(data_factory, count, duration, storage)
+
+    after = _get_statistics(api_client, admin_token)
+    logger.info(f"Statistics after seeding: {after}")
+
+    assert after["total_videos"] == before["total_videos"] + count
+    # Seeded durations are whole minutes, so the displayed minutes shift exactly.
+    assert after["total_duration"] == format_duration(
+        parse_duration(before["total_duration"]) + count * duration
+    )
+    assert DURATION_FORMAT.match(after["total_duration"])
+    assert STORAGE_FORMAT.match(after["total_storage"])
+    before_bytes, before_resolution = parse_storage(before["total_storage"])
+    after_bytes, after_resolution = parse_storage(after["total_storage"])
+    assert abs((after_bytes - before_bytes) - count * storage) <= (
+        before_resolution + after_resolution
+    ), f"{before['total_storage']} -> {after['total_storage']}"
+
+
+@allure.title("Dashboard Statistics - Latency vs Dataset Size")
+@allure.description(
+    "Grow the video table in steps and measure statistics latency at each size "
+    "to see whether the aggregate query scales with the number of videos."
+)
+@pytest.mark.order(91)
+@pytest.mark.perf
+@pytest.mark.bulk_upload
+def test_dashboard_statistics_latency_scaling(api_client, admin_token, data_factory):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    curve = []
+    for step in [0, 25, 50, 100]:
+        _seed_videos(data_factory, step, 60, 1024**2)
+        # Steady-state only, so the first step doesn't also pay for cold caches.
+        summary, response = measure_steady(
+            lambda: api_client.get(STATISTICS_ENDPOINT, headers=headers), samples=20
+        )
+        assert response.status_code == 200
+        point = {"total_videos": response.json()["data"]["total_videos"], **summary}
+        logger.info(f"Statistics latency at {point['total_videos']} videos: {point}")
+        curve.append(point)
+
+    allure.attach(
+        json.dumps(curve, indent=2),
+        name="Statistics latency vs total_videos",
+        attachment_type=allure.attachment_type.JSON,
+    )
+    first, last = curve[0], curve[-1]
+    # Other sessions may upload meanwhile, so the table grows by at least the seeds.
+    grown = last["total_videos"] - first["total_videos"]
+    assert grown >= 175
+    slope = (last["p50_ms"] - first["p50_ms"]) / grown * 1000
+    logger.info(f"Statistics p50 grows by {slope:.1f} ms per 1000 videos")
@@ -0,0 +1,265 @@
+import json
+import math
+import os
+
+import pytest
+import allure
+import logging
+
+from utils.load import run_concurrently
+
+logger = logging.getLogger(__name__)
+
+USERS_ENDPOINT = "/api/admin/users"
+TEST_USER_EMAIL = "jaishree9898@gmail.com"
+
+# Users that may be blocked and unblocked; never point this at real accounts.
+TARGET_USER_IDS = [
+    int(i) for i in os.environ.get("VUT_ADMIN_TARGET_USER_IDS", "").split(",") if i
+]
+requires_target_users = pytest.mark.skipif(
+    not TARGET_USER_IDS,
+    reason="set VUT_ADMIN_TARGET_USER_IDS to ids of disposable users",
+)
+
+
+def _list_users(api_client, admin_token, **params):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    return api_client.get(USERS_ENDPOINT, headers=headers, params=params)
+
+
+def _set_status(api_client, admin_token, user_id, status):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    return api_client.patch(
+        f"{USERS_ENDPOINT}/{user_id}", headers=headers, json={"status": status}
+    )
+
+
+def check_page(data, limit, search=None, status=None, start=None, end=None):
+    """Assert one listing page is internally consistent with its filters."""
+    users = data["users"]
+    assert len(users) <= limit
+    assert data["totalPages"] == math.ceil(data["totalCount"] / limit)
+    ids = [u["user_id"] for u in users]
+    assert len(ids) == len(set(ids)), f"Duplicate users on one page: {ids}"
+    for user in users:
+        if search:
+            assert (
+                search.lower() in user["username"].lower()
+                or search.lower() in user["email"].lower()
+            ), user
+        if status:
+            assert user["status"].lower() == status.lower(), user
+        if start:
+            assert user["registeredDate"][:10] >= start, user
+        if end:
+            assert user["registeredDate"][:10] <= end, user
+
+
+@allure.title("Admin Users - Default Pagination")
+@allure.description("List users without query params and verify the default page and limit.")
+@pytest.mark.order(92)
+def test_admin_users_default_pagination(api_client, admin_token):
+    response = _list_users(api_client, admin_token)
+    logger.info(response.json())
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert data["message"] == "Data fetched successfully"
+    assert data["data"]["currentPage"] == 1
+    assert data["data"]["limit"] == 10
+    check_page(data["data"], limit=10)
+
+
+@allure.title("Admin Users - Pagination Params (page=2, limit=5)")
+@allure.description("Verify page and limit query params are honoured.")
+@pytest.mark.order(93)
+def test_admin_users_with_pagination(api_client, admin_token):
+    response = _list_users(api_client, admin_token, page=2, limit=5)
+    logger.info(response.json())
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["currentPage"] == 2
+    assert data["limit"] == 5
+    check_page(data, limit=5)
+
+
+@allure.title("Admin Users - Search by Email")
+@allure.description("Searching by a registered email returns that user.")
+@pytest.mark.order(94)
+def test_admin_users_search(api_client, admin_token):
+    response = _list_users(api_client, admin_token, search=TEST_USER_EMAIL)
+    logger.info(response.json())
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    check_page(data, limit=10, search=TEST_USER_EMAIL)
+    assert TEST_USER_EMAIL in [u["email"] for u in data["users"]]
+
+
+@allure.title("Admin Users - Filter by Status")
+@allure.description("Only users with the requested status are returned.")
+@pytest.mark.order(95)
+def test_admin_users_filter_status(api_client, admin_token):
+    response = _list_users(api_client, admin_token, status="active")
+    logger.info(response.json())
+
+    assert response.status_code == 200
+    check_page(response.json()["data"], limit=10, status="active")
+
+
+@allure.title("Admin Users - Filter by Registration Date Range")
+@allure.description("Only users registered between startDate and endDate are returned.")
+@pytest.mark.order(96)
+def test_admin_users_date_range_filter(api_client, admin_token):
+    start, end = "2025-01-01", "2030-12-31"
+    response = _list_users(api_client, admin_token, startDate=start, endDate=end)
+    logger.info(response.json())
+
+    assert response.status_code == 200
+    check_page(response.json()["data"], limit=10, start=start, end=end)
+
+
+@allure.title("Admin Users - Missing Auth Token")
+@allure.description("Ensure the users listing rejects requests without a token.")
+@pytest.mark.order(97)
+def test_admin_users_missing_auth(api_client):
+    response = api_client.get(USERS_ENDPOINT)
+    logger.info(response.json())
+
+    assert response.status_code == 401
+    assert response.json()["error"] == "Authorization token missing or invalid."
+
+
+@allure.title("Block User - Invalid Status Value")
+@allure.description("PATCH with an unknown status is rejected without changing the user.")
+@pytest.mark.order(98)
+@requires_target_users
+def test_admin_users_update_invalid_status(api_client, admin_token):
+    # A disposable user, in case the backend applies the PATCH anyway.
+    user_id = TARGET_USER_IDS[0]
+
+    response = _set_status(api_client, admin_token, user_id, "not_a_status")
+    logger.info(response.json())
+
+    assert response.status_code == 400
+    data = response.json()
+    assert data["success"] is False
+    assert data["message"] == "Invalid status value provided"
+
+
+@allure.title("Block User - Non-existent User")
+@allure.description("PATCH on an unknown user id returns 404.")
+@pytest.mark.order(99)
+def test_admin_users_update_non_existent_user(api_client, admin_token):
+    response = _set_status(api_client, admin_token, 999999, "inactive")
+    logger.info(response.json())
+
+    assert response.status_code == 404
+    data = response.json()
+    assert data["success"] is False
+    assert data["message"] == "User not found"
+
+
+@allure.title("Block User - Block and Unblock Round Trip")
+@allure.description("Block a disposable user, see it in the listing, then unblock it.")
+@pytest.mark.order(100)
+@requires_target_users
+def test_admin_users_block_unblock(api_client, admin_token):
+    user_id = TARGET_USER_IDS[0]
+    try:
+        response = _set_status(api_client, admin_token, user_id, "inactive")
+        logger.info(response.json())
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"] == {"user_id": user_id, "status": "inactive"}
+
+        listed = _list_users(api_client, admin_token, status="inactive", limit=100)
+        assert user_id in [u["user_id"] for u in listed.json()["data"]["users"]]
+    finally:
+        response = _set_status(api_client, admin_token, user_id, "active")
+        logger.info(response.json())
+    assert response.status_code == 200
+    assert response.json()["data"]["status"] == "active"
+
+
+@allure.title("Admin Users - Listing Under Concurrent Block/Unblock")
+@allure.description(
+    "Paginate large user sets with search, status and date filters while other "
+    "workers block and unblock users; every page must stay consistent."
+)
+@pytest.mark.order(101)
+@pytest.mark.perf
+@requires_target_users
+def test_admin_users_listing_under_concurrent_block_unblock(api_client, admin_token):
+    readers, limit, duration = 4, 50, 30
+    filters = [
+        {},
+        {"status": "active"},
+        {"search": "@"},
+        {"startDate": "2025-01-01", "endDate": "2030-12-31"},
+    ]
+
+    def reader(worker):
+        client = api_client.fork()
+        params = filters[worker % len(filters)]
+
+        def sweep(_):
+            # Walk every page; an unfiltered sweep must not repeat users.
+            seen, page, total_pages = [], 1, 1
+            while page <= total_pages:
+                response = _list_users(
+                    client, admin_token, page=page, limit=limit, **params
+                )
+                assert response.status_code == 200, response.text
+                data = response.json()["data"]
+                check_page(
+                    data,
+                    limit,
+                    search=params.get("search"),
+                    status=params.get("status"),
+                    start=params.get("startDate"),
+                    end=params.get("endDate"),
+                )
+                seen.extend(u["user_id"] for u in data["users"])
+                total_pages = data["totalPages"]
+                page += 1
+            if not params:
+                assert len(seen) == len(set(seen)), "User listed on two pages"
+
+        return sweep
+
+    def writer(user_id):
+        client = api_client.fork()
+
+        def toggle(i):
+            status = "inactive" if i % 2 == 0 else "active"
+            response = _set_status(client, admin_token, user_id, status)
+            assert response.status_code == 200, response.text
+            assert response.json()["data"]["status"] == status
+
+        return toggle
+
+    workers = [("list", reader(w)) for w in range(readers)]
+    workers += [("block/unblock", writer(user_id)) for user_id in TARGET_USER_IDS]
+    try:
+        results = run_concurrently(workers, duration=duration)
+    finally:
+        for user_id in TARGET_USER_IDS:
+            _set_status(api_client, admin_token, user_id, "active")
+
+    summary = {
+        name: {k: v for k, v in result.items() if k not in ("latencies_ms", "errors")}
+        for name, result in results.items()
+    }
+    logger.info(f"Mixed admin load: {summary}")
+    allure.attach(
+        json.dumps(summary, indent=2),
+        name="Admin users mixed load latency",
+        attachment_type=allure.attachment_type.JSON,
+    )
+    for name, result in results.items():
+        assert not result["errors"], f"{name}: {result['errors'][:3]}"
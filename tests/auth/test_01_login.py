@@ -101,6 +101,7 @@ def test_login_failure_invalid_credentials(api_client):
     "Validate API error responses for malformed email or missing fields."
 )
 @pytest.mark.order(4)
+@pytest.mark.batch
 @pytest.mark.parametrize(
     "payload, expected_error, description",
     [
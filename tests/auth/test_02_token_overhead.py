@@ -0,0 +1,96 @@
+import json
+import statistics
+
+import pytest
+import allure
+import logging
+
+from utils.bench import measure_steady
+from utils.server_timing import server_time_ms
+from utils.tokens import token_variants
+
+logger = logging.getLogger(__name__)
+
+ENDPOINTS = ["/api/video/{}", "/api/video/view/v2/{}", "/api/video/list"]
+# An invalid token may cost at most this much more server time than a valid
+# one; more means the backend does real work (user lookup, DB queries) before
+# rejecting. Without Server-Timing the client-side p50 confidence intervals
+# must be this far apart before the test fails.
+REJECTION_MARGIN_MS = 5
+
+
+def _measure_variant(api_client, endpoint, authorization):
+    headers = {"Authorization": authorization} if authorization else {}
+    statuses, server_times = set(), []
+
+    def send():
+        response = api_client.get(endpoint, headers=headers)
+        statuses.add(response.status_code)
+        server_times.append(server_time_ms(response.headers))
+        return response
+
+    summary, response = measure_steady(send, warmup=3, samples=20, max_samples=100)
+    logger.info(response.json())
+    # Same samples as the client-side summary: no warm-up, steady part only.
+    server_times = [ms for ms in server_times[summary["discarded"]:] if ms is not None]
+    return {
+        "statuses": sorted(statuses),
+        "p50_ms": summary["p50_ms"],
+        "p50_ci_ms": summary["p50_ci_ms"],
+        "steady": summary["steady"],
+        "server_p50_ms": statistics.median(server_times) if server_times else None,
+    }
+
+
+@allure.title("Auth - Token Validation Overhead")
+@allure.description(
+    "Compare anonymous, valid, expired, bad-signature and garbage Bearer tokens on the "
+    "same endpoint: the valid-minus-anonymous difference is the JWT verification and "
+    "user lookup cost, and invalid tokens must not cost more than valid ones."
+)
+@pytest.mark.order(118)
+@pytest.mark.perf
+@pytest.mark.parametrize("endpoint_template", ENDPOINTS)
+def test_token_validation_overhead(api_client, auth_token, data_factory, endpoint_template):
+    endpoint = endpoint_template.format(data_factory.video()["video_id"])
+    results = {
+        label: _measure_variant(api_client, endpoint, authorization)
+        for label, authorization in token_variants(auth_token).items()
+    }
+    # Server time when the backend reports it, else the client-side p50.
+    cost = {
+        label: r["server_p50_ms"] if r["server_p50_ms"] is not None else r["p50_ms"]
+        for label, r in results.items()
+    }
+    overhead = {label: cost[label] - cost["anonymous"] for label in results}
+    logger.info(f"{endpoint} cost over anonymous (ms): {overhead}")
+    allure.attach(
+        json.dumps({"results": results, "overhead_vs_anonymous_ms": overhead}, indent=2),
+        name=f"{endpoint_template} token overhead",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    for label, r in results.items():
+        assert all(status < 500 for status in r["statuses"]), f"{label}: {r['statuses']}"
+    assert 200 in results["valid"]["statuses"], results["valid"]
+    valid = results["valid"]
+    for label, r in results.items():
+        if label in ("anonymous", "valid"):
+            continue
+        if r["server_p50_ms"] is not None and valid["server_p50_ms"] is not None:
+            assert r["server_p50_ms"] <= valid["server_p50_ms"] + REJECTION_MARGIN_MS, (
+                f"{endpoint}: {label} token takes {r['server_p50_ms']:.1f} ms on the "
+                f"server, valid {valid['server_p50_ms']:.1f} ms"
+            )
+            continue
+        # Client-side p50s carry network noise: only fail when the 95%
+        # confidence intervals are further apart than the margin.
+        logger.info(
+            f"{endpoint}: no Server-Timing; client p50 {label} {r['p50_ms']:.1f} ms "
+            f"(CI {r['p50_ci_ms']}), valid {valid['p50_ms']:.1f} ms (CI {valid['p50_ci_ms']})"
+        )
+        if r["p50_ci_ms"] and valid["p50_ci_ms"]:
+            assert r["p50_ci_ms"][0] <= valid["p50_ci_ms"][1] + REJECTION_MARGIN_MS, (
+                f"{endpoint}: {label} token p50 CI {r['p50_ci_ms']} ms is above "
+                f"valid {valid['p50_ci_ms']} ms"
+            )
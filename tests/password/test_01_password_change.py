@@ -119,6 +119,7 @@ def test_password_change_mismatch_new_and_current_password(api_client, auth_toke
     "Verify that API returns appropriate error response for each case."
 )
 @pytest.mark.order(14)
+@pytest.mark.batch
 @pytest.mark.parametrize(
     "payload, missing_field",
     [
@@ -206,6 +207,7 @@ def test_password_change_no_auth_token(api_client):
 @allure.title("Change Password - New Password Length Validation")
 @allure.description("Ensure password must be between 8 and 128 characters.")
 @pytest.mark.order(16)
+@pytest.mark.batch
 @pytest.mark.parametrize(
     "new_password, description,message",
     [
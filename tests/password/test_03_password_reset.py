@@ -11,6 +11,7 @@ logger = logging.getLogger(__name__)
     "Covers cases such as missing fields, password length issues, mismatched confirmPassword, and invalid reset token and get respective errors."
 )
 @pytest.mark.order(27)
+@pytest.mark.batch
 @pytest.mark.parametrize(
     "payload, expected_status, expected_error, description",
     [
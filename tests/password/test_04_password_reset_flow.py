@@ -0,0 +1,121 @@
+import json
+import secrets
+import time
+
+import pytest
+import allure
+import logging
+
+from utils.bench import summarize_latencies
+from utils.smtp_sink import extract_reset_token
+
+logger = logging.getLogger(__name__)
+
+# Reset emails only reach a local SMTP sink; these tests skip unless the
+# environment has one (see the smtp_sink fixture and config/settings.py).
+ROUNDS = 10
+
+
+def _temporary_password():
+    return f"Tmp-{secrets.token_hex(4)}@1"
+
+
+def _reset(api_client, token, password):
+    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    payload = {"password": password, "confirmPassword": password}
+    return api_client.post("/api/password/reset", json=payload, headers=headers)
+
+
+def _login(api_client, email, password):
+    return api_client.post("/api/auth/login", json={"email": email, "password": password})
+
+
+def _restore(api_client, reset_token, environment):
+    response = _reset(api_client, reset_token(), environment["user_password"])
+    assert response.status_code == 200, f"Restoring the password failed: {response.text}"
+
+
+@allure.title("Reset Password - Forgot, Reset and Log In")
+@allure.description(
+    "Request a reset link, read the token from the captured email, reset the password "
+    "and log in with the new one; the original password is restored the same way."
+)
+@pytest.mark.order(119)
+def test_password_reset_round_trip(api_client, reset_token, environment):
+    email, password = environment["user_email"], _temporary_password()
+    response = _reset(api_client, reset_token(), password)
+    logger.info(response.json())
+    try:
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["message"] == "Password has been reset successfully"
+
+        response = _login(api_client, email, password)
+        logger.info(response.json())
+        assert response.status_code == 200, f"Login with the new password failed: {response.text}"
+        assert response.json()["success"] is True
+    finally:
+        _restore(api_client, reset_token, environment)
+
+    response = _login(api_client, email, environment["user_password"])
+    logger.info(response.json())
+    assert response.status_code == 200, f"Login after restore failed: {response.text}"
+
+
+@allure.title("Reset Password - Token Is Single Use")
+@allure.description("A reset token from the email works once and is rejected afterwards.")
+@pytest.mark.order(120)
+def test_password_reset_token_single_use(api_client, reset_token, environment):
+    token = reset_token()
+    try:
+        response = _reset(api_client, token, _temporary_password())
+        assert response.status_code == 200, response.text
+
+        response = _reset(api_client, token, _temporary_password())
+        logger.info(response.json())
+        assert response.status_code == 401
+        data = response.json()
+        assert data["success"] is False
+        assert data["message"] == "Invalid or expired token"
+    finally:
+        _restore(api_client, reset_token, environment)
+
+
+@allure.title("Reset Password - Flow Latency at Volume")
+@allure.description(
+    f"Run forgot -> email -> reset {ROUNDS} times and report the latency of the forgot "
+    "call, email delivery to the sink, the reset call and the whole flow."
+)
+@pytest.mark.order(121)
+@pytest.mark.perf
+def test_password_reset_flow_latency(api_client, smtp_sink, environment):
+    email = environment["user_email"]
+    steps = {"forgot_ms": [], "delivery_ms": [], "reset_ms": [], "total_ms": []}
+    # Alternate temporary passwords and end on the original one.
+    passwords = [_temporary_password() for _ in range(ROUNDS - 1)] + [environment["user_password"]]
+    for password in passwords:
+        since = time.time()
+        start = time.perf_counter()
+        response = api_client.post("/api/password/forgot", json={"email": email})
+        forgot_done = time.perf_counter()
+        assert response.status_code == 201, response.text
+        mail = smtp_sink.wait_for(email, since=since)
+        delivered = time.perf_counter()
+        response = _reset(api_client, extract_reset_token(mail["message"]), password)
+        done = time.perf_counter()
+        assert response.status_code == 200, response.text
+        steps["forgot_ms"].append((forgot_done - start) * 1000)
+        # Backends may send the email after responding, so delivery can overlap forgot.
+        steps["delivery_ms"].append(max(0.0, delivered - forgot_done) * 1000)
+        steps["reset_ms"].append((done - delivered) * 1000)
+        steps["total_ms"].append((done - start) * 1000)
+
+    summary = {step: summarize_latencies(values) for step, values in steps.items()}
+    logger.info(f"Password reset flow latency: {summary}")
+    allure.attach(
+        json.dumps(summary, indent=2),
+        name="Password reset flow latency",
+        attachment_type=allure.attachment_type.JSON,
+    )
+    assert len(steps["total_ms"]) == ROUNDS
@@ -0,0 +1,166 @@
+import json
+import os
+import time
+
+import pytest
+import allure
+import logging
+import requests
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# These tests run against the local mock backend through utils.fault_proxy,
+# so they never touch the real service.
+LIST_ENDPOINT = "/api/video/list"
+CHUNK_ENDPOINT = "/api/video/upload-chunk"
+VIDEO_FILE_PATH = "utils/recording.mp4"
+
+try:
+    import httpx
+
+    NETWORK_ERRORS = (requests.exceptions.ConnectionError, httpx.TransportError)
+    TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+except ImportError:
+    NETWORK_ERRORS = (requests.exceptions.ConnectionError,)
+    TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+
+
+@pytest.fixture
+def client(api_client, fault_proxy):
+    return api_client.fork(base_url=fault_proxy.url)
+
+
+@allure.title("Fault Proxy - Passthrough Without Rules")
+@allure.description("Requests not matching any rule are forwarded unchanged.")
+@pytest.mark.order(102)
+def test_fault_proxy_passthrough(client, fault_proxy, mock_server):
+    response = client.get(LIST_ENDPOINT)
+    logger.info(response.json())
+
+    assert response.status_code == 200
+    direct = requests.get(f"{mock_server.url}{LIST_ENDPOINT}")
+    assert response.json() == direct.json()
+    assert fault_proxy.stats["forwarded"] == 1
+
+
+@allure.title("Fault Proxy - Injected Latency and Jitter")
+@allure.description("A latency rule delays only the matching endpoint.")
+@pytest.mark.order(103)
+def test_fault_proxy_latency(client, fault_proxy):
+    fault_proxy.add_rule(method="GET", endpoint=LIST_ENDPOINT, latency_ms=300, jitter_ms=50)
+
+    start = time.perf_counter()
+    response = client.get(LIST_ENDPOINT)
+    slow = time.perf_counter() - start
+    logger.info(response.json())
+
+    start = time.perf_counter()
+    client.get("/api/video/1")
+    fast = time.perf_counter() - start
+
+    assert response.status_code == 200
+    assert slow >= 0.25, f"Expected >= 250 ms, got {slow * 1000:.0f} ms"
+    assert fast < 0.25, f"Unmatched endpoint was delayed: {fast * 1000:.0f} ms"
+
+
+@allure.title("Fault Proxy - Client Timeout")
+@allure.description("A response slower than the client timeout raises a timeout error.")
+@pytest.mark.order(104)
+def test_fault_proxy_client_timeout(client, fault_proxy):
+    fault_proxy.add_rule(endpoint=LIST_ENDPOINT, latency_ms=1000)
+
+    start = time.perf_counter()
+    with pytest.raises(TIMEOUT_ERRORS) as excinfo:
+        client.get(LIST_ENDPOINT, timeout=0.2)
+    elapsed = time.perf_counter() - start
+    logger.info(f"{type(excinfo.value).__name__} after {elapsed * 1000:.0f} ms")
+
+    assert elapsed < 0.9, "Client waited for the response despite its timeout"
+
+
+@allure.title("Fault Proxy - 5xx Burst Surfaces Without Retries")
+@allure.description("With retries disabled (the suite default) every injected 503 reaches the test.")
+@pytest.mark.order(105)
+def test_fault_proxy_error_burst_without_retries(client, fault_proxy):
+    fault_proxy.add_rule(endpoint=LIST_ENDPOINT, error_burst=2, error_status=503)
+
+    statuses = [client.get(LIST_ENDPOINT).status_code for _ in range(3)]
+    logger.info(statuses)
+
+    assert statuses == [503, 503, 200]
+    assert fault_proxy.stats["status_503"] == 2
+
+
+@allure.title("Fault Proxy - Retries Recover From a 5xx Burst")
+@allure.description("A client configured to retry 503s succeeds once the burst is over.")
+@pytest.mark.order(106)
+def test_fault_proxy_retries_recover(client, fault_proxy):
+    if client.transport.name != "requests":
+        pytest.skip("urllib3 Retry policies only apply to the requests backend")
+    retrying = client.fork(
+        max_retries=Retry(
+            total=3, status_forcelist=[503], allowed_methods=None, backoff_factor=0
+        )
+    )
+    fault_proxy.add_rule(endpoint=LIST_ENDPOINT, error_burst=2, error_status=503)
+
+    response = retrying.get(LIST_ENDPOINT)
+    logger.info(response.json())
+
+    assert response.status_code == 200
+    assert fault_proxy.stats["status_503"] == 2
+    assert fault_proxy.stats["forwarded"] == 1
+
+
+@allure.title("Fault Proxy - Connection Reset")
+@allure.description("A reset connection raises a connection error instead of hanging.")
+@pytest.mark.order(107)
+def test_fault_proxy_connection_reset(client, fault_proxy):
+    fault_proxy.add_rule(endpoint=LIST_ENDPOINT, reset_rate=1.0)
+
+    with pytest.raises(NETWORK_ERRORS) as excinfo:
+        client.get(LIST_ENDPOINT, timeout=5)
+    logger.info(type(excinfo.value).__name__)
+
+    assert fault_proxy.stats["reset"] == 1
+    # The next request on a fresh connection goes through again.
+    fault_proxy.clear()
+    assert client.get(LIST_ENDPOINT).status_code == 200
+
+
+@allure.title("Upload Chunk - Degradation Over Slow Links")
+@allure.description(
+    "Upload the same chunk through bandwidth caps and check upload time tracks the cap."
+)
+@pytest.mark.order(108)
+def test_upload_chunk_bandwidth_degradation(client, fault_proxy, recording_id):
+    size = os.path.getsize(VIDEO_FILE_PATH)
+    curve = []
+    for bandwidth in (None, 512 * 1024, 128 * 1024, 64 * 1024):
+        fault_proxy.clear()
+        fault_proxy.add_rule(method="POST", endpoint=CHUNK_ENDPOINT, bandwidth=bandwidth)
+        with open(VIDEO_FILE_PATH, "rb") as file:
+            files = {
+                "recordingId": (None, recording_id),
+                "videoChunks": ("recording.mp4", file, "video/mp4"),
+            }
+            start = time.perf_counter()
+            response = client.post(CHUNK_ENDPOINT, files=files)
+            elapsed = time.perf_counter() - start
+        logger.info(response.json())
+        # The mock answers with the spec's documented 201.
+        assert response.status_code in (200, 201)
+        curve.append({"bandwidth_bps": bandwidth, "elapsed_ms": round(elapsed * 1000, 1)})
+        if bandwidth:
+            # The request body alone needs size / bandwidth seconds.
+            assert elapsed >= 0.8 * size / bandwidth, curve
+
+    logger.info(f"Chunk upload ({size} bytes) vs bandwidth: {curve}")
+    allure.attach(
+        json.dumps(curve, indent=2),
+        name="Upload chunk time vs bandwidth",
+        attachment_type=allure.attachment_type.JSON,
+    )
+    elapsed = [point["elapsed_ms"] for point in curve]
+    assert elapsed == sorted(elapsed), f"Upload time should grow as bandwidth drops: {curve}"
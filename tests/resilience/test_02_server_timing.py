@@ -0,0 +1,30 @@
+import pytest
+import allure
+import logging
+
+from utils.server_timing import split_latency
+
+logger = logging.getLogger(__name__)
+
+LIST_ENDPOINT = "/api/video/list"
+
+
+@allure.title("Server Timing - Link Latency Counts as Network Time")
+@allure.description(
+    "Latency injected between client and server must show up as network time, "
+    "not server time, when the latency is split using the Server-Timing header."
+)
+@pytest.mark.order(116)
+def test_server_timing_attributes_link_latency_to_network(api_client, fault_proxy):
+    client = api_client.fork(base_url=fault_proxy.url)
+    fault_proxy.add_rule(endpoint=LIST_ENDPOINT, latency_ms=200)
+
+    response = client.get(LIST_ENDPOINT)
+    logger.info(response.json())
+    ttfb_ms, server_ms, network_ms = split_latency(response, 0)
+    logger.info(f"ttfb={ttfb_ms:.1f}ms server={server_ms:.1f}ms network={network_ms:.1f}ms")
+
+    assert response.status_code == 200
+    assert "Server-Timing" in response.headers
+    assert server_ms < 50
+    assert network_ms >= 180
@@ -0,0 +1,136 @@
+import json
+import statistics
+import time
+
+import pytest
+import allure
+import logging
+
+from utils.allure_perf import size_curve_svg
+from utils.payloads import SHAPES, SIZES
+from utils.server_timing import server_time_ms
+from utils.transport import transport_errors
+
+logger = logging.getLogger(__name__)
+
+SAMPLES = 3
+# A rejected 4 MiB body may cost the server at most this much more than a
+# rejected 1 KiB one; more means it parsed the body before refusing it.
+MAX_PARSE_OVERHEAD_MS = 50
+# Every sweep starts above the field limits in utils/api.json, so all sizes
+# must be refused.
+ENDPOINTS = {
+    "upload": ("/api/video/upload", "description", True),
+    "change": ("/api/password/change", "newPassword", True),
+    "reset": ("/api/password/reset", "password", True),
+    "forgot": ("/api/password/forgot", "email", False),
+}
+
+
+def _base_payload(name, data_factory):
+    if name == "upload":
+        return data_factory.video_payload("payload size")
+    if name == "change":
+        # Wrong current password, so nothing changes even if a body got through.
+        return {
+            "currentPassword": "NotTheCurrent@123",
+            "newPassword": "NewPassword@123",
+            "confirmPassword": "NewPassword@123",
+        }
+    if name == "reset":
+        return {"password": "Password@123", "confirmPassword": "Password@123"}
+    return {"email": "payload.size@example.com"}
+
+
+def _measure_point(api_client, endpoint, headers, body):
+    """Send ``body`` once to warm up, then SAMPLES times; returns the curve point."""
+    statuses, latencies, server_times = [], [], []
+    for i in range(SAMPLES + 1):
+        start = time.perf_counter()
+        try:
+            response = api_client.post(endpoint, data=body, headers=headers)
+        except transport_errors() as e:
+            # Refusing a large body by closing the connection counts as a rejection.
+            status, server_ms = type(e).__name__, None
+        else:
+            status, server_ms = response.status_code, server_time_ms(response.headers)
+            logger.info(response.text[:200])
+        if i:
+            statuses.append(status)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if server_ms is not None:
+                server_times.append(server_ms)
+    return {
+        "size_bytes": len(body),
+        "statuses": sorted(set(statuses), key=str),
+        "p50_ms": statistics.median(latencies),
+        "server_p50_ms": statistics.median(server_times) if server_times else None,
+    }
+
+
+@allure.title("Payload Size - Rejection Latency Curves")
+@allure.description(
+    "Sweep body sizes from 1 KiB to 4 MiB with long declared fields, huge unknown "
+    "fields and deeply nested JSON; every size must be rejected with a 4xx and the "
+    "server time to reject must not grow with the body."
+)
+@pytest.mark.order(117)
+@pytest.mark.perf
+@pytest.mark.parametrize(
+    "name",
+    # A body that got through the upload sweep would create a video per sample.
+    [
+        pytest.param(name, marks=pytest.mark.bulk_upload) if name == "upload" else name
+        for name in ENDPOINTS
+    ],
+)
+def test_payload_size_rejection_curve(api_client, auth_token, data_factory, name):
+    endpoint, field, needs_auth = ENDPOINTS[name]
+    headers = {"Content-Type": "application/json"}
+    if needs_auth:
+        headers["Authorization"] = f"Bearer {auth_token}"
+    payload = _base_payload(name, data_factory)
+
+    points = []
+    for shape, build in SHAPES.items():
+        for size in SIZES:
+            body = build(payload, field, size)
+            point = {"shape": shape, **_measure_point(api_client, endpoint, headers, body)}
+            logger.info(f"{endpoint} {shape} {point['size_bytes']} B: {point}")
+            points.append(point)
+
+    curves = {}
+    for point in points:
+        curves.setdefault(f"{point['shape']} total", []).append(
+            (point["size_bytes"], point["p50_ms"])
+        )
+        if point["server_p50_ms"] is not None:
+            curves.setdefault(f"{point['shape']} server", []).append(
+                (point["size_bytes"], point["server_p50_ms"])
+            )
+    allure.attach(
+        json.dumps(points, indent=2),
+        name=f"{endpoint} size/latency",
+        attachment_type=allure.attachment_type.JSON,
+    )
+    allure.attach(
+        size_curve_svg(curves),
+        name=f"{endpoint} latency vs body size",
+        attachment_type=allure.attachment_type.SVG,
+    )
+
+    accepted = [
+        p
+        for p in points
+        if any(isinstance(s, int) and not 400 <= s < 500 for s in p["statuses"])
+    ]
+    assert not accepted, f"Oversized bodies not rejected with 4xx: {accepted}"
+    for shape in SHAPES:
+        server = [p["server_p50_ms"] for p in points if p["shape"] == shape]
+        if None in (server[0], server[-1]):
+            logger.info(f"{endpoint} {shape}: no server timing header, total latency only")
+            continue
+        assert server[-1] - server[0] <= MAX_PARSE_OVERHEAD_MS, (
+            f"{endpoint} {shape}: rejecting {SIZES[-1]} B took {server[-1]:.0f} ms server "
+            f"time vs {server[0]:.0f} ms for {SIZES[0]} B"
+        )
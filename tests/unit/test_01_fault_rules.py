@@ -0,0 +1,44 @@
+import pytest
+import allure
+import logging
+
+from utils.fault_proxy import parse_rule
+
+logger = logging.getLogger(__name__)
+
+
+@allure.title("Fault Proxy - Documented Rules Parse")
+@allure.description(
+    "The --rule examples in the utils.fault_proxy docstring parse into FaultRules, "
+    "with latency/jitter accepted as short names for latency_ms/jitter_ms."
+)
+@pytest.mark.order(122)
+def test_parse_rule_documented_examples():
+    rule = parse_rule("POST /api/video/upload-chunk latency=200 bandwidth=65536")
+    logger.info(vars(rule))
+    assert rule.method == "POST"
+    assert rule.endpoint == "/api/video/upload-chunk"
+    assert rule.latency_ms == 200
+    assert rule.bandwidth == 65536
+
+    rule = parse_rule("GET /api/video/{id} error_rate=0.2 error_status=502")
+    logger.info(vars(rule))
+    assert rule.method == "GET"
+    assert rule.error_rate == 0.2
+    assert rule.error_status == 502
+
+
+@allure.title("Fault Proxy - Rule Defaults and Aliases")
+@allure.description("Method and endpoint are optional and jitter maps to jitter_ms.")
+@pytest.mark.order(123)
+def test_parse_rule_optional_parts_and_aliases():
+    rule = parse_rule("/api/video/list latency_ms=50 jitter=10")
+    logger.info(vars(rule))
+    assert rule.method is None
+    assert rule.endpoint == "/api/video/list"
+    assert rule.latency_ms == 50
+    assert rule.jitter_ms == 10
+
+    rule = parse_rule("* * reset_rate=1.0")
+    assert rule.method is None and rule.endpoint is None
+    assert rule.reset_rate == 1.0
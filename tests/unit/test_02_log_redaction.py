@@ -0,0 +1,153 @@
+import json
+import queue
+
+import pytest
+import allure
+import logging
+
+from utils.log import (
+    ConsoleFormatter,
+    DeferredQueueHandler,
+    JsonLinesFormatter,
+    REDACTED,
+    redact,
+)
+
+logger = logging.getLogger(__name__)
+
+LOGIN_BODY = {
+    "success": True,
+    "data": {
+        "accessToken": "eyJhbGciOi.secret",
+        "refresh_token": "r-123",
+        "tokenType": "Bearer",
+        "user": {"email": "user@example.com", "confirmPassword": "Admin@123"},
+    },
+    "videos": [{"unique_video_key": "abc123", "keywords": ["demo"], "x-api-key": "k"}],
+}
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _pipeline(body_sample_rate=1.0):
+    """Isolated logger: queue handler first, then a handler standing in for pytest's."""
+    records = queue.SimpleQueue()
+    capture = _Capture()
+    pipeline = logging.getLogger(f"{__name__}.pipeline.{body_sample_rate}")
+    pipeline.handlers[:] = [DeferredQueueHandler(records, body_sample_rate), capture]
+    pipeline.propagate = False
+    pipeline.setLevel(logging.INFO)
+    return pipeline, records, capture
+
+
+def _drain(records):
+    items = []
+    while not records.empty():
+        items.append(records.get())
+    return items
+
+
+@allure.title("Logging - Sensitive Keys Are Masked by Name")
+@allure.description(
+    "Tokens, passwords and API keys are masked; keys that merely contain "
+    "'key' or 'token', such as unique_video_key, keywords or tokenType, are not."
+)
+@pytest.mark.order(124)
+def test_redact_masks_whole_sensitive_key_names():
+    body = redact(LOGIN_BODY)
+    logger.info(body)
+    data = body["data"]
+    assert data["accessToken"] == REDACTED
+    assert data["refresh_token"] == REDACTED
+    assert data["user"]["confirmPassword"] == REDACTED
+    assert body["videos"][0]["x-api-key"] == REDACTED
+    assert data["tokenType"] == "Bearer"
+    assert data["user"]["email"] == "user@example.com"
+    assert body["videos"][0]["unique_video_key"] == "abc123"
+    assert body["videos"][0]["keywords"] == ["demo"]
+    assert LOGIN_BODY["data"]["accessToken"] == "eyJhbGciOi.secret"
+    assert body["videos"][0]["keywords"] is LOGIN_BODY["videos"][0]["keywords"]
+
+    clean = {"data": [{"video_id": 1, "title": "demo"}]}
+    assert redact(clean) is clean
+
+
+@allure.title("Logging - Bodies Are Redacted Off the Test Thread")
+@allure.description(
+    "The queue handler enqueues dict and JSON text bodies (response.text) "
+    "unparsed; the listener's formatters redact them, and the handlers after "
+    "the queue handler only ever render the redacted text."
+)
+@pytest.mark.order(125)
+def test_queue_handler_defers_redaction():
+    pipeline, records, capture = _pipeline()
+    pipeline.info(LOGIN_BODY)
+    text = json.dumps(LOGIN_BODY)
+    pipeline.info(text)
+    pipeline.info("plain %s", "message")
+
+    queued = _drain(records)
+    assert len(queued) == 3
+    assert queued == capture.records
+    assert queued[0].msg.raw is LOGIN_BODY
+    assert queued[1].msg.raw is text
+
+    json_lines, console = JsonLinesFormatter(), ConsoleFormatter()
+    for record in queued[:2]:
+        entry = json.loads(json_lines.format(record))
+        logger.info(entry)
+        assert entry["body"]["data"]["accessToken"] == REDACTED
+        assert "eyJhbGciOi" not in console.format(record)
+        assert "eyJhbGciOi" not in record.getMessage()
+    assert json.loads(json_lines.format(queued[2]))["msg"] == "plain message"
+    assert queued[2].getMessage() == "plain message"
+
+
+@allure.title("Logging - Long Bodies and Text Are Truncated")
+@allure.description("The JSON-lines formatter caps bodies and long text at max_body characters.")
+@pytest.mark.order(126)
+def test_json_lines_formatter_truncates_long_messages():
+    pipeline, records, _ = _pipeline()
+    pipeline.info({"rows": [{"id": i, "title": f"video {i}"} for i in range(500)]})
+    pipeline.info("x" * 500)
+    pipeline.info({"id": 1})
+    formatter = JsonLinesFormatter(max_body=100)
+
+    big, text, small = (json.loads(formatter.format(r)) for r in _drain(records))
+    logger.info(big)
+    assert "body" not in big
+    assert big["body_truncated"].startswith('{"rows":[')
+    assert big["body_truncated"].endswith("... [truncated]")
+    assert text["msg"] == "x" * 100 + "... [500 chars]"
+    assert small["body"] == {"id": 1}
+
+
+@allure.title("Logging - Body Sampling Drops Bodies but Keeps Messages")
+@allure.description(
+    "With body_sample_rate=0 no body reaches the queue while text messages do; "
+    "dropped bodies still render redacted for the handlers after the queue handler."
+)
+@pytest.mark.order(127)
+def test_body_sampling_drops_bodies_only():
+    pipeline, records, capture = _pipeline(body_sample_rate=0.0)
+    for _ in range(20):
+        pipeline.info(LOGIN_BODY)
+    pipeline.info("status %d", 200)
+
+    queued = _drain(records)
+    logger.info([r.getMessage() for r in queued])
+    assert [r.getMessage() for r in queued] == ["status 200"]
+    assert len(capture.records) == 21
+    assert all("eyJhbGciOi" not in r.getMessage() for r in capture.records[:20])
+
+    pipeline, records, _ = _pipeline(body_sample_rate=1.0)
+    for _ in range(20):
+        pipeline.info(LOGIN_BODY)
+    assert len(_drain(records)) == 20
@@ -0,0 +1,58 @@
+import pytest
+import allure
+import logging
+
+from utils.snapshot import MASK, normalize, shape, structural_hash
+
+logger = logging.getLogger(__name__)
+
+
+def _video(video_id, description="demo", tags=None, updated_at="2026-01-01T00:00:00Z"):
+    return {
+        "id": video_id,
+        "title": f"video {video_id}",
+        "description": description,
+        "tags": tags,
+        "updatedAt": updated_at,
+    }
+
+
+@allure.title("Snapshot - Volatile Keys Are Masked Even When Null")
+@allure.description(
+    "Ids, timestamps and tokens are masked whatever their value, so a null "
+    "updatedAt and a real one normalize to the same body."
+)
+@pytest.mark.order(128)
+def test_normalize_masks_volatile_keys_regardless_of_value():
+    with_time = normalize(_video(1))
+    without_time = normalize(_video(1, updated_at=None))
+    logger.info(with_time)
+    assert with_time["id"] == MASK
+    assert with_time["updatedAt"] == MASK
+    assert without_time == with_time
+    assert with_time["title"] == "video 1"
+
+
+@allure.title("Snapshot - List Items Merge Into One Shape")
+@allure.description(
+    "A listing keeps its shape whatever the row count and when some rows have "
+    "nulls where others have values; a real type change still changes the hash."
+)
+@pytest.mark.order(129)
+def test_list_item_shapes_merge_with_null_as_wildcard():
+    def body(rows):
+        return normalize({"success": True, "data": rows})
+
+    one = body([_video(1, tags=["a"])])
+    many = body([_video(1, tags=None), _video(2, description=None, tags=["b"]), _video(3)])
+    logger.info(shape(many))
+    assert shape(many)["data"] == ["list", shape(one)["data"][1]]
+    assert structural_hash(one) == structural_hash(many)
+
+    changed = body([_video(1, tags=["a"]), {**_video(2), "description": 7}])
+    logger.info(shape(changed))
+    assert shape(changed)["data"][1]["description"] == "int|str"
+    assert structural_hash(changed) != structural_hash(one)
+
+    assert shape(body([])) == {"success": True, "data": ["list"]}
+    assert structural_hash(body([])) != structural_hash(one)
@@ -0,0 +1,79 @@
+import pytest
+import allure
+import logging
+
+from utils.impact import endpoints_by_test, module_closure, select_tests
+
+logger = logging.getLogger(__name__)
+
+FAULTS = "tests/resilience/test_01_fault_injection.py::test_fault_proxy_latency"
+LISTING = "tests/videos/test_01_list_videos.py::test_list_videos"
+NODEIDS = [FAULTS, LISTING]
+KNOWN = {FAULTS: ["GET /api/video/list"], LISTING: ["GET /api/video/list"]}
+FIXTURES = {
+    FAULTS: ["client", "fault_proxy", "mock_server", "api_client", "environment"],
+    LISTING: ["api_client", "auth_token", "environment"],
+}
+
+
+@allure.title("Impact - Lazily Imported Helpers Are Not Shared Code")
+@allure.description(
+    "Only conftest.py's top-level imports count as shared; helpers its "
+    "fixtures import inside their bodies do not."
+)
+@pytest.mark.order(130)
+def test_shared_closure_is_conftest_top_level_imports():
+    shared = module_closure("conftest.py", top_level=True)
+    logger.info(sorted(shared))
+    assert "utils.log" in shared
+    assert "utils.fault_proxy" not in shared
+    assert "utils.mock_server" not in shared
+    assert "utils.fault_proxy" in module_closure("conftest.py")
+
+
+@allure.title("Impact - Helper-Only Change Selects a Subset")
+@allure.description(
+    "Changing a helper used by one fixture selects only the tests using that "
+    "fixture; a helper behind api_client selects both; shared code selects all."
+)
+@pytest.mark.order(131)
+def test_helper_change_selects_fixture_users_only():
+    selected, reason = select_tests({"utils/fault_proxy.py"}, NODEIDS, KNOWN, fixtures=FIXTURES)
+    logger.info(selected)
+    assert reason is None
+    assert selected == [FAULTS]
+
+    selected, _ = select_tests({"utils/smtp_sink.py"}, NODEIDS, KNOWN, fixtures=FIXTURES)
+    assert selected == []
+
+    selected, _ = select_tests({"utils/transport.py"}, NODEIDS, KNOWN, fixtures=FIXTURES)
+    assert selected == NODEIDS
+
+    selected, reason = select_tests({"utils/log.py"}, NODEIDS, KNOWN, fixtures=FIXTURES)
+    logger.info(reason)
+    assert selected is None
+    assert "utils.log" in reason
+
+
+@allure.title("Impact - Fixture Requests Count for Every Test Using the Fixture")
+@allure.description(
+    "A login made while setting up auth_token maps to every test that uses "
+    "auth_token, not only the test whose setup triggered it."
+)
+@pytest.mark.order(135)
+def test_fixture_requests_map_to_every_fixture_user():
+    login = {"method": "POST", "endpoint": "/api/auth/login"}
+    listing = {"method": "GET", "endpoint": "/api/video/list"}
+    records = [
+        {"test": LISTING, "fixture": "auth_token", **login},
+        {"test": LISTING, "fixture": None, **listing},
+        {"test": FAULTS, "fixture": None, **listing},
+    ]
+    second = "tests/videos/test_01_list_videos.py::test_list_videos_paginated"
+    fixtures = {**FIXTURES, second: ["api_client", "auth_token", "environment"]}
+
+    tests = endpoints_by_test(records, fixtures)
+    logger.info(tests)
+    assert tests[LISTING] == {"POST /api/auth/login", "GET /api/video/list"}
+    assert tests[second] == {"POST /api/auth/login"}
+    assert tests[FAULTS] == {"GET /api/video/list"}
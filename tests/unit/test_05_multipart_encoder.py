@@ -0,0 +1,118 @@
+import io
+import os
+
+import pytest
+import allure
+import logging
+import requests
+
+from utils.multipart import MultipartEncoder
+
+logger = logging.getLogger(__name__)
+
+BOUNDARY = "vut-test-boundary"
+CHUNK = os.urandom(200 * 1024)
+
+
+def _requests_body(files):
+    request = requests.Request("POST", "http://localhost/", files=files).prepare()
+    boundary = request.headers["Content-Type"].split("boundary=")[1]
+    return request.body.replace(boundary.encode(), BOUNDARY.encode())
+
+
+def _encoded(files):
+    encoder = MultipartEncoder(files, boundary=BOUNDARY, chunk_size=16 * 1024)
+    body = b"".join(bytes(chunk) for chunk in iter(lambda: encoder.read(), b""))
+    assert len(body) == len(encoder)
+    return body
+
+
+@allure.title("Multipart Encoder - Same Bytes as requests")
+@allure.description(
+    "Form fields, in-memory and file-backed parts (with content type and extra "
+    "headers) encode to the exact body requests builds for the same files."
+)
+@pytest.mark.order(132)
+def test_multipart_body_matches_requests(tmp_path):
+    path = tmp_path / "chunk.mp4"
+    path.write_bytes(CHUNK)
+
+    def files(handle):
+        return {
+            "recordingId": (None, "session_1"),
+            "chunkIndex": (None, "3"),
+            "videoChunks": ("chunk.mp4", handle, "video/mp4", {"X-Chunk": "3"}),
+            "note": ("note.txt", b"hello", "text/plain"),
+        }
+
+    with open(path, "rb") as a, open(path, "rb") as b:
+        expected, actual = _requests_body(files(a)), _encoded(files(b))
+    logger.info(f"{len(actual)} bytes")
+    assert actual == expected
+
+
+@allure.title("Multipart Encoder - Bare Values Get a Filename")
+@allure.description(
+    "A value that is not a tuple gets filename set to its file's name or the "
+    "field name, as requests does; None values are left out."
+)
+@pytest.mark.order(133)
+def test_multipart_bare_values_match_requests(tmp_path):
+    path = tmp_path / "upload.bin"
+    path.write_bytes(b"\x00\x01binary")
+
+    with open(path, "rb") as a, open(path, "rb") as b:
+        expected = _requests_body({"a": "x", "b": b"raw", "file": a, "skip": None})
+        actual = _encoded({"a": "x", "b": b"raw", "file": b, "skip": None})
+    logger.info(actual[:200])
+    assert actual == expected
+    assert b'name="a"; filename="a"' in actual
+    assert b'name="file"; filename="upload.bin"' in actual
+    assert b'name="skip"' not in actual
+
+
+@allure.title("Multipart Encoder - Body Can Be Rewound")
+@allure.description(
+    "After a full read, seek(0) and iteration produce the same body again so "
+    "redirects and retries do not send an empty body; other seeks are refused."
+)
+@pytest.mark.order(134)
+def test_multipart_body_rewinds():
+    encoder = MultipartEncoder(
+        {"videoChunks": ("chunk.mp4", io.BytesIO(CHUNK), "video/mp4")}, boundary=BOUNDARY
+    )
+    first = b"".join(bytes(chunk) for chunk in iter(encoder.read, b""))
+    assert encoder.tell() == len(encoder) == len(first)
+    assert encoder.read() == b""
+
+    assert encoder.seek(0) == 0
+    assert encoder.tell() == 0
+    assert b"".join(bytes(chunk) for chunk in iter(encoder.read, b"")) == first
+    assert b"".join(encoder) == first
+    assert b"".join(encoder) == first
+
+    with pytest.raises(io.UnsupportedOperation):
+        encoder.seek(10)
+
+
+@allure.title("Multipart Encoder - Zero-Size Reads Keep the Position")
+@allure.description(
+    "read(0) returns nothing and moves nowhere, including in the middle of a "
+    "file part, so the rest of the body is still sent."
+)
+@pytest.mark.order(136)
+def test_multipart_read_zero_keeps_position():
+    files = {"videoChunks": ("chunk.mp4", io.BytesIO(CHUNK), "video/mp4")}
+    expected = _encoded(files)
+    files["videoChunks"][1].seek(0)
+    encoder = MultipartEncoder(files, boundary=BOUNDARY, chunk_size=16 * 1024)
+
+    body = []
+    while True:
+        assert encoder.read(0) == b""
+        chunk = encoder.read(1000)
+        if not chunk:
+            break
+        body.append(bytes(chunk))
+    logger.info(f"{len(body)} reads, {encoder.tell()} bytes")
+    assert b"".join(body) == expected
@@ -1,7 +1,11 @@
+from datetime import datetime
+
 import pytest
 import allure
 import logging
 
+from utils.factory import created_at
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,9 +66,9 @@ def test_video_list_filter_status(api_client, auth_token):
     "Verify that the API returns only the video matching the specified video_id."
 )
 @pytest.mark.order(32)
-def test_video_list_filter_video_id(api_client, auth_token):
+def test_video_list_filter_video_id(api_client, auth_token, data_factory):
     headers = {"Authorization": f"Bearer {auth_token}"}
-    test_video_id = 26
+    test_video_id = data_factory.video()["video_id"]
     response = api_client.get(
         f"/api/video/list?video_id={test_video_id}", headers=headers
     )
@@ -72,6 +76,7 @@ def test_video_list_filter_video_id(api_client, auth_token):
 
     assert response.status_code == 200
     data = response.json()
+    assert data["data"], f"Video {test_video_id} not listed"
     for video in data["data"]:
         assert video["video_id"] == test_video_id
 
@@ -79,15 +84,16 @@ def test_video_list_filter_video_id(api_client, auth_token):
 @allure.title("List Videos - Search by Title")
 @allure.description("Verify that the API supports searching videos by title.")
 @pytest.mark.order(33)
-def test_video_list_search(api_client, auth_token):
+def test_video_list_search(api_client, auth_token, data_factory):
     headers = {"Authorization": f"Bearer {auth_token}"}
-    response = api_client.get(f"/api/video/list?search=My Test Video", headers=headers)
+    title = data_factory.video()["title"]
+    response = api_client.get("/api/video/list", headers=headers, params={"search": title})
     logger.info(response.json())
 
     assert response.status_code == 200
     data = response.json()
     video_data = data["data"]
-    assert video_data[0]["title"] == "My Test Video"
+    assert video_data[0]["title"] == title
 
 
 @allure.title("List Videos - Filter by Created Date Range")
@@ -95,20 +101,23 @@ def test_video_list_search(api_client, auth_token):
     "Verify that the API filters videos by created_from and created_to timestamp range."
 )
 @pytest.mark.order(34)
-def test_video_list_date_range_filter(api_client, auth_token):
+def test_video_list_date_range_filter(api_client, auth_token, data_factory):
     headers = {"Authorization": f"Bearer {auth_token}"}
-    # These timestamps need to be updated based on actual test data
-    from_ts = "2025-08-19"  # e.g. '2025-08-20T04:57:00+00:00'
-    to_ts = "2025-08-17"  # e.g. '2025-08-20T05:57:00+00:00'
+    video = data_factory.video()
+    from_ts, to_ts = data_factory.created_window(video)
     response = api_client.get(
-        f"/api/video/list?created_from={from_ts}&created_to={to_ts}", headers=headers
+        "/api/video/list",
+        headers=headers,
+        params={"created_from": from_ts, "created_to": to_ts},
     )
     logger.info(response.json())
 
     assert response.status_code == 200
     data = response.json()
-    for video in data["data"]:
-        assert from_ts <= video["created_date"] <= to_ts
+    assert video["video_id"] in [v["video_id"] for v in data["data"]]
+    created_from, created_to = datetime.fromisoformat(from_ts), datetime.fromisoformat(to_ts)
+    for listed in data["data"]:
+        assert created_from <= created_at(listed) <= created_to
 
 
 @allure.title("List Videos - Filter by Views Range")
@@ -8,17 +8,17 @@ logger = logging.getLogger(__name__)
 @allure.title("Upload Videos - Required fields only.")
 @allure.description("Uploads the video with only the required arguments.")
 @pytest.mark.order(36)
-def test_video_upload_req_fields(api_client, auth_token):
+def test_video_upload_req_fields(api_client, auth_token, data_factory):
     logger.info("Uploading video with only req fields")
     headers = {"Authorization": f"Bearer {auth_token}"}
     payload = {
-        "title": "My Test Video today",  #
+        "title": data_factory.title("required fields"),  #
         "description": "This is a test video upload.",
         "duration": "20",  #
         "thumbnail_img": "https://example.com/thumb.jpg",  #
         "status": "published",
         "storage": 300,
-        "recordingId": "session_1755667366645",  #
+        "recordingId": data_factory.recording_id(),  #
     }
 
     response = api_client.post("/api/video/upload", headers=headers, json=payload)
@@ -30,12 +30,13 @@ def test_video_upload_req_fields(api_client, auth_token):
     assert data["data"]["title"] == payload["title"]
     assert data["data"]["description"] == payload["description"]
     assert data["data"]["status"] == "published"
+    data_factory.track(data["data"])
 
 
 @allure.title("Upload Videos - Missing 'title'")
 @allure.description("Attempts to upload a video without providing a title.")
 @pytest.mark.order(37)
-def test_video_upload_missing_title(api_client, auth_token):
+def test_video_upload_missing_title(api_client, auth_token, data_factory):
     logger.info("Uploading video with missing 'title'")
     headers = {"Authorization": f"Bearer {auth_token}"}
     payload = {
@@ -44,7 +45,7 @@ def test_video_upload_missing_title(api_client, auth_token):
         "thumbnail_img": "https://example.com/thumb.jpg",
         "status": "published",
         "storage": 300,
-        "recordingId": "session_1755667366645",
+        "recordingId": data_factory.recording_id(),
     }
 
     response = api_client.post("/api/video/upload", headers=headers, json=payload)
@@ -59,16 +60,16 @@ def test_video_upload_missing_title(api_client, auth_token):
 @allure.title("Upload Videos - Missing 'thumbnail_image'")
 @allure.description("Attempts to upload a video without providing a thumbnail image.")
 @pytest.mark.order(38)
-def test_video_upload_missing_thumbnail_img(api_client, auth_token):
+def test_video_upload_missing_thumbnail_img(api_client, auth_token, data_factory):
     logger.info("Uploading video with missing 'title'")
     headers = {"Authorization": f"Bearer {auth_token}"}
     payload = {
-        "title": "My Test Video",
+        "title": data_factory.title("upload validation"),
         "description": "Test video with no title.",
         "duration": "20",
         "status": "published",
         "storage": 300,
-        "recordingId": "session_1755667366645",
+        "recordingId": data_factory.recording_id(),
     }
 
     response = api_client.post("/api/video/upload", headers=headers, json=payload)
@@ -83,11 +84,11 @@ def test_video_upload_missing_thumbnail_img(api_client, auth_token):
 @allure.title("Upload Videos - Missing 'recording_id'")
 @allure.description("Attempts to upload a video without providing a recording id.")
 @pytest.mark.order(39)
-def test_video_upload_missing_recording_id(api_client, auth_token):
+def test_video_upload_missing_recording_id(api_client, auth_token, data_factory):
     logger.info("Uploading video with missing 'title'")
     headers = {"Authorization": f"Bearer {auth_token}"}
     payload = {
-        "title": "My Test Video",
+        "title": data_factory.title("upload validation"),
         "thumbnail_img": "https://example.com/thumb.jpg",
         "description": "Test video with no title.",
         "duration": "20",
@@ -107,7 +108,7 @@ def test_video_upload_missing_recording_id(api_client, auth_token):
 @allure.title("Upload Videos - Invalid 'duration'")
 @allure.description("Uploads the video with negative duration.")
 @pytest.mark.order(40)
-def test_video_upload_invalid_duration(api_client, auth_token):
+def test_video_upload_invalid_duration(api_client, auth_token, data_factory):
     logger.info("Uploading video with invalid duration")
     headers = {"Authorization": f"Bearer {auth_token}"}
     payload = {
@@ -117,7 +118,7 @@ def test_video_upload_invalid_duration(api_client, auth_token):
         "thumbnail_img": "https://example.com/thumb.jpg",
         "status": "published",
         "storage": 300,
-        "recordingId": "session_1755667366645",
+        "recordingId": data_factory.recording_id(),
     }
 
     response = api_client.post("/api/video/upload", headers=headers, json=payload)
@@ -132,7 +133,7 @@ def test_video_upload_invalid_duration(api_client, auth_token):
 @allure.title("Upload Videos - Invalid 'status'")
 @allure.description("Uploads video with an invalid status value.")
 @pytest.mark.order(41)
-def test_video_upload_invalid_status(api_client, auth_token):
+def test_video_upload_invalid_status(api_client, auth_token, data_factory):
     logger.info("Uploading video with invalid status")
     headers = {"Authorization": f"Bearer {auth_token}"}
     payload = {
@@ -142,7 +143,7 @@ def test_video_upload_invalid_status(api_client, auth_token):
         "thumbnail_img": "https://example.com/thumb.jpg",
         "status": "in_progress",  # Invalid if only "published" or "completed" allowed
         "storage": 300,
-        "recordingId": "session_1755667366645",
+        "recordingId": data_factory.recording_id(),
     }
 
     response = api_client.post("/api/video/upload", headers=headers, json=payload)
@@ -157,7 +158,7 @@ def test_video_upload_invalid_status(api_client, auth_token):
 @allure.title("Upload Videos - Invalid 'thumbnail_img' URL")
 @allure.description("Uploads video with an invalid thumbnail image URL.")
 @pytest.mark.order(42)
-def test_video_upload_invalid_thumbnail_url(api_client, auth_token):
+def test_video_upload_invalid_thumbnail_url(api_client, auth_token, data_factory):
     logger.info("Uploading video with invalid thumbnail URL")
     headers = {"Authorization": f"Bearer {auth_token}"}
     payload = {
@@ -167,7 +168,7 @@ def test_video_upload_invalid_thumbnail_url(api_client, auth_token):
         "thumbnail_img": "not_a_url",
         "status": "published",
         "storage": 300,
-        "recordingId": "session_1755667366645",
+        "recordingId": data_factory.recording_id(),
     }
 
     response = api_client.post("/api/video/upload", headers=headers, json=payload)
@@ -175,6 +176,7 @@ def test_video_upload_invalid_thumbnail_url(api_client, auth_token):
 
     assert response.status_code == 201
     data = response.json()
+    data_factory.track(data["data"])
     assert data["success"] is True
     assert data["error"] == "Video uploaded successfully"
 
@@ -182,7 +184,7 @@ def test_video_upload_invalid_thumbnail_url(api_client, auth_token):
 @allure.title("Upload Videos - Missing Auth Token")
 @allure.description("Attempts to upload video without sending the auth token.")
 @pytest.mark.order(43)
-def test_video_upload_missing_auth(api_client):
+def test_video_upload_missing_auth(api_client, recording_id):
     logger.info("Uploading video without auth token")
     payload = {
         "title": "Unauthorized Video",
@@ -191,7 +193,7 @@ def test_video_upload_missing_auth(api_client):
         "thumbnail_img": "https://example.com/thumb.jpg",
         "status": "published",
         "storage": 300,
-        "recordingId": "session_1755667366645",
+        "recordingId": recording_id,
     }
 
     response = api_client.post("/api/video/upload", json=payload)
@@ -206,7 +208,7 @@ def test_video_upload_missing_auth(api_client):
 @allure.title("Upload Videos - Title exceeds max length")
 @allure.description("Attempts to upload video with title > 255 characters.")
 @pytest.mark.order(44)
-def test_video_upload_title_too_long(api_client, auth_token):
+def test_video_upload_title_too_long(api_client, auth_token, data_factory):
     logger.info("Uploading video with overly long title")
     headers = {"Authorization": f"Bearer {auth_token}"}
     payload = {
@@ -216,7 +218,7 @@ def test_video_upload_title_too_long(api_client, auth_token):
         "thumbnail_img": "https://example.com/thumb.jpg",
         "status": "published",
         "storage": 300,
-        "recordingId": "session_1755667366645",
+        "recordingId": data_factory.recording_id(),
     }
     response = api_client.post("/api/video/upload", headers=headers, json=payload)
     logger.info(response.json())
@@ -230,7 +232,7 @@ def test_video_upload_title_too_long(api_client, auth_token):
 @allure.title("Upload Videos - Duration exceeds allowed limit")
 @allure.description("Attempts to upload video with duration > 20.")
 @pytest.mark.order(45)
-def test_video_upload_duration_too_long(api_client, auth_token):
+def test_video_upload_duration_too_long(api_client, auth_token, data_factory):
     logger.info("Uploading video with too long duration")
     headers = {"Authorization": f"Bearer {auth_token}"}
     payload = {
@@ -240,7 +242,7 @@ def test_video_upload_duration_too_long(api_client, auth_token):
         "thumbnail_img": "https://example.com/thumb.jpg",
         "status": "published",
         "storage": 300,
-        "recordingId": "session_1755667366645",
+        "recordingId": data_factory.recording_id(),
     }
     response = api_client.post("/api/video/upload", headers=headers, json=payload)
     logger.info(response.json())
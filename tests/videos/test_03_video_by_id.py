@@ -10,9 +10,10 @@ logger = logging.getLogger(__name__)
     "Successfully retrieve video by providing a valid video ID in the path."
 )
 @pytest.mark.order(46)
-def test_get_video_by_valid_id(api_client, auth_token):
+def test_get_video_by_valid_id(api_client, auth_token, data_factory):
     headers = {"Authorization": f"Bearer {auth_token}"}
-    response = api_client.get(f"/api/video/{90}", headers=headers)
+    video_id = data_factory.video()["video_id"]
+    response = api_client.get(f"/api/video/{video_id}", headers=headers)
     logger.info(response.json())
 
     assert response.status_code == 200, f"Expected 200 OK, got {response.status_code}"
@@ -20,7 +21,7 @@ def test_get_video_by_valid_id(api_client, auth_token):
     assert data["success"] is True
     assert data["status"] == 200
     assert data["message"] == "Video retrieved successfully"
-    assert data["data"]["video_id"] == 90
+    assert data["data"]["video_id"] == video_id
 
 
 @allure.title("Get Video by ID - Non-Existent ID")
@@ -72,8 +73,9 @@ def test_get_video_missing_id(api_client, auth_token):
 @allure.title("Get Video by ID - Missing Auth Token")
 @allure.description("Ensure the API rejects requests without an Authorization header.")
 @pytest.mark.order(50)
-def test_get_video_missing_auth_token(api_client):
-    response = api_client.get("/api/video/90")  # No headers
+def test_get_video_missing_auth_token(api_client, data_factory):
+    video_id = data_factory.video()["video_id"]
+    response = api_client.get(f"/api/video/{video_id}")  # No headers
     logger.info(response.json())
 
     assert response.status_code == 401
@@ -84,9 +86,10 @@ def test_get_video_missing_auth_token(api_client):
 @allure.title("Get Video by ID - Invalid Auth Token")
 @allure.description("Ensure the API rejects requests with an invalid Bearer token.")
 @pytest.mark.order(51)
-def test_get_video_invalid_auth_token(api_client):
+def test_get_video_invalid_auth_token(api_client, data_factory):
     headers = {"Authorization": "Bearer invalid.token.here"}
-    response = api_client.get("/api/video/90", headers=headers)
+    video_id = data_factory.video()["video_id"]
+    response = api_client.get(f"/api/video/{video_id}", headers=headers)
     logger.info(response.json())
 
     assert response.status_code == 401
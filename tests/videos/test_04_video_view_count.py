@@ -8,9 +8,13 @@ logger = logging.getLogger(__name__)
 @allure.title("View Video - Valid ID")
 @allure.description("Should increment view count and return video data successfully.")
 @pytest.mark.order(53)
-def test_view_video_valid_id(api_client):
-    i = 0
-    response = api_client.get("/api/video/view/v2/90?key=2459595ca341cfbcb85f740fd4562827")
+def test_view_video_valid_id(api_client, data_factory):
+    # A video of its own, so the first anonymous view is always view number 1.
+    video = data_factory.video("view count")
+    response = api_client.get(
+        f"/api/video/view/v2/{video['video_id']}",
+        params={"key": video["unique_video_key"]},
+    )
     logger.info(response.json())
 
     assert response.status_code == 200
@@ -76,9 +80,10 @@ def test_view_video_sql_injection(api_client):
 @allure.title("View Video - With Auth Token (Owner)")
 @allure.description("Should still allow to view but will not increment view count.")
 @pytest.mark.order(58)
-def test_view_video_guest_user(api_client, auth_token):
+def test_view_video_guest_user(api_client, auth_token, data_factory):
     headers = {"Authorization": f"Bearer {auth_token}"}
-    response = api_client.get("/api/video/view/v2/90", headers=headers)
+    video_id = data_factory.video()["video_id"]
+    response = api_client.get(f"/api/video/view/v2/{video_id}", headers=headers)
     logger.info(response.json())
 
     assert response.status_code == 200
@@ -92,6 +97,7 @@ def test_view_video_guest_user(api_client, auth_token):
 @allure.title("View Video - Zero or Negative ID")
 @allure.description("Should handle edge case where ID is 0 or negative.")
 @pytest.mark.order(59)
+@pytest.mark.batch
 @pytest.mark.parametrize("video_id", [0, -1])
 def test_view_video_zero_negative_id(api_client, video_id):
     response = api_client.get(f"/api/video/view/{video_id}")
@@ -13,10 +13,10 @@ VIDEO_FILE_PATH = "utils/recording.mp4"
 @allure.title("Upload Chunk - Valid Request")
 @allure.description("Upload a valid video chunk with correct recording ID.")
 @pytest.mark.order(80)
-def test_upload_chunk_success(api_client):
+def test_upload_chunk_success(api_client, recording_id):
     with open(VIDEO_FILE_PATH, "rb") as file:
         files = {
-            "recordingId": (None, "session_1755516734335"),
+            "recordingId": (None, recording_id),
             "videoChunks": ("recording.mp4", file, "video/mp4"),
         }
 
@@ -35,9 +35,9 @@ def test_upload_chunk_success(api_client):
 @allure.title("Upload Chunk - Missing Video File")
 @allure.description("Should return 400 when videoChunks field is missing.")
 @pytest.mark.order(81)
-def test_upload_chunk_missing_file(api_client):
+def test_upload_chunk_missing_file(api_client, recording_id):
     files = {
-        "recordingId": (None, "session_1755516734335"),
+        "recordingId": (None, recording_id),
     }
 
     response = api_client.post("/api/video/upload-chunk", files=files)
@@ -64,9 +64,9 @@ def test_upload_chunk_missing_recording_id(api_client):
 @allure.title("Upload Chunk - Invalid File Type")
 @allure.description("Should return 400 when file is not a supported format.")
 @pytest.mark.order(83)
-def test_upload_chunk_invalid_file_type(api_client):
+def test_upload_chunk_invalid_file_type(api_client, recording_id):
     files = {
-        "recordingId": (None, "session_1755516734335"),
+        "recordingId": (None, recording_id),
         "videoChunks": ("not_a_video.txt", b"hello", "text/plain"),
     }
 
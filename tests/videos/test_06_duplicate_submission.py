@@ -0,0 +1,136 @@
+import json
+
+import pytest
+import allure
+import logging
+
+from utils.load import run_concurrently
+from utils.utils import parse_storage
+
+logger = logging.getLogger(__name__)
+
+RECORD_COMPLETE_ENDPOINT = "/api/video/record-complete"
+UPLOAD_ENDPOINT = "/api/video/upload"
+CHUNK_ENDPOINT = "/api/video/upload-chunk"
+STATISTICS_ENDPOINT = "/api/admin/dashboard/statistics"
+VIDEO_FILE_PATH = "utils/recording.mp4"
+# Simultaneous identical submissions, as from a recorder retrying on timeout.
+DUPLICATES = 8
+# Large enough that every duplicate would show in the dashboard's total_storage.
+STORAGE = 1024**3
+
+
+def _fire_duplicates(api_client, send):
+    """Call ``send(client)`` from DUPLICATES threads at once; return responses and timings."""
+    responses = []
+
+    def worker(_):
+        client = api_client.fork()
+        return lambda i: responses.append(send(client))
+
+    result = run_concurrently(
+        [("duplicate", worker(w)) for w in range(DUPLICATES)], iterations=1
+    )["duplicate"]
+    assert not result["errors"], result["errors"][:3]
+    summary = {k: v for k, v in result.items() if k not in ("latencies_ms", "errors")}
+    return responses, summary
+
+
+def _upload_chunk(api_client, recording_id):
+    with open(VIDEO_FILE_PATH, "rb") as file:
+        files = {
+            "recordingId": (None, recording_id),
+            "videoChunks": ("recording.mp4", file, "video/mp4"),
+        }
+        response = api_client.post(CHUNK_ENDPOINT, files=files)
+    assert response.status_code == 200, f"Chunk upload failed: {response.text}"
+
+
+def _statistics(api_client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = api_client.get(STATISTICS_ENDPOINT, headers=headers)
+    assert response.status_code == 200, f"Statistics failed: {response.text}"
+    return response.json()["data"]
+
+
+@allure.title("Record Complete - Concurrent Duplicate Submissions")
+@allure.description(
+    f"Send {DUPLICATES} identical record-complete calls for one recordingId at once; "
+    "none may fail server-side and all successes must refer to the same recording."
+)
+@pytest.mark.order(109)
+@pytest.mark.bulk_upload
+def test_record_complete_duplicate_submissions(api_client, auth_token, data_factory):
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    recording_id = data_factory.recording_id("record complete duplicates")
+    _upload_chunk(api_client, recording_id)
+
+    responses, latency = _fire_duplicates(
+        api_client,
+        lambda client: client.post(
+            RECORD_COMPLETE_ENDPOINT, headers=headers, json={"recordingId": recording_id}
+        ),
+    )
+    for response in responses:
+        logger.info(response.json())
+    logger.info(f"record-complete latency under {DUPLICATES}-way contention: {latency}")
+    allure.attach(
+        json.dumps(latency, indent=2),
+        name="record-complete duplicate latency",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    statuses = sorted(r.status_code for r in responses)
+    assert all(status < 500 for status in statuses), statuses
+    succeeded = [r.json() for r in responses if r.status_code in (200, 201)]
+    assert succeeded, f"No submission succeeded: {statuses}"
+    assert len({body.get("id") for body in succeeded}) == 1, succeeded
+
+
+@allure.title("Upload Videos - Concurrent Duplicate Submissions")
+@allure.description(
+    f"Send {DUPLICATES} identical uploads for one recordingId at once and verify "
+    "exactly one video is created and its storage is counted once."
+)
+@pytest.mark.order(110)
+@pytest.mark.bulk_upload
+def test_video_upload_duplicate_submissions(
+    api_client, auth_token, admin_token, data_factory
+):
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    payload = data_factory.video_payload("upload duplicates", storage=STORAGE)
+    before = _statistics(api_client, admin_token)
+
+    responses, latency = _fire_duplicates(
+        api_client, lambda client: client.post(UPLOAD_ENDPOINT, headers=headers, json=payload)
+    )
+    for response in responses:
+        logger.info(response.json())
+        if response.status_code == 201:
+            data_factory.track(response.json()["data"])
+    logger.info(f"upload latency under {DUPLICATES}-way contention: {latency}")
+    allure.attach(
+        json.dumps(latency, indent=2),
+        name="upload duplicate latency",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    statuses = sorted(r.status_code for r in responses)
+    assert all(status < 500 for status in statuses), statuses
+    created = {r.json()["data"]["video_id"] for r in responses if r.status_code == 201}
+    assert len(created) <= 1, f"Duplicate uploads created {len(created)} videos: {created}"
+
+    listed = api_client.get(
+        "/api/video/list", headers=headers, params={"search": payload["title"]}
+    ).json()["data"]
+    assert len(listed) == 1, f"Expected one '{payload['title']}' video, found {len(listed)}"
+
+    after = _statistics(api_client, admin_token)
+    # Other clients may upload meanwhile; duplicates are caught by the
+    # per-title count above.
+    assert after["total_videos"] >= before["total_videos"] + 1
+    before_bytes, before_resolution = parse_storage(before["total_storage"])
+    after_bytes, after_resolution = parse_storage(after["total_storage"])
+    assert abs((after_bytes - before_bytes) - STORAGE) <= (
+        before_resolution + after_resolution
+    ), f"Storage counted more than once: {before['total_storage']} -> {after['total_storage']}"
@@ -0,0 +1,145 @@
+import json
+import math
+import os
+
+import allure
+
+from utils.metrics import summarize
+
+HISTOGRAM_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def latency_histogram(latencies_ms, buckets=HISTOGRAM_BUCKETS_MS):
+    """Count latencies per ``<= bucket`` edge, with a final overflow bucket."""
+    labels = [f"<={b}ms" for b in buckets] + [f">{buckets[-1]}ms"]
+    counts = [0] * len(labels)
+    for value in latencies_ms:
+        for i, edge in enumerate(buckets):
+            if value <= edge:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+    return dict(zip(labels, counts))
+
+
+def histogram_svg(histogram, width=420, height=160, pad=24):
+    top = max(histogram.values()) or 1
+    bar = (width - 2 * pad) / len(histogram)
+    parts = [f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">']
+    for i, (label, count) in enumerate(histogram.items()):
+        h = (count / top) * (height - 2 * pad)
+        x = pad + i * bar
+        parts.append(
+            f'<rect x="{x + 2:.1f}" y="{height - pad - h:.1f}" width="{bar - 4:.1f}"'
+            f' height="{h:.1f}" fill="#2b7bb9"/>'
+            f'<text x="{x + bar / 2:.1f}" y="{height - 8}" font-size="9"'
+            f' text-anchor="middle">{label}</text>'
+            f'<text x="{x + bar / 2:.1f}" y="{height - pad - h - 3:.1f}" font-size="9"'
+            f' text-anchor="middle">{count}</text>'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def size_curve_svg(curves, width=760, height=220, pad=40, legend=120):
+    """Line chart of ``{label: [(size_bytes, ms), ...]}`` with a log2 size axis."""
+    colors = ("#2b7bb9", "#d9534f", "#8e44ad", "#5cb85c", "#f0ad4e", "#555")
+    points = [p for curve in curves.values() for p in curve if p[1] is not None]
+    if not points:
+        return f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg"/>'
+    low = math.log2(min(p[0] for p in points))
+    span = (math.log2(max(p[0] for p in points)) - low) or 1
+    top = max(p[1] for p in points) or 1
+
+    def xy(size, ms):
+        x = pad + (math.log2(size) - low) / span * (width - 2 * pad - legend)
+        return x, height - pad - ms / top * (height - 2 * pad)
+
+    parts = [
+        f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">',
+        f'<line x1="{pad}" y1="{height - pad}" x2="{width - pad - legend}" y2="{height - pad}" stroke="#999"/>',
+        f'<line x1="{pad}" y1="{pad}" x2="{pad}" y2="{height - pad}" stroke="#999"/>',
+        f'<text x="4" y="{pad}" font-size="10">{top:.0f} ms</text>',
+    ]
+    for size in sorted({p[0] for p in points}):
+        x, _ = xy(size, 0)
+        label = f"{size / 1024:.0f}K" if size < 1024**2 else f"{size / 1024**2:.0f}M"
+        parts.append(
+            f'<text x="{x:.1f}" y="{height - pad + 14}" font-size="9" text-anchor="middle">{label}</text>'
+        )
+    for i, (label, curve) in enumerate(curves.items()):
+        color = colors[i % len(colors)]
+        coords = " ".join("%.1f,%.1f" % xy(size, ms) for size, ms in curve if ms is not None)
+        parts.append(f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{coords}"/>')
+        parts.append(
+            f'<text x="{width - legend}" y="{pad + 12 * i}" font-size="9" fill="{color}">{label}</text>'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def attach_request_metrics(records, slow_ms=None):
+    """Attach a test's request timings, payload sizes and latency histogram.
+
+    When any request took longer than ``slow_ms`` the test is also filed under
+    the "Performance" epic so slow endpoints are grouped in the Behaviors tab.
+    """
+    if not records:
+        return
+    timings = [
+        {
+            "method": r["method"],
+            "path": r["path"],
+            "endpoint": r["endpoint"],
+            "status": r["status"],
+            "elapsed_ms": round(r["elapsed"] * 1000, 2),
+            "request_bytes": r["request_bytes"],
+            "response_bytes": r["response_bytes"],
+            "server_ms": r.get("server_ms"),
+            "network_ms": r.get("network_ms"),
+        }
+        for r in records
+    ]
+    histogram = latency_histogram([t["elapsed_ms"] for t in timings])
+    allure.attach(
+        json.dumps({"requests": timings, "histogram": histogram}, indent=2),
+        name="Request timings",
+        attachment_type=allure.attachment_type.JSON,
+    )
+    allure.attach(
+        histogram_svg(histogram),
+        name="Latency histogram",
+        attachment_type=allure.attachment_type.SVG,
+    )
+
+    slow = [t for t in timings if slow_ms is not None and t["elapsed_ms"] > slow_ms]
+    if slow:
+        allure.dynamic.epic("Performance")
+        allure.dynamic.feature("Slow endpoints")
+        for t in slow:
+            allure.dynamic.story(f"{t['method']} {t['endpoint']}")
+        allure.dynamic.tag("slow")
+
+
+def write_performance_summary(report_dir, records, slow_ms, top=10):
+    """Write the slowest endpoints to ``environment.properties`` for the Overview page."""
+    if not report_dir or not records:
+        return
+    stats = sorted(summarize(records), key=lambda s: s["p95_ms"], reverse=True)
+    lines = [
+        f"perf.requests={len(records)}",
+        f"perf.slow_threshold_ms={slow_ms}",
+    ]
+    for rank, s in enumerate(stats[:top], start=1):
+        flag = " SLOW" if s["p95_ms"] > slow_ms else ""
+        split = ""
+        if s.get("server_p50_ms") is not None:
+            split = f" server={s['server_p50_ms']:.0f}ms network={s['network_p50_ms']:.0f}ms"
+        lines.append(
+            f"perf.p95.{rank:02d}={s['method']} {s['endpoint']}"
+            f" p95={s['p95_ms']:.0f}ms p50={s['p50_ms']:.0f}ms{split} n={s['count']}{flag}"
+        )
+    os.makedirs(report_dir, exist_ok=True)
+    with open(os.path.join(report_dir, "environment.properties"), "a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
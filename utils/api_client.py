@@ -1,23 +1,144 @@
-import requests
-from config.settings import BASE_URL
+import time
+
+from config.settings import (
+    BASE_URL,
+    HTTP_BACKEND,
+    MAX_RETRIES,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    TIMEOUT,
+)
+from utils.batch import request_key
+from utils.multipart import MultipartEncoder
+from utils.profiling import marker
+from utils.response import APIResponse
+from utils.spec import endpoint_template
+from utils.transport import create_transport
 
 
 class APIClient:
-    def __init__(self, base_url=None):
+    def __init__(
+        self,
+        base_url=None,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=MAX_RETRIES,
+        connection_stats=None,
+        transport=None,
+        timeout=TIMEOUT,
+    ):
         self.base_url = base_url or BASE_URL
-        self.session = requests.Session()
+        # Default per-request timeout in seconds; None waits forever.
+        self.timeout = timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        # utils.connstats.ConnectionStats to count new connections and TLS
+        # handshakes per endpoint; None skips the instrumentation.
+        self.connection_stats = connection_stats
+        # Backend name from utils.transport ("requests" or "httpx") or a
+        # ready transport instance.
+        if transport is None or isinstance(transport, str):
+            transport = create_transport(
+                transport or HTTP_BACKEND,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries,
+                connection_stats=connection_stats,
+            )
+        self.transport = transport
+        # requests.Session or httpx.Client underneath.
+        self.session = transport.session
+        # Callables invoked as listener(method, endpoint, response, elapsed)
+        # after every request, e.g. utils.metrics.MetricsRecorder.
+        self.listeners = []
+        # utils.batch.ResponseCache for --batch-matrices: with record_responses
+        # every response is stored in it, otherwise matching requests are
+        # answered from it instead of being sent.
+        self.response_cache = None
+        self.record_responses = False
+
+    def fork(self, **overrides):
+        """New client sharing settings and listeners, for one worker thread.
+
+        requests.Session is not guaranteed thread-safe, so each fork gets its
+        own session and connections. Thread-safe transports (httpx) are shared
+        so every worker multiplexes over the same HTTP/2 connection.
+        ``overrides`` replace constructor arguments, e.g. ``max_retries``.
+        """
+        settings = {
+            "base_url": self.base_url,
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "max_retries": self.max_retries,
+            "connection_stats": self.connection_stats,
+            "timeout": self.timeout,
+        }
+        settings.update(overrides)
+        share = self.transport.shareable and all(
+            settings[k] == getattr(self, k)
+            for k in ("pool_connections", "pool_maxsize", "max_retries")
+        )
+        client = APIClient(
+            transport=self.transport if share else self.transport.name, **settings
+        )
+        client.listeners = self.listeners
+        return client
+
+    def request(self, method, endpoint, **kwargs):
+        cache = self.response_cache
+        key = request_key(method, endpoint, kwargs) if cache is not None else None
+        cached = None
+        if key is not None and not self.record_responses:
+            cached = cache.take(key)
+        if cached is not None:
+            response, elapsed = cached
+        else:
+            response, elapsed = self._send(method, endpoint, **kwargs)
+            if key is not None and self.record_responses:
+                cache.put(key, response, elapsed)
+        with marker("listeners"):
+            for listener in self.listeners:
+                listener(method, endpoint, response, elapsed)
+        return response
+
+    def _send(self, method, endpoint, **kwargs):
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        if self.connection_stats is not None:
+            self.connection_stats.begin(method, endpoint_template(endpoint))
+        start = time.perf_counter()
+        try:
+            with marker(f"http {method}"):
+                response = APIResponse(
+                    self.transport.request(method, f"{self.base_url}{endpoint}", **kwargs)
+                )
+        finally:
+            if self.connection_stats is not None:
+                self.connection_stats.end()
+        return response, time.perf_counter() - start
 
     def get(self, endpoint, **kwargs):
-        return self.session.get(f"{self.base_url}{endpoint}", **kwargs)
+        return self.request("GET", endpoint, **kwargs)
 
-    def post(self, endpoint, json=None, **kwargs):
-        return self.session.post(f"{self.base_url}{endpoint}", json=json, **kwargs)
+    def post(self, endpoint, json=None, files=None, **kwargs):
+        if files is not None and kwargs.get("data") is None:
+            # Stream multipart bodies (e.g. videoChunks) instead of letting
+            # requests build the whole payload in memory.
+            encoder = MultipartEncoder(files)
+            kwargs["data"] = encoder
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "Content-Type": encoder.content_type,
+            }
+            files = None
+        return self.request("POST", endpoint, json=json, files=files, **kwargs)
 
     def put(self, endpoint, json=None, **kwargs):
-        return self.session.put(f"{self.base_url}{endpoint}", json=json, **kwargs)
+        return self.request("PUT", endpoint, json=json, **kwargs)
 
     def delete(self, endpoint, **kwargs):
-        return self.session.delete(f"{self.base_url}{endpoint}", **kwargs)
+        return self.request("DELETE", endpoint, **kwargs)
 
     def patch(self, endpoint, json=None, **kwargs):
-        return self.session.patch(f"{self.base_url}{endpoint}", json=json, **kwargs)
+        return self.request("PATCH", endpoint, json=json, **kwargs)
@@ -0,0 +1,187 @@
+"""Concurrent execution of parametrized validation matrices.
+
+With ``--batch-matrices``, the cases of a test marked ``@pytest.mark.batch``
+are first run together on a thread pool, each against its own fork of
+``api_client`` that records every response. Each case then still runs as its
+own pytest item (logs, Allure results and failures stay per case), but its
+requests are answered from the recorded responses, so the matrix costs about
+as much wall time as its slowest request.
+
+Only mark tests whose body is requests plus assertions: the prefetch pass
+runs the body a second time (its outcome is discarded), and a case is
+prefetched only when all its fixtures are shared (session, module or class
+scoped) so they can be handed to the other threads.
+"""
+
+import json
+import logging
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def request_key(method, endpoint, kwargs):
+    """Hashable identity of a request, or None when the body can't be compared."""
+    data = kwargs.get("data")
+    if kwargs.get("files") is not None or not isinstance(data, (str, bytes, type(None))):
+        return None
+    try:
+        body = json.dumps(kwargs.get("json"), sort_keys=True)
+        params = json.dumps(kwargs.get("params"), sort_keys=True, default=str)
+    except TypeError:
+        return None
+    headers = tuple(sorted((kwargs.get("headers") or {}).items()))
+    return method, endpoint, body, params, data, headers
+
+
+class ResponseCache:
+    """Recorded ``(response, elapsed)`` pairs by request key, each served once."""
+
+    def __init__(self):
+        self._entries = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def put(self, key, response, elapsed):
+        with self._lock:
+            self._entries[key].append((response, elapsed))
+
+    def take(self, key):
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return None
+            return entries.popleft()
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+
+def case_kwargs(first, item):
+    """Arguments to call ``item``'s test function with from another thread.
+
+    Parameters come from the item's own callspec, fixtures from ``first``
+    (already set up); None if a fixture is function scoped.
+    """
+    params = item.callspec.params
+    kwargs = {}
+    for name in item._fixtureinfo.argnames:
+        if name in params:
+            kwargs[name] = params[name]
+            continue
+        fixturedefs = item._fixtureinfo.name2fixturedefs.get(name)
+        if not fixturedefs or fixturedefs[-1].scope == "function" or name not in first.funcargs:
+            return None
+        kwargs[name] = first.funcargs[name]
+    return kwargs
+
+
+class MatrixGroup:
+    """The collected cases of one ``batch``-marked test function."""
+
+    def __init__(self, items):
+        self.items = items
+        self.pending = {item.nodeid for item in items}
+        self.client = None
+        self.cache = None
+        # nodeid -> exception the case raised during prefetch, re-raised by
+        # MatrixBatcher.before_call when that case runs as its own item.
+        self.errors = {}
+
+    def prefetch(self, first):
+        """Run every case concurrently with recording clients; returns the case count."""
+        client = first.funcargs.get("api_client")
+        if client is None:
+            logger.warning(f"{first.originalname}: batch needs the api_client fixture")
+            return 0
+        cases = []
+        for item in self.items:
+            if item.nodeid not in self.pending:
+                continue
+            kwargs = case_kwargs(first, item)
+            if kwargs is None:
+                logger.warning(f"{item.nodeid}: function-scoped fixtures, not batched")
+                continue
+            cases.append((item.nodeid, item.obj, kwargs))
+        self.client, self.cache = client, ResponseCache()
+
+        def run(case):
+            nodeid, fn, kwargs = case
+            recorder = client.fork()
+            recorder.listeners = []
+            recorder.response_cache, recorder.record_responses = self.cache, True
+            try:
+                fn(**{**kwargs, "api_client": recorder})
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except BaseException as e:
+                # Includes pytest.skip/fail/xfail, which must not surface in
+                # the item that triggered the prefetch.
+                self.errors[nodeid] = e
+            finally:
+                if recorder.transport is not client.transport:
+                    recorder.transport.close()
+
+        # Each case logs again when it runs as an item; keep the pass quiet.
+        logging.disable(logging.INFO)
+        try:
+            with ThreadPoolExecutor(max_workers=min(len(cases), client.pool_maxsize) or 1) as pool:
+                list(pool.map(run, cases))
+        finally:
+            logging.disable(logging.NOTSET)
+        client.response_cache = self.cache
+        return len(cases)
+
+    def finish(self):
+        if self.client is not None:
+            self.client.response_cache = None
+        self.client = self.cache = None
+        self.errors.clear()
+
+
+class MatrixBatcher:
+    """Prefetches each ``batch`` group when its first case is called."""
+
+    def __init__(self, items):
+        self.groups = {}
+        by_function = defaultdict(list)
+        for item in items:
+            if (
+                item.get_closest_marker("batch")
+                and hasattr(item, "callspec")
+                and not item.get_closest_marker("skip")
+            ):
+                by_function[(item.path, item.cls, item.originalname)].append(item)
+        for group_items in by_function.values():
+            if len(group_items) > 1:
+                group = MatrixGroup(group_items)
+                self.groups.update((item.nodeid, group) for item in group_items)
+        self.active = None
+
+    def before_call(self, item):
+        group = self.groups.get(item.nodeid)
+        if self.active is not None and group is not self.active:
+            self.finish()
+        if group is not None and self.active is None and group.pending:
+            self.active = group
+            count = group.prefetch(item)
+            logger.info(f"Batched {count} cases of {item.originalname}")
+        error = group.errors.pop(item.nodeid, None) if group is not None else None
+        if error is not None:
+            # The case already ran (and raised) in the prefetch; report it here.
+            self.after_call(item)
+            raise error
+
+    def after_call(self, item):
+        group = self.groups.get(item.nodeid)
+        if group is None:
+            return
+        group.pending.discard(item.nodeid)
+        if not group.pending and group is self.active:
+            self.finish()
+
+    def finish(self):
+        if self.active is not None:
+            self.active.finish()
+            self.active = None
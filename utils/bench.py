@@ -0,0 +1,119 @@
+import math
+import statistics
+import time
+
+from utils.metrics import percentile
+
+# Two-sided Student t critical values for small samples, by degrees of freedom.
+_T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060,
+    30: 2.042,
+}
+
+
+def _critical_value(n, confidence):
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    if confidence != 0.95 or n > 31:
+        return z
+    df = n - 1
+    return _T_95[max(d for d in _T_95 if d <= df)]
+
+
+def mean_ci(values, confidence=0.95):
+    """Confidence interval ``(low, high)`` of the mean; None below two samples."""
+    n = len(values)
+    if n < 2:
+        return None
+    mean = sum(values) / n
+    half = _critical_value(n, confidence) * statistics.stdev(values) / math.sqrt(n)
+    return mean - half, mean + half
+
+
+def percentile_ci(values, pct, confidence=0.95):
+    """Distribution-free confidence interval of a percentile.
+
+    Uses the binomial order-statistic ranks ``n*p -/+ z*sqrt(n*p*(1-p))``,
+    which suits skewed latency data and costs one sort.
+    """
+    n = len(values)
+    if n < 2:
+        return None
+    ordered = sorted(values)
+    p = pct / 100
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    spread = z * math.sqrt(n * p * (1 - p))
+    low = max(0, math.floor(n * p - spread) - 1)
+    high = min(n - 1, math.ceil(n * p + spread) - 1)
+    return ordered[low], ordered[high]
+
+
+def summarize_latencies(latencies_ms, confidence=0.95):
+    if not latencies_ms:
+        return {"count": 0}
+    return {
+        "count": len(latencies_ms),
+        "mean_ms": sum(latencies_ms) / len(latencies_ms),
+        "p50_ms": percentile(latencies_ms, 50),
+        "p95_ms": percentile(latencies_ms, 95),
+        "p99_ms": percentile(latencies_ms, 99),
+        "min_ms": min(latencies_ms),
+        "max_ms": max(latencies_ms),
+        "mean_ci_ms": mean_ci(latencies_ms, confidence),
+        "p50_ci_ms": percentile_ci(latencies_ms, 50, confidence),
+    }
+
+
+def steady_state_start(latencies_ms, window=10, threshold=0.1):
+    """Index where the series settles, or None if it never does.
+
+    The series is steady from the first rolling window of ``window`` samples
+    whose coefficient of variation (stdev / mean) is at most ``threshold``.
+    """
+    for start in range(0, len(latencies_ms) - window + 1):
+        chunk = latencies_ms[start : start + window]
+        mean = sum(chunk) / window
+        if mean > 0 and statistics.pstdev(chunk) / mean <= threshold:
+            return start
+    return None
+
+
+def measure_steady(
+    fn, warmup=5, samples=30, window=10, threshold=0.1, max_samples=300, confidence=0.95
+):
+    """Measure ``fn`` until ``samples`` steady-state latencies are collected.
+
+    After ``warmup`` discarded calls, keeps calling until the rolling window
+    settles (see ``steady_state_start``) and ``samples`` calls have been made
+    from that point, or ``max_samples`` calls in total. Returns
+    (summary, last result); the summary covers only the steady part and
+    records ``steady`` (False when the series never settled and everything
+    after warm-up was used), ``discarded`` and ``total``. The discarded calls
+    are always the first ones, so per-call data ``fn`` collects itself is
+    filtered the same way with ``data[summary["discarded"]:]``.
+    """
+    result = None
+    for _ in range(warmup):
+        result = fn()
+    latencies, start_index = [], None
+    while len(latencies) < max_samples:
+        start = time.perf_counter()
+        result = fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if (
+            start_index is None
+            and len(latencies) >= window
+            and steady_state_start(latencies[-window:], window, threshold) is not None
+        ):
+            start_index = len(latencies) - window
+        if start_index is not None and len(latencies) - start_index >= samples:
+            break
+    steady = start_index is not None
+    kept = latencies[start_index:] if steady else latencies
+    summary = {
+        **summarize_latencies(kept, confidence),
+        "steady": steady,
+        "discarded": warmup + (start_index or 0),
+        "total": warmup + len(latencies),
+    }
+    return summary, result
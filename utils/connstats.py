@@ -0,0 +1,166 @@
+import threading
+import time
+from collections import defaultdict
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionStats:
+    """Counts requests, new TCP connections and TLS handshakes per endpoint.
+
+    APIClient calls ``begin``/``end`` around every request; connections the
+    pool opens in between are charged to that endpoint on the same thread.
+    The requests backend reports through ``ProfilingAdapter``, the httpx
+    backend through ``connection_trace``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.endpoints = defaultdict(
+            lambda: {
+                "requests": 0,
+                "connections": 0,
+                "tls_handshakes": 0,
+                "tcp_connect_ms": 0.0,
+                "tls_handshake_ms": 0.0,
+            }
+        )
+
+    def begin(self, method, endpoint):
+        self._local.key = f"{method} {endpoint}"
+
+    def end(self):
+        with self._lock:
+            self.endpoints[self._current()]["requests"] += 1
+        self._local.key = None
+
+    def _current(self):
+        return getattr(self._local, "key", None) or "(outside APIClient)"
+
+    def connected(self, tcp_ms, tls_ms=None):
+        with self._lock:
+            entry = self.endpoints[self._current()]
+            entry["connections"] += 1
+            entry["tcp_connect_ms"] += tcp_ms
+            if tls_ms is not None:
+                entry["tls_handshakes"] += 1
+                entry["tls_handshake_ms"] += tls_ms
+
+    def totals(self):
+        total = defaultdict(float)
+        for entry in self.endpoints.values():
+            for key, value in entry.items():
+                total[key] += value
+        return dict(total)
+
+    def report(self):
+        """Rows with the reuse ratio: share of requests that needed no new connection."""
+        rows = []
+        for name, entry in sorted(self.endpoints.items()) + [("TOTAL", self.totals())]:
+            requests_made = entry.get("requests", 0)
+            connections = entry.get("connections", 0)
+            rows.append(
+                {
+                    "endpoint": name,
+                    **entry,
+                    "reuse_ratio": (
+                        max(0.0, 1 - connections / requests_made) if requests_made else None
+                    ),
+                }
+            )
+        return rows
+
+    def format_report(self):
+        lines = [
+            f"{'endpoint':<44} {'reqs':>6} {'conns':>6} {'tls':>5}"
+            f" {'reuse':>6} {'tcp ms':>8} {'tls ms':>8}"
+        ]
+        for row in self.report():
+            reuse = "-" if row["reuse_ratio"] is None else f"{row['reuse_ratio']:.0%}"
+            lines.append(
+                f"{row['endpoint'][:44]:<44} {int(row.get('requests', 0)):>6}"
+                f" {int(row.get('connections', 0)):>6} {int(row.get('tls_handshakes', 0)):>5}"
+                f" {reuse:>6} {row.get('tcp_connect_ms', 0):>8.1f}"
+                f" {row.get('tls_handshake_ms', 0):>8.1f}"
+            )
+        return "\n".join(lines)
+
+
+def connection_trace(stats):
+    """httpcore ``trace`` callback for one httpx request, reporting to ``stats``.
+
+    httpx/httpcore emits ``connection.connect_tcp.*`` and
+    ``connection.start_tls.*`` events only when the request opens a new
+    connection; requests multiplexed over an existing HTTP/2 connection or
+    reusing a keep-alive one see neither. The connection is reported at the
+    first HTTP/1.1 or HTTP/2 event after the connect, when it is known
+    whether TLS was negotiated.
+    """
+    started = {}
+    pending = {}
+
+    def trace(name, info):
+        step, _, phase = name.rpartition(".")
+        if phase == "started":
+            started[step] = time.perf_counter()
+        elif phase == "complete" and step in started:
+            elapsed_ms = (time.perf_counter() - started.pop(step)) * 1000
+            if step == "connection.connect_tcp":
+                pending["tcp_ms"] = elapsed_ms
+            elif step == "connection.start_tls":
+                pending["tls_ms"] = elapsed_ms
+        if "tcp_ms" in pending and name.startswith(("http11.", "http2.")):
+            stats.connected(pending.pop("tcp_ms"), pending.pop("tls_ms", None))
+
+    return trace
+
+
+def _counting_pools(stats):
+    """urllib3 pool classes whose connections report to ``stats``."""
+
+    class CountingHTTPConnection(HTTPConnection):
+        def _new_conn(self):
+            start = time.perf_counter()
+            sock = super()._new_conn()
+            self._tcp_ms = (time.perf_counter() - start) * 1000
+            return sock
+
+        def connect(self):
+            super().connect()
+            stats.connected(self._tcp_ms)
+
+    class CountingHTTPSConnection(HTTPSConnection):
+        def _new_conn(self):
+            start = time.perf_counter()
+            sock = super()._new_conn()
+            self._tcp_ms = (time.perf_counter() - start) * 1000
+            return sock
+
+        def connect(self):
+            start = time.perf_counter()
+            super().connect()
+            total_ms = (time.perf_counter() - start) * 1000
+            stats.connected(self._tcp_ms, total_ms - self._tcp_ms)
+
+    class CountingHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = CountingHTTPConnection
+
+    class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = CountingHTTPSConnection
+
+    return {"http": CountingHTTPConnectionPool, "https": CountingHTTPSConnectionPool}
+
+
+class ProfilingAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools count connections and handshakes into ``stats``."""
+
+    def __init__(self, stats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _counting_pools(self.stats)
@@ -0,0 +1,134 @@
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from utils.spec import load_spec
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_ENDPOINT = "/api/video/upload"
+TITLE_PREFIX = "vut-factory"
+
+
+def new_run_id():
+    """Short id unique to this session (and xdist worker), shared by everything it creates."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return os.environ.get("VUT_RUN_ID") or f"{worker}-{uuid.uuid4().hex[:8]}"
+
+
+def make_title(run_id, label="video"):
+    return f"{TITLE_PREFIX} {label} {run_id}"
+
+
+def make_recording_id(run_id, label=None):
+    """A recording id nothing else uses; the same ``label`` gives the same id back."""
+    suffix = label or uuid.uuid4().hex[:8]
+    return f"session_{run_id}_{suffix}".replace(" ", "_")
+
+
+def created_at(video):
+    """``created_date`` as an aware datetime; the API returns epoch ms or ISO text."""
+    value = video["created_date"]
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class DataFactory:
+    """Creates the test data a session needs through the API, once.
+
+    Entities are keyed by a label: ``video("search")`` uploads a video the
+    first time it is asked for and returns the cached record afterwards.
+    Titles and recording ids embed the run id, so concurrent sessions and
+    test order cannot collide with or depend on each other's data.
+    """
+
+    def __init__(self, api_client, auth_token, run_id=None):
+        self.api_client = api_client
+        self.auth_token = auth_token
+        self.run_id = run_id or new_run_id()
+        self._videos = {}
+        self._created = []
+        self._lock = threading.Lock()
+
+    @property
+    def headers(self):
+        return {"Authorization": f"Bearer {self.auth_token}"}
+
+    def title(self, label="video"):
+        return make_title(self.run_id, label)
+
+    def recording_id(self, label=None):
+        """A recording id nothing else uses; pass a label to get the same one back."""
+        return make_recording_id(self.run_id, label)
+
+    def video_payload(self, label="video", **overrides):
+        payload = {
+            "title": self.title(label),
+            "description": f"Created by the test data factory for run {self.run_id}.",
+            "duration": "20",
+            "thumbnail_img": "https://example.com/thumb.jpg",
+            "status": "published",
+            "storage": 300,
+            "recordingId": self.recording_id(label),
+        }
+        payload.update(overrides)
+        return payload
+
+    def track(self, video):
+        """Register a video a test uploaded itself so cleanup sees it too."""
+        with self._lock:
+            self._created.append(video["video_id"])
+
+    def create_video(self, label="video", **overrides):
+        """Upload a new video every call and return its ``data`` record."""
+        response = self.api_client.post(
+            UPLOAD_ENDPOINT, headers=self.headers, json=self.video_payload(label, **overrides)
+        )
+        assert response.status_code == 201, f"Factory upload failed: {response.text}"
+        video = response.json()["data"]
+        self.track(video)
+        return video
+
+    def video(self, label="video", **overrides):
+        """The session's video for ``label``, uploaded on first use."""
+        with self._lock:
+            video = self._videos.get(label)
+        if video is None:
+            video = self.create_video(label, **overrides)
+            with self._lock:
+                video = self._videos.setdefault(label, video)
+        return video
+
+    def created_window(self, video, slack=timedelta(minutes=1)):
+        """``(created_from, created_to)`` ISO strings bracketing the video's creation."""
+        created = created_at(video)
+        return (created - slack).isoformat(), (created + slack).isoformat()
+
+    @property
+    def created_ids(self):
+        return list(self._created)
+
+    def cleanup(self):
+        """Delete what this run uploaded, if the API offers a way to.
+
+        utils/api.json has no DELETE for videos yet; until it does the ids are
+        logged so they can be purged, and the shared title prefix identifies them.
+        """
+        if not self._created:
+            return
+        operations = load_spec()["paths"].get("/api/video/{id}", {})
+        if "delete" not in operations:
+            logger.warning(
+                "No video delete endpoint; leaving %d '%s' videos from run %s: %s",
+                len(self._created), TITLE_PREFIX, self.run_id, self._created,
+            )
+            return
+        for video_id in self._created:
+            response = self.api_client.delete(f"/api/video/{video_id}", headers=self.headers)
+            if response.status_code >= 300:
+                logger.warning("Could not delete video %s: %s", video_id, response.text)
+        self._created.clear()
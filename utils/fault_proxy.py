@@ -0,0 +1,338 @@
+"""Reverse proxy that injects network and server faults per endpoint.
+
+    python -m utils.fault_proxy --upstream http://127.0.0.1:4000 --port 4100 \\
+        --rule "POST /api/video/upload-chunk latency=200 bandwidth=65536" \\
+        --rule "GET /api/video/{id} error_rate=0.2 error_status=502"
+
+Point APIClient at the proxy's URL. Each request is matched against the
+rules (first match wins) by method and ``utils/api.json`` template, and the
+rule decides its latency, jitter, bandwidth cap, connection resets and 5xx
+responses. Everything else is forwarded to the upstream unchanged.
+"""
+
+import argparse
+import http.client
+import json
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from utils.spec import endpoint_template
+
+# Headers that describe one hop and must not be forwarded.
+HOP_BY_HOP = {
+    "connection",
+    "keep-alive",
+    "proxy-connection",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+}
+# Methods that are safe to send twice when a reused connection turns out to
+# be closed; a POST or PATCH might already have been applied upstream.
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class FaultRule:
+    """Faults applied to requests matching ``method`` and ``endpoint``.
+
+    ``endpoint`` is a spec template such as ``/api/video/{id}``; ``None``
+    matches any. ``latency_ms`` plus up to ``jitter_ms`` either way delays
+    each request; ``bandwidth`` caps both directions in bytes per second.
+    ``reset_rate`` is the share of connections reset instead of answered.
+    ``error_burst`` answers the next N matching requests with
+    ``error_status``, then ``error_rate`` applies to the rest.
+    """
+
+    def __init__(
+        self,
+        method=None,
+        endpoint=None,
+        latency_ms=0,
+        jitter_ms=0,
+        bandwidth=None,
+        reset_rate=0.0,
+        error_rate=0.0,
+        error_burst=0,
+        error_status=503,
+    ):
+        self.method = method.upper() if method else None
+        self.endpoint = endpoint
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth = bandwidth
+        self.reset_rate = reset_rate
+        self.error_rate = error_rate
+        self.error_burst = error_burst
+        self.error_status = error_status
+        self._lock = threading.Lock()
+
+    def matches(self, method, path):
+        return (self.method is None or self.method == method) and (
+            self.endpoint is None or self.endpoint == endpoint_template(path)
+        )
+
+    def delay(self, rng):
+        jitter = rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def injected_error(self, rng):
+        """Status to answer with instead of forwarding, or None."""
+        with self._lock:
+            if self.error_burst > 0:
+                self.error_burst -= 1
+                return self.error_status
+        if self.error_rate and rng.random() < self.error_rate:
+            return self.error_status
+        return None
+
+    def __repr__(self):
+        return f"FaultRule({self.method or '*'} {self.endpoint or '*'})"
+
+
+# Short option names accepted by parse_rule.
+RULE_ALIASES = {"latency": "latency_ms", "jitter": "jitter_ms"}
+
+
+def parse_rule(text):
+    """``"POST /api/video/upload latency=200 bandwidth=65536"`` -> FaultRule.
+
+    Method and endpoint are optional (``*`` matches any); options are the
+    FaultRule keyword arguments, with ``latency`` and ``jitter`` accepted
+    for ``latency_ms`` and ``jitter_ms``.
+    """
+    kwargs, positional = {}, []
+    for token in text.split():
+        if "=" in token:
+            key, value = token.split("=", 1)
+            key = RULE_ALIASES.get(key, key)
+            kwargs[key] = float(value) if "." in value else int(value)
+        else:
+            positional.append(None if token == "*" else token)
+    if positional and positional[0] and positional[0].startswith("/"):
+        positional.insert(0, None)
+    return FaultRule(*positional[:2], **kwargs)
+
+
+def _throttled_write(wfile, data, bandwidth, chunk=16 * 1024):
+    if not bandwidth:
+        wfile.write(data)
+        return
+    view = memoryview(data)
+    chunk = max(1, min(chunk, int(bandwidth) // 10 or 1))
+    for offset in range(0, len(view), chunk):
+        start = time.perf_counter()
+        piece = view[offset : offset + chunk]
+        wfile.write(piece)
+        wfile.flush()
+        remaining = len(piece) / bandwidth - (time.perf_counter() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+def _throttled_read(rfile, length, bandwidth, chunk=16 * 1024):
+    if not bandwidth:
+        return rfile.read(length)
+    chunk = max(1, min(chunk, int(bandwidth) // 10 or 1))
+    parts, remaining = [], length
+    while remaining > 0:
+        start = time.perf_counter()
+        piece = rfile.read(min(chunk, remaining))
+        if not piece:
+            break
+        parts.append(piece)
+        remaining -= len(piece)
+        wait = len(piece) / bandwidth - (time.perf_counter() - start)
+        if wait > 0:
+            time.sleep(wait)
+    return b"".join(parts)
+
+
+class FaultProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    proxy = None  # set on the per-server subclass
+
+    def setup(self):
+        super().setup()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _reset(self):
+        # SO_LINGER with a zero timeout makes close() send RST instead of FIN.
+        self.request.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        self.close_connection = True
+        self.request.close()
+
+    def _handle(self):
+        proxy = self.proxy
+        rule = proxy.rule_for(self.command, self.path)
+        bandwidth = rule.bandwidth if rule else None
+        length = int(self.headers.get("Content-Length") or 0)
+        body = _throttled_read(self.rfile, length, bandwidth) if length else None
+
+        if rule is not None:
+            time.sleep(rule.delay(proxy.rng))
+            if rule.reset_rate and proxy.rng.random() < rule.reset_rate:
+                proxy.count("reset")
+                return self._reset()
+            status = rule.injected_error(proxy.rng)
+            if status is not None:
+                proxy.count(f"status_{status}")
+                payload = json.dumps(
+                    {"success": False, "status": status, "message": "Injected fault"}
+                ).encode()
+                return self._send(status, [("Content-Type", "application/json")], payload, bandwidth)
+
+        try:
+            status, headers, payload = proxy.forward(self.command, self.path, self.headers, body)
+        except (OSError, http.client.HTTPException) as e:
+            proxy.count("upstream_error")
+            payload = json.dumps({"success": False, "status": 502, "message": str(e)}).encode()
+            return self._send(502, [("Content-Type", "application/json")], payload, bandwidth)
+        proxy.count("forwarded")
+        self._send(status, headers, payload, bandwidth)
+
+    def _send(self, status, headers, payload, bandwidth):
+        self.send_response(status)
+        for name, value in headers:
+            if name.lower() not in HOP_BY_HOP and name.lower() != "content-length":
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        _throttled_write(self.wfile, payload, bandwidth)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FaultProxy:
+    """Threaded fault-injecting reverse proxy in front of ``upstream``.
+
+    Use as a context manager; ``url`` is the base URL to give APIClient and
+    ``stats`` counts forwarded requests and each injected fault.
+    """
+
+    def __init__(self, upstream, rules=(), host="127.0.0.1", port=0, seed=None, timeout=30):
+        parts = urlsplit(upstream)
+        self.upstream = upstream
+        self._scheme, self._netloc = parts.scheme, parts.netloc
+        self._timeout = timeout
+        self.rules = list(rules)
+        self.rng = random.Random(seed)
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        handler = type("BoundFaultProxyHandler", (FaultProxyHandler,), {"proxy": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_rule(self, rule=None, **kwargs):
+        """Add a FaultRule (or build one from kwargs) ahead of the existing rules."""
+        rule = rule or FaultRule(**kwargs)
+        with self._lock:
+            self.rules.insert(0, rule)
+        return rule
+
+    def clear(self):
+        with self._lock:
+            self.rules.clear()
+            self.stats.clear()
+
+    def rule_for(self, method, path):
+        with self._lock:
+            return next((r for r in self.rules if r.matches(method, path)), None)
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = (
+                http.client.HTTPSConnection
+                if self._scheme == "https"
+                else http.client.HTTPConnection
+            )
+            conn = self._local.conn = cls(self._netloc, timeout=self._timeout)
+        return conn
+
+    def forward(self, method, path, headers, body):
+        """Send the request upstream on this thread's keep-alive connection."""
+        forwarded = {
+            name: value
+            for name, value in headers.items()
+            if name.lower() not in HOP_BY_HOP and name.lower() != "host"
+        }
+        for attempt in range(2):
+            conn = self._connection()
+            reused = conn.sock is not None
+            try:
+                conn.request(method, path, body=body, headers=forwarded)
+                response = conn.getresponse()
+                return response.status, response.getheaders(), response.read()
+            except (ConnectionError, http.client.RemoteDisconnected, http.client.BadStatusLine):
+                conn.close()
+                self._local.conn = None
+                # The upstream may have closed an idle keep-alive connection;
+                # resend once, but only requests that are safe to repeat.
+                if attempt or not reused or method not in IDEMPOTENT_METHODS:
+                    raise
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="fault-proxy", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--upstream", required=True, help="e.g. http://127.0.0.1:4000")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4100)
+    parser.add_argument("--rule", action="append", default=[], help="see utils.fault_proxy.parse_rule")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    proxy = FaultProxy(
+        args.upstream, [parse_rule(r) for r in args.rule], args.host, args.port, args.seed
+    )
+    print(f"Fault proxy on {proxy.url} -> {args.upstream} with {proxy.rules}")
+    try:
+        proxy.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.httpd.server_close()
+        print(dict(proxy.stats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""Pick the tests a change can affect.
+
+Each run records which ``METHOD /template`` endpoints every test called
+(through the APIClient metrics listener), directly or through the fixtures
+it uses, into a JSON map. Given a git ref,
+``affected_tests`` diffs utils/api.json and the source tree against it and
+returns the tests that touch a changed operation or import a changed
+module. It returns ``None`` (run everything) when the map is missing or was
+recorded against a different spec, or when shared code such as conftest.py
+or a module it imports at the top level changed.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import subprocess
+from collections import defaultdict
+
+from utils.spec import SPEC_PATH
+
+DEFAULT_MAP_PATH = os.environ.get("VUT_IMPACT_MAP", "perf-results/test-endpoints.json")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SPEC_FILE = os.path.relpath(SPEC_PATH, ROOT).replace(os.sep, "/")
+# Changes here can affect any test.
+GLOBAL_FILES = {"conftest.py", "pytest.ini", "requirements.txt"}
+HTTP_METHODS = {"get", "put", "post", "delete", "patch", "head", "options"}
+
+
+def digest(text):
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def _git(*args):
+    return subprocess.run(
+        ["git", *args], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+
+
+# -------------------- Endpoint map --------------------
+
+
+def load_map(path=DEFAULT_MAP_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_map(tests, path=DEFAULT_MAP_PATH):
+    """Merge ``{nodeid: [endpoint, ...]}`` into the map, stamped with the current spec."""
+    with open(SPEC_PATH, encoding="utf-8") as f:
+        spec_digest = digest(f.read())
+    existing = load_map(path) or {}
+    merged = existing.get("tests", {}) if existing.get("spec") == spec_digest else {}
+    merged.update({nodeid: sorted(endpoints) for nodeid, endpoints in tests.items()})
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"spec": spec_digest, "tests": merged}, f, indent=1, sort_keys=True)
+
+
+def endpoints_by_test(records, fixtures):
+    """``{nodeid: {"METHOD /template"}}`` from MetricsRecorder records.
+
+    ``fixtures`` maps each executed test to the fixtures it uses
+    (``item.fixturenames``); tests that made no request map to nothing
+    rather than looking unknown. Requests made while a fixture was set up
+    (logins, seeded uploads) count for every test using that fixture, not
+    just the first one that triggered it.
+    """
+    tests = {nodeid: set() for nodeid in fixtures}
+    by_fixture = defaultdict(set)
+    for record in records:
+        endpoint = f"{record['method']} {record['endpoint']}"
+        if record.get("fixture"):
+            by_fixture[record["fixture"]].add(endpoint)
+        elif record["test"] in tests:
+            tests[record["test"]].add(endpoint)
+    for nodeid, names in fixtures.items():
+        for name in names:
+            tests[nodeid] |= by_fixture.get(name, set())
+    return tests
+
+
+# -------------------- Diffing --------------------
+
+
+def changed_files(ref):
+    """Files that differ between ``ref`` and the working tree, plus untracked ones."""
+    changed = _git("diff", "--name-only", ref, "--").split()
+    changed += _git("ls-files", "--others", "--exclude-standard").split()
+    return set(changed)
+
+
+def changed_operations(old_spec, new_spec):
+    """``METHOD /template`` operations added, removed or edited between two specs."""
+
+    def operations(spec):
+        return {
+            f"{method.upper()} {template}": json.dumps(operation, sort_keys=True)
+            for template, item in spec.get("paths", {}).items()
+            for method, operation in item.items()
+            if method in HTTP_METHODS
+        }
+
+    old, new = operations(old_spec), operations(new_spec)
+    return {op for op in old.keys() | new.keys() if old.get(op) != new.get(op)}
+
+
+def _module_name(path):
+    return os.path.splitext(path)[0].replace("/", ".")
+
+
+def _parse(path):
+    with open(os.path.join(ROOT, path), encoding="utf-8") as f:
+        return ast.parse(f.read(), path)
+
+
+def _walk_top_level(node):
+    """Like ast.walk, but skips function bodies (imports that run lazily)."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+                stack.append(child)
+
+
+def _imported_modules(nodes):
+    names = set()
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return {
+        name for name in names
+        if os.path.exists(os.path.join(ROOT, name.replace(".", "/") + ".py"))
+    }
+
+
+def local_imports(path, top_level=False):
+    """Modules of this repo that ``path`` imports directly.
+
+    With ``top_level`` only imports that run when ``path`` is imported count,
+    not those inside functions.
+    """
+    tree = _parse(path)
+    return _imported_modules(_walk_top_level(tree) if top_level else ast.walk(tree))
+
+
+def _closure(modules):
+    seen, stack = set(), list(modules)
+    while stack:
+        module = stack.pop()
+        if module not in seen:
+            seen.add(module)
+            stack.extend(local_imports(module.replace(".", "/") + ".py"))
+    return seen
+
+
+def module_closure(path, top_level=False):
+    """Every local module ``path`` depends on, transitively.
+
+    ``top_level`` applies to ``path`` itself; the modules it imports are
+    followed through all their imports.
+    """
+    return _closure(local_imports(path, top_level))
+
+
+def _is_fixture(function):
+    for decorator in function.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if getattr(target, "attr", getattr(target, "id", None)) == "fixture":
+            return True
+    return False
+
+
+def fixture_closures(path="conftest.py"):
+    """``{fixture name: local modules its body imports, transitively}`` for ``path``.
+
+    conftest.py imports most helpers inside the fixtures that need them, so
+    those modules only affect tests that use the fixture.
+    """
+    closures = {}
+    for node in _parse(path).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and _is_fixture(node):
+            closures[node.name] = _closure(_imported_modules(ast.walk(node)))
+    return closures
+
+
+# -------------------- Selection --------------------
+
+
+def select_tests(files, nodeids, known, operations=(), fixtures=None):
+    """Tests in ``nodeids`` affected by changed ``files`` and spec ``operations``.
+
+    ``known`` is the map's ``{nodeid: [endpoint, ...]}`` and ``fixtures``
+    maps nodeids to the fixtures they use (``item.fixturenames``). Returns
+    ``(None, reason)`` when shared code changed and every test is affected.
+    """
+    changed_globals = sorted(files & GLOBAL_FILES)
+    # Only conftest.py's own imports are shared; modules its fixtures import
+    # lazily count for the tests that use those fixtures.
+    shared = module_closure("conftest.py", top_level=True)
+    changed_modules = {
+        _module_name(f) for f in files if f.endswith(".py") and not f.startswith("tests/")
+    }
+    if changed_globals or changed_modules & shared:
+        return None, f"shared code changed: {changed_globals + sorted(changed_modules & shared)}"
+
+    by_fixture = fixture_closures() if fixtures else {}
+    operations = set(operations)
+    selected = []
+    closures = {}
+    for nodeid in nodeids:
+        module = nodeid.partition("::")[0]
+        if module not in closures:
+            closures[module] = module_closure(module)
+        depends_on = set(closures[module])
+        for name in (fixtures or {}).get(nodeid, ()):
+            depends_on |= by_fixture.get(name, set())
+        if (
+            nodeid not in known
+            or module in files
+            or operations & set(known[nodeid])
+            or changed_modules & depends_on
+        ):
+            selected.append(nodeid)
+    return selected, None
+
+
+def affected_tests(ref, nodeids, mapping, fixtures=None):
+    """Subset of ``nodeids`` affected by changes since ``ref``, and why.
+
+    ``fixtures`` is passed on to ``select_tests``. Returns ``(None, reason)``
+    when the whole suite should run.
+    """
+    if mapping is None:
+        return None, "no endpoint map recorded yet"
+    try:
+        files = changed_files(ref)
+        old_spec_text = _git("show", f"{ref}:{SPEC_FILE}")
+    except (OSError, subprocess.CalledProcessError) as e:
+        return None, f"cannot diff against {ref!r}: {e}"
+    with open(SPEC_PATH, encoding="utf-8") as f:
+        new_spec_text = f.read()
+    if mapping.get("spec") not in (digest(old_spec_text), digest(new_spec_text)):
+        return None, "endpoint map was recorded against another spec"
+
+    operations = set()
+    if SPEC_FILE in files:
+        operations = changed_operations(json.loads(old_spec_text), json.loads(new_spec_text))
+
+    selected, reason = select_tests(
+        files, nodeids, mapping.get("tests", {}), operations, fixtures
+    )
+    if selected is None:
+        return None, reason
+    return selected, (
+        f"{len(files)} changed file(s), {len(operations)} changed operation(s)"
+    )
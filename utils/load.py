@@ -0,0 +1,70 @@
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from utils import profiling
+from utils.bench import summarize_latencies
+
+
+def run_concurrently(workers, duration=None, iterations=None, warmup=0):
+    """Run each worker callable repeatedly on its own thread.
+
+    ``workers`` is a list of ``(name, fn)``; ``fn`` takes the iteration number
+    and should raise (e.g. an AssertionError) when it sees something wrong.
+    Workers stop after ``duration`` seconds or ``iterations`` calls, whichever
+    is given. All threads start together behind a barrier. Each worker first
+    makes ``warmup`` calls whose latencies are not recorded (failures still
+    are); ``duration`` and ``iterations`` count from after the warm-up.
+
+    Returns ``{name: {"latencies_ms": [...], "errors": [...], "wall_s": ...,
+    **summary}}``; workers sharing a name are pooled and ``wall_s`` is the
+    longest of their post-warm-up running times.
+    """
+    if duration is None and iterations is None:
+        raise ValueError("Pass duration and/or iterations")
+
+    barrier = threading.Barrier(len(workers))
+    results = {
+        name: {"latencies_ms": [], "errors": [], "wall_s": 0.0} for name, _ in workers
+    }
+    lock = threading.Lock()
+
+    def loop(name, fn):
+        latencies, errors = [], []
+        profiler = profiling.active()
+        barrier.wait()
+        for i in range(-warmup, 0):
+            try:
+                fn(i)
+            except Exception as e:
+                errors.append(f"warm-up {type(e).__name__}: {e}\n{traceback.format_exc(limit=3)}")
+        started = time.perf_counter()
+        deadline = started + duration if duration else None
+        i = 0
+        # cProfile only sees the thread it runs on, so each worker gets its own.
+        with profiler.thread_profile() if profiler else nullcontext():
+            while (iterations is None or i < iterations) and (
+                deadline is None or time.perf_counter() < deadline
+            ):
+                start = time.perf_counter()
+                try:
+                    fn(i)
+                except Exception as e:
+                    errors.append(f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=3)}")
+                latencies.append((time.perf_counter() - start) * 1000)
+                i += 1
+        wall = time.perf_counter() - started
+        with lock:
+            results[name]["wall_s"] = max(results[name]["wall_s"], wall)
+            results[name]["latencies_ms"].extend(latencies)
+            results[name]["errors"].extend(errors)
+
+    with ThreadPoolExecutor(max_workers=len(workers)) as pool:
+        for future in [pool.submit(loop, name, fn) for name, fn in workers]:
+            future.result()
+
+    for result in results.values():
+        result.update(summarize_latencies(result["latencies_ms"]))
+    return results
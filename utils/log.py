@@ -0,0 +1,252 @@
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+CONSOLE_FORMAT = (
+    "%(asctime)s - %(levelname)s - %(name)s - %(funcName)s:%(lineno)d - %(message)s"
+)
+
+# A key is sensitive when its last word (``accessToken``, ``refresh_token``,
+# ``confirmPassword``) or last two words (``x-api-key``) name a secret, so
+# ``unique_video_key`` or ``keywords`` stay readable.
+SENSITIVE_NAMES = {
+    "token", "password", "passwd", "secret", "authorization", "cookie",
+    "credentials", "apikey", "privatekey", "secretkey",
+}
+_KEY_WORDS = re.compile(r"[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])")
+REDACTED = "***"
+_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str)
+
+
+@functools.lru_cache(maxsize=1024)
+def is_sensitive_key(key):
+    words = [word.lower() for word in _KEY_WORDS.findall(str(key))]
+    return bool(words) and (
+        words[-1] in SENSITIVE_NAMES or "".join(words[-2:]) in SENSITIVE_NAMES
+    )
+
+
+def redact(value):
+    """Parsed JSON body with token/password-like fields masked.
+
+    Containers are copied only on the path to a masked field; when nothing
+    matches, ``value`` itself is returned.
+    """
+    if isinstance(value, dict):
+        copy = None
+        for k, v in value.items():
+            masked = REDACTED if v and is_sensitive_key(k) else redact(v)
+            if masked is not v:
+                copy = copy or dict(value)
+                copy[k] = masked
+        return value if copy is None else copy
+    if isinstance(value, list):
+        copy = None
+        for i, v in enumerate(value):
+            masked = redact(v)
+            if masked is not v:
+                copy = copy or list(value)
+                copy[i] = masked
+        return value if copy is None else copy
+    return value
+
+
+class _Body:
+    """A logged response body, parsed and redacted only when rendered.
+
+    The queue handler swaps ``record.msg`` for this, which is all it does on
+    the test thread. The listener's formatters call ``redacted()`` in the
+    background; pytest's live-log, caplog and report handlers, which format
+    on the test thread anyway, get the redacted text from ``str()``.
+    """
+
+    __slots__ = ("raw", "_text")
+
+    def __init__(self, raw):
+        self.raw = raw
+        self._text = None
+
+    def redacted(self):
+        """The redacted body, or None when ``raw`` is text that is not JSON."""
+        body = self.raw
+        if isinstance(body, str):
+            try:
+                body = json.loads(body)
+            except ValueError:
+                return None
+        return redact(body)
+
+    def __str__(self):
+        if self._text is None:
+            body = self.redacted()
+            self._text = self.raw if body is None else str(body)
+        return self._text
+
+
+def _is_body(record):
+    """dict/list bodies (``response.json()``) and JSON text (``response.text``)."""
+    if record.args:
+        return False
+    msg = record.msg
+    return isinstance(msg, (dict, list)) or (isinstance(msg, str) and msg[:1] in ("{", "["))
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting and redaction to the listener thread.
+
+    The stock handler renders the message in the calling thread, which for
+    ``logger.info(response.json())`` means a full repr of the body on every
+    request. Here the record is enqueued as-is with its body wrapped in
+    ``_Body``, so bodies logged this way must not be mutated afterwards.
+    Bodies can be sampled with ``body_sample_rate``.
+
+    This is the first handler on the root logger, so pytest's handlers that
+    see the record afterwards (sampled-out records included) get the
+    wrapped body too and never print it unredacted.
+    """
+
+    def __init__(self, q, body_sample_rate=1.0):
+        super().__init__(q)
+        self.body_sample_rate = body_sample_rate
+
+    def prepare(self, record):
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def emit(self, record):
+        if not _is_body(record):
+            super().emit(record)
+            return
+        raw = record.msg
+        record.msg = _Body(raw)
+        if (
+            self.body_sample_rate < 1.0
+            and isinstance(raw, (dict, list))
+            and random.random() >= self.body_sample_rate
+        ):
+            return
+        super().emit(record)
+
+
+class _BodyFormatting:
+    max_body = 4096
+
+    def cap(self, text):
+        if len(text) > self.max_body:
+            return f"{text[: self.max_body]}... [{len(text)} chars]"
+        return text
+
+    def body(self, record):
+        """The record's redacted body, or None when it logs plain text."""
+        if isinstance(record.msg, _Body):
+            return record.msg.redacted()
+        return None
+
+    def render_body(self, body):
+        """``(body, compact_text)``; body is None when the text was cut.
+
+        Encoding stops once the text passes ``max_body``, so a huge listing
+        is never serialized in full.
+        """
+        chunks, size = [], 0
+        for chunk in _ENCODER.iterencode(body):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.max_body:
+                return None, f"{''.join(chunks)[: self.max_body]}... [truncated]"
+        return body, "".join(chunks)
+
+
+class ConsoleFormatter(_BodyFormatting, logging.Formatter):
+    """The suite's usual console line, with response bodies redacted and capped."""
+
+    def __init__(self, max_body=4096):
+        super().__init__(CONSOLE_FORMAT)
+        self.max_body = max_body
+
+    def format(self, record):
+        # pytest's handlers may be reading the same record on the test
+        # thread, so format a copy.
+        body = self.body(record)
+        record = logging.makeLogRecord(record.__dict__)
+        if body is not None:
+            record.msg = self.render_body(body)[1]
+        else:
+            record.msg = self.cap(record.getMessage())
+        record.args = None
+        return super().format(record)
+
+
+class JsonLinesFormatter(_BodyFormatting, logging.Formatter):
+    """One compact JSON object per record for ``logs/test.log``."""
+
+    def __init__(self, max_body=4096):
+        super().__init__()
+        self.max_body = max_body
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "func": record.funcName,
+            "line": record.lineno,
+        }
+        body, text = self.body(record), None
+        if body is not None:
+            body, text = self.render_body(body)
+            if body is None:
+                entry["body_truncated"] = text
+                text = None
+        else:
+            entry["msg"] = self.cap(record.getMessage())
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        line = json.dumps(entry, separators=(",", ":"), default=str)
+        if text is not None:
+            # Splice in the body text render_body already encoded.
+            line = f'{line[:-1]},"body":{text}}}'
+        return line
+
+
+def setup_logging(
+    log_path="logs/test.log",
+    level=logging.INFO,
+    max_body=None,
+    body_sample_rate=None,
+):
+    """Route root logging through a queue to stdout and a JSON-lines file.
+
+    Call it before pytest adds its logging handlers (at conftest import), so
+    the queue handler runs first and wraps bodies for them too.
+
+    Returns the started QueueListener; call ``stop()`` on it at shutdown to
+    flush pending records. ``max_body`` and ``body_sample_rate`` default to
+    ``VUT_LOG_MAX_BODY`` and ``VUT_LOG_BODY_SAMPLE``.
+    """
+    if max_body is None:
+        max_body = int(os.environ.get("VUT_LOG_MAX_BODY", 4096))
+    if body_sample_rate is None:
+        body_sample_rate = float(os.environ.get("VUT_LOG_BODY_SAMPLE", 1.0))
+
+    os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(ConsoleFormatter(max_body))
+    logfile = logging.FileHandler(log_path, mode="w", delay=True)
+    logfile.setFormatter(JsonLinesFormatter(max_body))
+
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, console, logfile, respect_handler_level=True)
+    logging.basicConfig(
+        level=level, handlers=[DeferredQueueHandler(records, body_sample_rate)]
+    )
+    listener.start()
+    return listener
@@ -0,0 +1,99 @@
+import math
+import time
+from collections import defaultdict
+
+from utils.server_timing import split_latency
+from utils.spec import endpoint_template
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of ``values`` (``pct`` in 0-100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def body_size(body):
+    if body is None:
+        return 0
+    try:
+        return len(body)
+    except TypeError:
+        return 0
+
+
+class MetricsRecorder:
+    """APIClient listener keeping one record per request made during a run."""
+
+    def __init__(self):
+        self.records = []
+        self.current_test = None
+        # Fixture being set up, if any; see conftest.pytest_fixture_setup.
+        self.current_fixture = None
+        self._by_test = defaultdict(list)
+
+    def __call__(self, method, endpoint, response, elapsed):
+        ttfb_ms, server_ms, network_ms = split_latency(response, elapsed)
+        record = {
+            "test": self.current_test,
+            "fixture": self.current_fixture,
+            "method": method,
+            "endpoint": endpoint_template(endpoint),
+            "path": endpoint,
+            "status": response.status_code,
+            "elapsed": elapsed,
+            "finished_at": time.time(),
+            "request_bytes": body_size(response.request.body),
+            "response_bytes": len(response.content or b""),
+            "ttfb_ms": ttfb_ms,
+            "server_ms": server_ms,
+            "network_ms": network_ms,
+        }
+        self.records.append(record)
+        self._by_test[self.current_test].append(record)
+
+    def for_test(self, nodeid):
+        return self._by_test.get(nodeid, [])
+
+
+def summarize(records):
+    """Aggregate records into per ``(method, endpoint)`` latency statistics.
+
+    Latencies are reported in milliseconds. ``errors`` counts 5xx responses,
+    since 4xx are what most of the suite deliberately provokes. The server and
+    network medians cover only responses that carried a timing header.
+    """
+    groups = defaultdict(list)
+    for record in records:
+        groups[(record["method"], record["endpoint"])].append(record)
+
+    stats = []
+    for (method, endpoint), group in sorted(groups.items()):
+        latencies = [r["elapsed"] * 1000 for r in group]
+        started = min(r["finished_at"] - r["elapsed"] for r in group)
+        finished = max(r["finished_at"] for r in group)
+        window = finished - started
+        server = [r["server_ms"] for r in group if r.get("server_ms") is not None]
+        network = [r["network_ms"] for r in group if r.get("network_ms") is not None]
+        stats.append(
+            {
+                "method": method,
+                "endpoint": endpoint,
+                "count": len(group),
+                "errors": sum(1 for r in group if r["status"] >= 500),
+                "mean_ms": sum(latencies) / len(latencies),
+                "p50_ms": percentile(latencies, 50),
+                "p95_ms": percentile(latencies, 95),
+                "p99_ms": percentile(latencies, 99),
+                "max_ms": max(latencies),
+                "throughput_rps": len(group) / window if window > 0 else None,
+                "request_bytes": sum(r["request_bytes"] for r in group),
+                "response_bytes": sum(r["response_bytes"] for r in group),
+                "server_p50_ms": percentile(server, 50),
+                "network_p50_ms": percentile(network, 50),
+            }
+        )
+    return stats
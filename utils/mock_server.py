@@ -0,0 +1,473 @@
+"""Local stand-in for the VUT backend, served from utils/api.json.
+
+    python -m utils.mock_server --port 4000
+    python -m utils.mock_server --port 4000 --mode async --workers 4
+    python -m utils.mock_server --port 4000 --mode async --http2
+
+Every path in the spec answers with the example body of its first 2xx
+response, so client-side benchmarks can run without touching the real
+service. Unknown routes return the backend's usual 404 body. Responses
+carry a ``Server-Timing: total`` header with the handler's own time.
+
+``mode="threaded"`` (default) is http.server with a thread per connection.
+``mode="async"`` is an asyncio HTTP/1.1 keep-alive server; with
+``workers > 1`` that many forked processes accept on one shared socket, so
+the mock can outrun a concurrent client (benchmarks/bench_mock_server.py
+measures both).
+
+``http2=True`` (``--http2``, async mode only) speaks cleartext HTTP/2 with
+prior knowledge instead of HTTP/1.1: no ALPN or Upgrade, so clients must be
+told, e.g. the httpx backend with ``VUT_HTTP2_PRIOR_KNOWLEDGE=1``. It needs
+the ``h2`` package (``pip install "httpx[http2]"``).
+
+With ``smtp=(host, port)`` (``--smtp host:port``) the password-reset pair
+is stateful instead: POST /api/password/forgot mails a reset link with a
+fresh one-time token there (e.g. to utils.smtp_sink), and POST
+/api/password/reset accepts only an issued token as its Bearer.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import multiprocessing
+import secrets
+import smtplib
+import socket
+import sys
+import threading
+import time
+from email.message import EmailMessage
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from utils.spec import load_spec, template_regex
+
+NOT_FOUND = {"success": False, "status": 404, "message": "Route not found"}
+INVALID_RESET_TOKEN = {"success": False, "status": 401, "message": "Invalid or expired token"}
+RESET_LINK = "http://localhost:3000/reset-password?token={}"
+
+
+def example_for(schema):
+    """Build an example value from an OpenAPI schema's ``example`` fields."""
+    if not schema:
+        return {}
+    if "example" in schema:
+        return schema["example"]
+    kind = schema.get("type")
+    if kind == "object" or "properties" in schema:
+        return {k: example_for(v) for k, v in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [example_for(schema.get("items", {}))]
+    if "enum" in schema:
+        return schema["enum"][0]
+    return {"integer": 0, "number": 0, "boolean": False, "string": ""}.get(kind)
+
+
+def build_routes(spec=None):
+    """``[(METHOD, regex, template, status, body_bytes)]`` with literal paths first."""
+    spec = spec or load_spec()
+    routes = []
+    for template, operations in spec["paths"].items():
+        regex = template_regex(template)
+        for method, operation in operations.items():
+            responses = operation.get("responses", {})
+            status = next((s for s in sorted(responses) if s.startswith("2")), "200")
+            content = responses.get(status, {}).get("content", {})
+            schema = content.get("application/json", {}).get("schema", {})
+            body = json.dumps(example_for(schema)).encode()
+            routes.append((method.upper(), regex, template, int(status), body))
+    routes.sort(key=lambda r: r[2].count("{"))
+    return routes
+
+
+def resolve(routes, method, path):
+    """(status, body bytes) the mock answers ``method path`` with."""
+    route = urlsplit(path).path
+    for route_method, regex, _, status, body in routes:
+        if route_method == method and regex.match(route):
+            return status, body
+    return 404, json.dumps(NOT_FOUND).encode()
+
+
+class ResetFlow:
+    """Issues reset tokens by email and redeems each once; see module docstring."""
+
+    def __init__(self, smtp):
+        self.smtp = smtp
+        self.tokens = {}
+        self._lock = threading.Lock()
+
+    def forgot(self, body):
+        address = json.loads(body or b"{}").get("email", "")
+        token = secrets.token_urlsafe(24)
+        with self._lock:
+            self.tokens[token] = address
+        message = EmailMessage()
+        message["From"] = "no-reply@vut.local"
+        message["To"] = address
+        message["Subject"] = "Reset your password"
+        message.set_content(f"Reset your password: {RESET_LINK.format(token)}")
+        with smtplib.SMTP(*self.smtp, timeout=10) as smtp:
+            smtp.send_message(message)
+
+    def redeem(self, authorization):
+        token = (authorization or "").removeprefix("Bearer ").strip()
+        with self._lock:
+            return self.tokens.pop(token, None) is not None
+
+
+def answer(routes, reset_flow, method, path, authorization, request_body):
+    """(status, body bytes) for one request, including the stateful reset flow."""
+    status, body = resolve(routes, method, path)
+    route = urlsplit(path).path
+    if reset_flow is not None and method == "POST":
+        if route == "/api/password/forgot":
+            reset_flow.forgot(request_body)
+        elif route == "/api/password/reset" and not reset_flow.redeem(authorization):
+            status, body = 401, json.dumps(INVALID_RESET_TOKEN).encode()
+    return status, body
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    routes = []
+    reset_flow = None
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; don't let Nagle hold the body.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _respond(self):
+        start = time.perf_counter()
+        length = int(self.headers.get("Content-Length") or 0)
+        request_body = self.rfile.read(length) if length else b""
+        status, body = answer(
+            self.routes,
+            self.reset_flow,
+            self.command,
+            self.path,
+            self.headers.get("Authorization"),
+            request_body,
+        )
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Server-Timing", f"total;dur={(time.perf_counter() - start) * 1000:.3f}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def _read_body(reader, headers):
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            chunk = await reader.readexactly(size + 2)
+            if not size:
+                return b"".join(chunks)
+            chunks.append(chunk[:-2])
+    length = int(headers.get("content-length") or 0)
+    return await reader.readexactly(length) if length else b""
+
+
+async def _serve_connection(reader, writer, routes, reset_flow):
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                return
+            method, target, version = request_line.decode("latin-1").split()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            start = time.perf_counter()
+            request_body = await _read_body(reader, headers)
+            args = (routes, reset_flow, method, target, headers.get("authorization"), request_body)
+            if reset_flow is not None:
+                # Sending the reset email blocks; keep it off the event loop.
+                status, body = await asyncio.to_thread(answer, *args)
+            else:
+                status, body = answer(*args)
+            close = headers.get("connection", "").lower() == "close" or version == "HTTP/1.0"
+            writer.write(
+                (
+                    f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Server-Timing: total;dur={(time.perf_counter() - start) * 1000:.3f}\r\n"
+                    + ("Connection: close\r\n" if close else "")
+                    + "\r\n"
+                ).encode("latin-1")
+                + body
+            )
+            await writer.drain()
+            if close:
+                return
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+def _h2_send(connection, stream_id, status, body, start):
+    connection.send_headers(
+        stream_id,
+        [
+            (":status", str(status)),
+            ("content-type", "application/json; charset=utf-8"),
+            ("content-length", str(len(body))),
+            ("server-timing", f"total;dur={(time.perf_counter() - start) * 1000:.3f}"),
+        ],
+    )
+    # Example bodies are far below the default 64 KiB flow-control window, so
+    # only the frame size limits how they are split.
+    size = connection.max_outbound_frame_size
+    for offset in range(0, len(body), size):
+        connection.send_data(stream_id, body[offset : offset + size])
+    connection.end_stream(stream_id)
+
+
+async def _serve_h2_connection(reader, writer, routes, reset_flow):
+    from h2.config import H2Configuration
+    from h2.connection import H2Connection
+    from h2.events import ConnectionTerminated, DataReceived, RequestReceived, StreamEnded
+    from h2.exceptions import ProtocolError
+
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    connection = H2Connection(H2Configuration(client_side=False, header_encoding="utf-8"))
+    connection.initiate_connection()
+    writer.write(connection.data_to_send())
+    # stream id -> (request headers, body chunks, start time)
+    streams = {}
+    try:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            for event in connection.receive_data(data):
+                if isinstance(event, RequestReceived):
+                    streams[event.stream_id] = (dict(event.headers), [], time.perf_counter())
+                elif isinstance(event, DataReceived):
+                    streams[event.stream_id][1].append(event.data)
+                    connection.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, StreamEnded):
+                    headers, chunks, start = streams.pop(event.stream_id)
+                    args = (
+                        routes,
+                        reset_flow,
+                        headers[":method"],
+                        headers[":path"],
+                        headers.get("authorization"),
+                        b"".join(chunks),
+                    )
+                    if reset_flow is not None:
+                        status, body = await asyncio.to_thread(answer, *args)
+                    else:
+                        status, body = answer(*args)
+                    _h2_send(connection, event.stream_id, status, body, start)
+                elif isinstance(event, ConnectionTerminated):
+                    writer.write(connection.data_to_send())
+                    return
+            writer.write(connection.data_to_send())
+            await writer.drain()
+    except (ConnectionError, ProtocolError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _serve_async(sock, routes, reset_flow, stopped=None, http2=False):
+    writers = set()
+    serve = _serve_h2_connection if http2 else _serve_connection
+
+    async def client(reader, writer):
+        writers.add(writer)
+        try:
+            await serve(reader, writer, routes, reset_flow)
+        finally:
+            writers.discard(writer)
+
+    server = await asyncio.start_server(client, sock=sock)
+    async with server:
+        if stopped is None:
+            await server.serve_forever()
+        else:
+            await stopped.wait()
+    # Closing idle keep-alive connections lets their handlers see EOF and
+    # finish while the loop still runs.
+    for writer in list(writers):
+        writer.close()
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _async_worker(sock, routes, http2):
+    try:
+        asyncio.run(_serve_async(sock, routes, None, http2=http2))
+    except KeyboardInterrupt:
+        pass
+
+
+class MockServer:
+    """Mock backend; use as a context manager and read ``.url``.
+
+    ``mode``, ``workers`` and ``http2`` are described in the module
+    docstring; the stateful reset flow (``smtp``) needs a single worker.
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        spec=None,
+        smtp=None,
+        mode="threaded",
+        workers=1,
+        http2=False,
+    ):
+        if mode not in ("threaded", "async"):
+            raise ValueError(f"Unknown mock server mode {mode!r}; use 'threaded' or 'async'")
+        if workers > 1 and (mode != "async" or smtp):
+            raise ValueError("workers > 1 needs mode='async' and no smtp")
+        if http2:
+            if mode != "async":
+                raise ValueError("http2 needs mode='async'")
+            if importlib.util.find_spec("h2") is None:
+                raise RuntimeError('The HTTP/2 mock needs: pip install "httpx[http2]"')
+        self.mode = mode
+        self.workers = workers
+        self.http2 = http2
+        self.reset_flow = ResetFlow(smtp) if smtp else None
+        self.routes = build_routes(spec)
+        self.httpd = self._sock = None
+        if mode == "threaded":
+            handler = type(
+                "BoundMockHandler",
+                (MockHandler,),
+                {"routes": self.routes, "reset_flow": self.reset_flow},
+            )
+            self.httpd = ThreadingHTTPServer((host, port), handler)
+            self.httpd.daemon_threads = True
+            self._address = self.httpd.server_address[:2]
+        else:
+            self._sock = socket.create_server((host, port), backlog=1024)
+            self._address = self._sock.getsockname()[:2]
+        self._thread = None
+        self._loop = self._stopped = None
+        self._processes = []
+
+    @property
+    def url(self):
+        host, port = self._address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        if self.httpd is not None:
+            self._thread = threading.Thread(
+                target=self.httpd.serve_forever, name="mock-server", daemon=True
+            )
+            self._thread.start()
+        elif self.workers > 1:
+            # Forked children inherit the listening socket and the kernel
+            # spreads accepted connections across them.
+            context = multiprocessing.get_context("fork")
+            for i in range(self.workers):
+                process = context.Process(
+                    target=_async_worker,
+                    args=(self._sock, self.routes, self.http2),
+                    name=f"mock-server-{i}",
+                    daemon=True,
+                )
+                process.start()
+                self._processes.append(process)
+        else:
+            self._loop = asyncio.new_event_loop()
+            self._stopped = asyncio.Event()
+            self._thread = threading.Thread(
+                target=self._loop.run_until_complete,
+                args=(
+                    _serve_async(
+                        self._sock, self.routes, self.reset_flow, self._stopped, self.http2
+                    ),
+                ),
+                name="mock-server",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            return
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+            self._thread.join()
+            self._loop.close()
+        for process in self._processes:
+            process.terminate()
+            process.join()
+        self._sock.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--smtp", metavar="HOST:PORT", help="Mail reset links there")
+    parser.add_argument("--mode", choices=("threaded", "async"), default="threaded")
+    parser.add_argument("--workers", type=int, default=1, help="Processes (async mode only)")
+    parser.add_argument(
+        "--http2", action="store_true", help="Cleartext HTTP/2, prior knowledge (async mode only)"
+    )
+    args = parser.parse_args(argv)
+
+    smtp = None
+    if args.smtp:
+        host, _, port = args.smtp.rpartition(":")
+        smtp = (host or "127.0.0.1", int(port))
+    server = MockServer(
+        args.host, args.port, smtp=smtp, mode=args.mode, workers=args.workers, http2=args.http2
+    )
+    protocol = "h2c" if args.http2 else "HTTP/1.1"
+    print(
+        f"Mock VUT backend on {server.url} ({args.mode}, {protocol}, {args.workers} worker(s))"
+    )
+    server.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
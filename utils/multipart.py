@@ -0,0 +1,176 @@
+import io
+import os
+import uuid
+
+CRLF = b"\r\n"
+
+
+def _guess_filename(obj):
+    # Same rule as requests.utils.guess_filename.
+    name = getattr(obj, "name", None)
+    if name and isinstance(name, str) and name[0] != "<" and name[-1] != ">":
+        return os.path.basename(name)
+    return None
+
+
+def _quote(value):
+    # Same HTML5-style escaping urllib3 applies to multipart header params.
+    return (
+        value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+    )
+
+
+class _FilePart:
+    """Body of a part backed by an open file, read lazily from its current offset."""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.start = fileobj.tell()
+        try:
+            self.length = os.fstat(fileobj.fileno()).st_size - self.start
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            self.length = fileobj.seek(0, os.SEEK_END) - self.start
+            fileobj.seek(self.start)
+        self.sent = 0
+
+
+class MultipartEncoder:
+    """Streams a multipart/form-data body without buffering file contents.
+
+    Accepts the same ``files`` mapping ``requests`` does, e.g.
+    ``{"recordingId": (None, "session_1"), "videoChunks": ("a.mp4", fh, "video/mp4")}``.
+    In-memory values are sent as ``memoryview`` slices and open files are read
+    in ``chunk_size`` blocks into one reusable buffer, so client memory stays
+    constant regardless of the upload size. The total length is known up front,
+    which lets ``requests`` send a plain ``Content-Length`` body.
+
+    The bytes match what ``requests`` would send for the same ``files`` and
+    boundary. ``tell``/``seek(0)`` let requests (redirects) and urllib3
+    (retries) rewind the body, and iterating always starts from the beginning;
+    a part backed by an unseekable file cannot be resent.
+    """
+
+    def __init__(self, fields, boundary=None, chunk_size=64 * 1024):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self._buffer = bytearray(chunk_size)
+        self._segments = self._build(fields)
+        self._length = sum(
+            seg.length if isinstance(seg, _FilePart) else len(seg)
+            for seg in self._segments
+        )
+        self._index = 0
+        self._offset = 0
+        self._position = 0
+
+    @property
+    def content_type(self):
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _build(self, fields):
+        items = fields.items() if hasattr(fields, "items") else fields
+        boundary = self.boundary.encode("ascii")
+        segments = []
+        for name, value in items:
+            if isinstance(value, (tuple, list)):
+                filename, content, content_type, extra = (
+                    tuple(value) + (None, None)
+                )[:4]
+            else:
+                # requests names bare values after their file, or the field.
+                filename = _guess_filename(value) or name
+                content, content_type, extra = value, None, None
+            if content is None:
+                continue
+
+            header = f'Content-Disposition: form-data; name="{_quote(name)}"'
+            if filename is not None:
+                header += f'; filename="{_quote(filename)}"'
+            if content_type is not None:
+                header += f"\r\nContent-Type: {content_type}"
+            for key, val in (extra or {}).items():
+                header += f"\r\n{key}: {val}"
+            segments.append(
+                b"--" + boundary + CRLF + header.encode("utf-8") + CRLF + CRLF
+            )
+
+            if hasattr(content, "read"):
+                segments.append(_FilePart(content))
+            elif isinstance(content, str):
+                segments.append(memoryview(content.encode("utf-8")))
+            else:
+                segments.append(memoryview(content))
+            segments.append(CRLF)
+        segments.append(b"--" + boundary + b"--" + CRLF)
+        return [
+            seg if isinstance(seg, (_FilePart, memoryview)) else memoryview(seg)
+            for seg in segments
+        ]
+
+    def __len__(self):
+        return self._length
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Rewind to the start of the body; no other position is supported."""
+        if offset != 0 or whence != os.SEEK_SET:
+            raise io.UnsupportedOperation("MultipartEncoder can only seek to the start")
+        for seg in self._segments:
+            if isinstance(seg, _FilePart):
+                seg.fileobj.seek(seg.start)
+                seg.sent = 0
+        self._index = 0
+        self._offset = 0
+        self._position = 0
+        return 0
+
+    def __iter__(self):
+        """The whole body from the start, as ``bytes`` chunks (for httpx)."""
+        self.seek(0)
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield bytes(chunk)
+
+    def read(self, size=-1):
+        """Return the next slice of the body, at most ``size`` bytes.
+
+        Like a raw socket read this may return fewer bytes than asked for. File
+        data is returned as a view over an internal buffer that is reused by the
+        next call, so callers must send or copy it before reading again.
+        """
+        if size == 0:
+            # Otherwise a file part would look finished and be skipped.
+            return b""
+        while self._index < len(self._segments):
+            seg = self._segments[self._index]
+            if isinstance(seg, _FilePart):
+                remaining = seg.length - seg.sent
+                want = min(remaining, self.chunk_size)
+                if size is not None and size >= 0:
+                    want = min(want, size)
+                if want > 0:
+                    view = memoryview(self._buffer)[:want]
+                    n = seg.fileobj.readinto(view)
+                    if not n:
+                        raise IOError(
+                            f"{getattr(seg.fileobj, 'name', 'file')} shrank while "
+                            "being uploaded"
+                        )
+                    seg.sent += n
+                    self._position += n
+                    return view[:n]
+            else:
+                remaining = len(seg) - self._offset
+                if remaining > 0:
+                    end = len(seg) if size is None or size < 0 else self._offset + size
+                    chunk = seg[self._offset : end]
+                    self._offset += len(chunk)
+                    self._position += len(chunk)
+                    return chunk
+            self._index += 1
+            self._offset = 0
+        return b""
@@ -0,0 +1,49 @@
+"""Oversized JSON request bodies for payload-size stress curves.
+
+Each shape takes a valid base payload and returns the encoded body (bytes)
+grown to roughly ``size`` bytes:
+
+  long_field     one declared string field padded to the size
+  unknown_field  a field the schema doesn't declare, padded to the size
+  nested         an undeclared field holding ``{"a":{"a":...}}`` nested until
+                 the size is reached; built as text because json.dumps
+                 recurses and fails past ~1000 levels
+
+Send them with ``data=`` and a JSON Content-Type, not ``json=``.
+"""
+
+import json
+
+KIB = 1024
+SIZES = (KIB, 16 * KIB, 128 * KIB, 1024 * KIB, 4096 * KIB)
+UNKNOWN_FIELD = "unexpectedField"
+_NEST_LEVEL = len('{"a":}')
+
+
+def _encode(payload):
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _with_raw_field(payload, field, raw):
+    base = {k: v for k, v in payload.items() if k != field}
+    prefix = _encode(base)[:-1] + (b"," if base else b"")
+    return prefix + json.dumps(field).encode() + b":" + raw + b"}"
+
+
+def long_field(payload, field, size):
+    padding = max(1, size - len(_encode(payload)))
+    return _encode({**payload, field: "x" * padding})
+
+
+def unknown_field(payload, field, size):
+    padding = max(1, size - len(_encode(payload)) - len(UNKNOWN_FIELD) - 6)
+    return _encode({**payload, UNKNOWN_FIELD: "x" * padding})
+
+
+def nested(payload, field, size):
+    depth = max(1, (size - len(_encode(payload))) // _NEST_LEVEL)
+    raw = b'{"a":' * depth + b"0" + b"}" * depth
+    return _with_raw_field(payload, UNKNOWN_FIELD, raw)
+
+
+SHAPES = {"long_field": long_field, "unknown_field": unknown_field, "nested": nested}
@@ -0,0 +1,154 @@
+"""Render latency trends stored by the test runs.
+
+    python -m utils.perf_trends --last 20
+    python -m utils.perf_trends --endpoint /api/video/list --html trends.html
+"""
+
+import argparse
+import html
+import sys
+import time
+from collections import OrderedDict
+
+from utils.results_store import DEFAULT_DB_PATH, ResultStore
+
+
+def group_history(rows):
+    series = OrderedDict()
+    for row in rows:
+        series.setdefault(f"{row['method']} {row['endpoint']}", []).append(row)
+    return series
+
+
+def _fmt(value, spec=".1f"):
+    return "-" if value is None else format(value, spec)
+
+
+def render_table(series, metric="p95_ms", threshold=0.2):
+    """Plain-text trend table; ``!`` marks a change beyond ``threshold`` vs the previous run."""
+    lines = []
+    for name, rows in series.items():
+        lines.append(name)
+        lines.append(
+            f"  {'run':>5} {'date':<16} {'sha':<10} {'backend':<14}"
+            f" {'count':>6} {'err':>4} {'p50':>8} {'p95':>8} {'p99':>8}"
+            f" {'server':>8} {'network':>8}  change"
+        )
+        previous = None
+        for row in rows:
+            change = ""
+            value = row[metric]
+            if previous not in (None, 0) and value is not None:
+                delta = (value - previous) / previous
+                change = f"{delta:+.0%}" + (" !" if abs(delta) > threshold else "")
+            previous = value
+            lines.append(
+                f"  {row['run_id']:>5}"
+                f" {time.strftime('%Y-%m-%d %H:%M', time.localtime(row['started_at'])):<16}"
+                f" {(row['git_sha'] or '-')[:10]:<10} {(row['backend_version'] or '-')[:14]:<14}"
+                f" {row['count']:>6} {row['errors']:>4} {_fmt(row['p50_ms']):>8}"
+                f" {_fmt(row['p95_ms']):>8} {_fmt(row['p99_ms']):>8}"
+                f" {_fmt(row['server_p50_ms']):>8} {_fmt(row['network_p50_ms']):>8}  {change}"
+            )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def render_run_metrics(metrics):
+    """Trend of run-level numbers such as ``startup.first_test_ms``."""
+    lines = []
+    for name, values in metrics.items():
+        lines.append(name)
+        lines.extend(
+            f"  {run_id:>5} {(sha or '-')[:10]:<10} {_fmt(value):>10}"
+            for run_id, sha, value in values
+        )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _svg_chart(rows, metrics=("p50_ms", "p95_ms"), width=640, height=200, pad=36):
+    colors = {"p50_ms": "#2b7bb9", "p95_ms": "#d9534f", "p99_ms": "#8e44ad"}
+    values = [row[m] for row in rows for m in metrics if row[m] is not None]
+    top = max(values) if values else 1
+    step = (width - 2 * pad) / max(len(rows) - 1, 1)
+
+    def point(i, value):
+        x = pad + i * step
+        y = height - pad - (value / top) * (height - 2 * pad) if top else height - pad
+        return f"{x:.1f},{y:.1f}"
+
+    parts = [
+        f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">',
+        f'<line x1="{pad}" y1="{height - pad}" x2="{width - pad}" y2="{height - pad}" stroke="#999"/>',
+        f'<line x1="{pad}" y1="{pad}" x2="{pad}" y2="{height - pad}" stroke="#999"/>',
+        f'<text x="4" y="{pad}" font-size="10">{top:.0f} ms</text>',
+    ]
+    for metric in metrics:
+        points = [point(i, r[metric]) for i, r in enumerate(rows) if r[metric] is not None]
+        parts.append(
+            f'<polyline fill="none" stroke="{colors.get(metric, "#333")}"'
+            f' stroke-width="2" points="{" ".join(points)}"/>'
+        )
+    for i, row in enumerate(rows):
+        x = pad + i * step
+        label = html.escape(row["git_sha"] or str(row["run_id"]))
+        parts.append(
+            f'<text x="{x:.1f}" y="{height - pad + 14}" font-size="9"'
+            f' text-anchor="middle">{label[:7]}</text>'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def render_html(series, title="VUT API latency trends"):
+    sections = []
+    for name, rows in series.items():
+        versions = ", ".join(
+            OrderedDict.fromkeys(html.escape(r["backend_version"] or "-") for r in rows)
+        )
+        sections.append(
+            f"<h2>{html.escape(name)}</h2><p>backend: {versions}"
+            " &mdash; <span style='color:#2b7bb9'>p50</span>"
+            " / <span style='color:#d9534f'>p95</span></p>"
+            + _svg_chart(rows)
+        )
+    return (
+        f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{title}</title>"
+        "<style>body{font-family:sans-serif;margin:2em}</style></head>"
+        f"<body><h1>{title}</h1>{''.join(sections)}</body></html>"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    parser.add_argument("--endpoint", help="Only show this spec path, e.g. /api/video/{id}")
+    parser.add_argument("--last", type=int, default=20, help="Number of runs to include")
+    parser.add_argument("--metric", default="p95_ms", help="Column used for change detection")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--html", help="Also write an HTML chart to this path")
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.db)
+    try:
+        series = group_history(store.history(args.endpoint, args.last))
+        run_metrics = store.run_metrics(args.last)
+    finally:
+        store.close()
+    if not series:
+        print(f"No runs recorded in {args.db}")
+        return 1
+
+    print(render_table(series, args.metric, args.threshold))
+    if run_metrics and not args.endpoint:
+        print(render_run_metrics(run_metrics))
+    if args.html:
+        with open(args.html, "w", encoding="utf-8") as f:
+            f.write(render_html(series))
+        print(f"Wrote {args.html}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""Opt-in CPU and memory profiling of the client side of a run.
+
+    profiler = ClientProfiler("perf-results/profile").start()
+    ...  # tests, load runs
+    paths = profiler.stop()
+
+Writes into a per-run directory:
+  client.prof       cProfile stats of the main thread and every load worker
+                    (pstats / snakeviz)
+  client-top.txt    the same, top functions by cumulative time
+  client.folded     sampled stacks of all threads in collapsed format, one
+                    "frame;frame;frame count" line per stack, as written by
+                    ``py-spy record --format raw``; feed it to flamegraph.pl
+                    or speedscope
+  alloc-top.txt     tracemalloc: allocation growth over the run and the
+                    largest live allocation sites, top N each
+
+Sampled stacks are rooted at the thread name and any active ``marker``
+labels, e.g. ``MainThread;[http GET];...`` for time inside APIClient calls.
+cProfile slows the profiled threads severalfold, so compare where time goes
+within a profiled run, not its throughput against an unprofiled one.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+_active = None
+
+
+def active():
+    """The running ClientProfiler, or None (the usual case)."""
+    return _active
+
+
+@contextmanager
+def marker(label):
+    """Tag samples taken inside the block; a no-op when no profiler runs."""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    stack = profiler._markers.setdefault(threading.get_ident(), [])
+    stack.append(label)
+    try:
+        yield
+    finally:
+        stack.pop()
+
+
+class ClientProfiler:
+    """cProfile, stack sampling and tracemalloc for one run; see module docstring."""
+
+    def __init__(self, output_dir, interval=0.01, top=25, memory=True, line_numbers=False):
+        self.output_dir = os.path.join(output_dir, time.strftime("%Y%m%d-%H%M%S"))
+        self.interval = interval
+        self.top = top
+        self.memory = memory
+        self.line_numbers = line_numbers
+        self.samples = Counter()
+        self._markers = {}
+        self._profiles = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._main = cProfile.Profile()
+        self._sampler = None
+        self._baseline = None
+        self._names = {}
+        # Longest first, so site-packages wins over the interpreter prefix.
+        self._prefixes = sorted(
+            {os.getcwd() + os.sep, *(p + os.sep for p in sys.path if p)}, key=len, reverse=True
+        )
+
+    def start(self):
+        global _active
+        _active = self
+        if self.memory:
+            # One frame per trace is all the lineno statistics need and keeps
+            # tracemalloc's overhead low.
+            tracemalloc.start(1)
+            self._baseline = tracemalloc.take_snapshot()
+        self._sampler = threading.Thread(target=self._sample, name="profiler-sampler", daemon=True)
+        self._sampler.start()
+        self._main.enable()
+        return self
+
+    @contextmanager
+    def thread_profile(self):
+        """cProfile the current (worker) thread for the duration of the block."""
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                self._profiles.append(profile)
+
+    def _frame_name(self, code, lineno):
+        key = (code, lineno)
+        name = self._names.get(key)
+        if name is None:
+            filename = code.co_filename
+            for prefix in self._prefixes:
+                if filename.startswith(prefix):
+                    filename = filename[len(prefix):]
+                    break
+            where = f"{filename}:{lineno}" if lineno is not None else filename
+            name = self._names[key] = f"{code.co_name} ({where})"
+        return name
+
+    def _stack(self, frame):
+        frames = []
+        while frame is not None:
+            frames.append(
+                self._frame_name(frame.f_code, frame.f_lineno if self.line_numbers else None)
+            )
+            frame = frame.f_back
+        return frames[::-1]
+
+    def _sample(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                markers = [f"[{m}]" for m in self._markers.get(ident, ())]
+                stack = [names.get(ident, str(ident)), *markers, *self._stack(frame)]
+                self.samples[";".join(stack)] += 1
+
+    def stop(self):
+        """Stop profiling and write the reports; returns ``{report: path}``."""
+        global _active
+        self._main.disable()
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        _active = None
+        os.makedirs(self.output_dir, exist_ok=True)
+        paths = {}
+        if self.memory:
+            # Before building the reports below, so their allocations don't show.
+            snapshot = tracemalloc.take_snapshot()
+            report = self._allocation_report(snapshot, *tracemalloc.get_traced_memory())
+            tracemalloc.stop()
+            paths["alloc_top"] = self._write("alloc-top.txt", report)
+
+        stats = pstats.Stats(self._main)
+        for profile in self._profiles:
+            stats.add(profile)
+        paths["cprofile"] = os.path.join(self.output_dir, "client.prof")
+        stats.dump_stats(paths["cprofile"])
+        text = io.StringIO()
+        pstats.Stats(paths["cprofile"], stream=text).sort_stats("cumulative").print_stats(self.top)
+        paths["cprofile_top"] = self._write("client-top.txt", text.getvalue())
+
+        paths["folded"] = self._write(
+            "client.folded",
+            "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common()),
+        )
+        return paths
+
+    def _allocation_report(self, snapshot, current, peak):
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+        ]
+        snapshot = snapshot.filter_traces(filters)
+        lines = [f"Allocation growth since start (top {self.top})"]
+        for stat in snapshot.compare_to(self._baseline.filter_traces(filters), "lineno")[: self.top]:
+            lines.append(f"  {stat}")
+        lines += ["", f"Largest live allocation sites (top {self.top})"]
+        for stat in snapshot.statistics("lineno")[: self.top]:
+            lines.append(f"  {stat}")
+        lines += ["", f"Traced memory: current {current / 1024:.0f} KiB, peak {peak / 1024:.0f} KiB"]
+        return "\n".join(lines) + "\n"
+
+    def _write(self, name, text):
+        path = os.path.join(self.output_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
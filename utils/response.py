@@ -0,0 +1,76 @@
+import json
+import os
+
+
+def _pick_loads(preferred=None):
+    """Fastest available JSON decoder: orjson, then ujson, then the stdlib."""
+    candidates = [preferred] if preferred else ["orjson", "ujson", "json"]
+    for name in candidates:
+        if name == "json":
+            return "json", json.loads
+        try:
+            module = __import__(name)
+        except ImportError:
+            continue
+        return name, module.loads
+    return "json", json.loads
+
+
+JSON_BACKEND, _loads = _pick_loads(os.environ.get("VUT_JSON_BACKEND"))
+
+_UNSET = object()
+
+
+class APIResponse:
+    """``requests.Response`` proxy whose ``json()`` parses the body only once.
+
+    Tests typically call ``response.json()`` for logging and again for each
+    assertion block; every call after the first returns the cached object, so
+    treat it as read-only. Everything else is delegated to the wrapped response.
+    """
+
+    __slots__ = ("_response", "_json")
+
+    def __init__(self, response):
+        self._response = response
+        self._json = _UNSET
+
+    @property
+    def raw_response(self):
+        return self._response
+
+    def json(self, **kwargs):
+        if kwargs:
+            return self._response.json(**kwargs)
+        if self._json is _UNSET:
+            try:
+                self._json = _loads(self._response.content)
+            except (ValueError, TypeError):
+                # Non-UTF-8 or invalid bodies: let requests decode them, or
+                # raise its usual requests.exceptions.JSONDecodeError.
+                self._json = self._response.json()
+        return self._json
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def __setattr__(self, name, value):
+        if name in APIResponse.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._response, name, value)
+
+    def __bool__(self):
+        return bool(self._response)
+
+    def __iter__(self):
+        return iter(self._response)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._response.close()
+
+    def __repr__(self):
+        return repr(self._response)
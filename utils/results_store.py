@@ -0,0 +1,172 @@
+import os
+import sqlite3
+import subprocess
+import time
+
+from utils.spec import spec_version
+
+DEFAULT_DB_PATH = os.environ.get("VUT_RESULTS_DB", "perf-results/results.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    git_sha TEXT,
+    backend_version TEXT,
+    base_url TEXT,
+    label TEXT
+);
+CREATE TABLE IF NOT EXISTS endpoint_stats (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    method TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    mean_ms REAL,
+    p50_ms REAL,
+    p95_ms REAL,
+    p99_ms REAL,
+    max_ms REAL,
+    throughput_rps REAL,
+    request_bytes INTEGER,
+    response_bytes INTEGER,
+    server_p50_ms REAL,
+    network_p50_ms REAL
+);
+CREATE TABLE IF NOT EXISTS run_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    name TEXT NOT NULL,
+    value REAL
+);
+CREATE INDEX IF NOT EXISTS idx_endpoint_stats_endpoint
+    ON endpoint_stats(method, endpoint, run_id);
+"""
+
+STAT_COLUMNS = (
+    "method",
+    "endpoint",
+    "count",
+    "errors",
+    "mean_ms",
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "max_ms",
+    "throughput_rps",
+    "request_bytes",
+    "response_bytes",
+    "server_p50_ms",
+    "network_p50_ms",
+)
+
+
+def git_sha():
+    if os.environ.get("GIT_SHA"):
+        return os.environ["GIT_SHA"]
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def backend_version():
+    """Backend build under test; set VUT_BACKEND_VERSION from the deploy pipeline."""
+    return os.environ.get("VUT_BACKEND_VERSION") or f"spec-{spec_version()}"
+
+
+class ResultStore:
+    """Append-only SQLite history of per-endpoint statistics, one row set per run."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """Add endpoint_stats columns introduced after a database was created."""
+        existing = {row["name"] for row in self.conn.execute("PRAGMA table_info(endpoint_stats)")}
+        with self.conn:
+            for column in STAT_COLUMNS:
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE endpoint_stats ADD COLUMN {column} REAL")
+
+    def close(self):
+        self.conn.close()
+
+    def add_run(self, stats, base_url=None, label=None, started_at=None, metrics=None):
+        """Store one run; ``metrics`` holds run-level numbers such as startup time."""
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (started_at, git_sha, backend_version, base_url, label)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    started_at or time.time(),
+                    git_sha(),
+                    backend_version(),
+                    base_url,
+                    label,
+                ),
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                f"INSERT INTO endpoint_stats (run_id, {', '.join(STAT_COLUMNS)})"
+                f" VALUES (?, {', '.join('?' for _ in STAT_COLUMNS)})",
+                [(run_id, *(row[c] for c in STAT_COLUMNS)) for row in stats],
+            )
+            self.conn.executemany(
+                "INSERT INTO run_metrics (run_id, name, value) VALUES (?, ?, ?)",
+                [(run_id, name, value) for name, value in (metrics or {}).items()],
+            )
+        return run_id
+
+    def runs(self, limit=None):
+        query = "SELECT * FROM runs ORDER BY run_id DESC"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        return list(reversed(self.conn.execute(query).fetchall()))
+
+    def history(self, endpoint=None, limit=None):
+        """Endpoint stats joined with their run, oldest run first."""
+        run_ids = [r["run_id"] for r in self.runs(limit)]
+        if not run_ids:
+            return []
+        query = (
+            "SELECT r.run_id, r.started_at, r.git_sha, r.backend_version, r.label, s.*"
+            " FROM endpoint_stats s JOIN runs r USING (run_id)"
+            f" WHERE r.run_id IN ({', '.join('?' for _ in run_ids)})"
+        )
+        params = list(run_ids)
+        if endpoint:
+            query += " AND s.endpoint = ?"
+            params.append(endpoint)
+        query += " ORDER BY s.method, s.endpoint, r.run_id"
+        return self.conn.execute(query, params).fetchall()
+
+    def run_metrics(self, limit=None):
+        """``{name: [(run_id, git_sha, value), ...]}`` for the last ``limit`` runs."""
+        run_ids = [r["run_id"] for r in self.runs(limit)]
+        if not run_ids:
+            return {}
+        rows = self.conn.execute(
+            "SELECT m.name, m.run_id, r.git_sha, m.value"
+            " FROM run_metrics m JOIN runs r USING (run_id)"
+            f" WHERE m.run_id IN ({', '.join('?' for _ in run_ids)})"
+            " ORDER BY m.name, m.run_id",
+            run_ids,
+        ).fetchall()
+        metrics = {}
+        for row in rows:
+            metrics.setdefault(row["name"], []).append(
+                (row["run_id"], row["git_sha"], row["value"])
+            )
+        return metrics
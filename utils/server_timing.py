@@ -0,0 +1,75 @@
+import re
+
+# Header name -> unit of its bare numeric value, in order of preference.
+RESPONSE_TIME_HEADERS = (
+    ("X-Response-Time", "ms"),  # express response-time middleware: "12.345ms"
+    ("X-Envoy-Upstream-Service-Time", "ms"),
+    ("X-Runtime", "s"),
+    ("X-Process-Time", "s"),
+)
+UNITS_MS = {"ms": 1.0, "s": 1000.0, "us": 0.001, "µs": 0.001}
+_DURATION = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*(ms|s|us|µs)?\s*$")
+
+
+def parse_server_timing(value):
+    """``Server-Timing`` header -> ``{metric: duration_ms}``.
+
+    ``db;dur=53, app;desc="App";dur=47.2, cache`` gives
+    ``{"db": 53.0, "app": 47.2, "cache": None}``.
+    """
+    metrics = {}
+    for entry in (value or "").split(","):
+        name, *params = [p.strip() for p in entry.split(";")]
+        if not name:
+            continue
+        duration = None
+        for param in params:
+            key, _, raw = param.partition("=")
+            if key.strip().lower() == "dur":
+                try:
+                    duration = float(raw.strip().strip('"'))
+                except ValueError:
+                    pass
+        metrics[name] = duration
+    return metrics
+
+
+def parse_duration_ms(value, default_unit="ms"):
+    """``"12.3ms"``, ``"0.0123s"`` or ``"12.3"`` (in ``default_unit``) -> milliseconds."""
+    match = _DURATION.match(value or "")
+    if not match:
+        return None
+    return float(match.group(1)) * UNITS_MS[match.group(2) or default_unit]
+
+
+def server_time_ms(headers):
+    """Time the backend reports spending on a request, or None if it doesn't say.
+
+    Prefers a ``total`` Server-Timing metric, then the single-value headers in
+    RESPONSE_TIME_HEADERS, then the sum of the Server-Timing metrics.
+    """
+    timing = parse_server_timing(headers.get("Server-Timing"))
+    if timing.get("total") is not None:
+        return timing["total"]
+    for name, unit in RESPONSE_TIME_HEADERS:
+        value = parse_duration_ms(headers.get(name), unit)
+        if value is not None:
+            return value
+    durations = [d for d in timing.values() if d is not None]
+    return sum(durations) if durations else None
+
+
+def split_latency(response, elapsed):
+    """``(ttfb_ms, server_ms, network_ms)`` for one response.
+
+    TTFB is requests' ``response.elapsed`` (request sent until headers
+    parsed) when available, else the client-measured ``elapsed`` seconds.
+    Network time is what remains of TTFB after the server's own time;
+    server and network are None when the backend sends no timing header.
+    """
+    measured = getattr(response, "elapsed", None)
+    ttfb_ms = (measured.total_seconds() if measured is not None else elapsed) * 1000
+    server_ms = server_time_ms(response.headers)
+    if server_ms is None:
+        return ttfb_ms, None, None
+    return ttfb_ms, server_ms, max(0.0, ttfb_ms - server_ms)
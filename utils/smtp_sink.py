@@ -0,0 +1,225 @@
+"""Local SMTP server that keeps every message instead of delivering it.
+
+    python -m utils.smtp_sink --port 2525
+
+Point the backend's mailer at it (for a locally run backend, SMTP host
+127.0.0.1, the sink's port, no TLS or auth; for utils.mock_server pass
+``smtp=sink.address``) and password-reset emails land in ``sink.messages``
+where tests can read the reset token:
+
+    with SmtpSink() as sink:
+        ...  # POST /api/password/forgot
+        mail = sink.wait_for("user@example.com")
+        token = extract_reset_token(mail["message"])
+
+Speaks just enough SMTP (HELO/EHLO, MAIL, RCPT, DATA, RSET, NOOP, QUIT) for
+nodemailer and smtplib; STARTTLS and AUTH are not offered.
+"""
+
+import argparse
+import email
+import email.policy
+import re
+import socketserver
+import sys
+import threading
+import time
+
+# Reset links look like .../reset-password?token=<jwt> or .../reset-password/<jwt>.
+_TOKEN_PATTERNS = (
+    re.compile(r"[?&]token=([A-Za-z0-9._~-]+)"),
+    re.compile(r"/reset-password/([A-Za-z0-9._~-]+)"),
+)
+
+
+def _body_text(message):
+    parts = message.walk() if message.is_multipart() else [message]
+    texts = []
+    for part in parts:
+        if part.get_content_maintype() == "text":
+            texts.append(part.get_content())
+    return "\n".join(texts)
+
+
+def extract_reset_token(message):
+    """Reset token from the link in ``message``'s text or HTML body, or None."""
+    text = _body_text(message)
+    for pattern in _TOKEN_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+class SmtpHandler(socketserver.StreamRequestHandler):
+    def _reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        sink = self.server.sink
+        self._reply("220 vut-smtp-sink ESMTP")
+        mail_from, rcpt_to = None, []
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            line = raw.decode("utf-8", "replace").rstrip("\r\n")
+            verb, _, arg = line.partition(" ")
+            verb = verb.upper()
+            if verb == "EHLO":
+                self._reply("250-vut-smtp-sink")
+                self._reply("250-8BITMIME")
+                self._reply("250 SMTPUTF8")
+            elif verb == "HELO":
+                self._reply("250 vut-smtp-sink")
+            elif verb == "MAIL":
+                mail_from, rcpt_to = _address(arg), []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                rcpt_to.append(_address(arg))
+                self._reply("250 OK")
+            elif verb == "DATA":
+                if not rcpt_to:
+                    self._reply("503 RCPT first")
+                    continue
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                data = self._read_data()
+                if data is None:
+                    return
+                sink._store(mail_from, rcpt_to, data)
+                self._reply("250 OK queued")
+                mail_from, rcpt_to = None, []
+            elif verb == "RSET":
+                mail_from, rcpt_to = None, []
+                self._reply("250 OK")
+            elif verb == "NOOP":
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _read_data(self):
+        lines = []
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return None
+            if raw in (b".\r\n", b".\n"):
+                return b"".join(lines)
+            # Undo dot-stuffing.
+            lines.append(raw[1:] if raw.startswith(b"..") else raw)
+
+
+def _address(arg):
+    """``FROM:<a@b.c> SIZE=12`` -> ``a@b.c`` (lower-cased)."""
+    match = re.search(r"<([^>]*)>", arg)
+    value = match.group(1) if match else arg.partition(":")[2].split(" ")[0]
+    return value.strip().lower()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class SmtpSink:
+    """Threaded SMTP sink; use as a context manager and read ``.messages``.
+
+    Each message is ``{"received_at", "mail_from", "rcpt_to", "message"}``
+    with ``received_at`` from time.time() and ``message`` an
+    email.message.EmailMessage.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.server = _Server((host, port), SmtpHandler)
+        self.server.sink = self
+        self.messages = []
+        self._received = threading.Condition()
+        self._thread = None
+
+    @property
+    def address(self):
+        return self.server.server_address[:2]
+
+    def _store(self, mail_from, rcpt_to, data):
+        message = email.message_from_bytes(data, policy=email.policy.default)
+        with self._received:
+            self.messages.append(
+                {
+                    "received_at": time.time(),
+                    "mail_from": mail_from,
+                    "rcpt_to": rcpt_to,
+                    "message": message,
+                }
+            )
+            self._received.notify_all()
+
+    def wait_for(self, recipient, since=0.0, timeout=10):
+        """First message to ``recipient`` received after ``since``; raises TimeoutError."""
+        recipient = recipient.lower()
+
+        def find():
+            for mail in self.messages:
+                if recipient in mail["rcpt_to"] and mail["received_at"] >= since:
+                    return mail
+            return None
+
+        with self._received:
+            mail = self._received.wait_for(find, timeout)
+        if mail is None:
+            raise TimeoutError(f"No email to {recipient} within {timeout}s")
+        return mail
+
+    def clear(self):
+        with self._received:
+            self.messages.clear()
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, name="smtp-sink", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2525)
+    args = parser.parse_args(argv)
+
+    sink = SmtpSink(args.host, args.port).start()
+    print(f"SMTP sink on {args.host}:{sink.address[1]}")
+    seen = 0
+    try:
+        while True:
+            time.sleep(0.5)
+            for mail in sink.messages[seen:]:
+                message = mail["message"]
+                print(
+                    f"{time.strftime('%H:%M:%S', time.localtime(mail['received_at']))}"
+                    f" to {', '.join(mail['rcpt_to'])}: {message['Subject']!r}"
+                    f" token={extract_reset_token(message)}"
+                )
+            seen = len(sink.messages)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sink.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+import difflib
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import defaultdict
+
+from utils.spec import endpoint_template
+
+DEFAULT_SNAPSHOT_DIR = "snapshots"
+
+# Values under these keys change from run to run and are masked before
+# storing or comparing: tokens, keys, ids, timestamps and generated URLs.
+VOLATILE_KEYS = re.compile(
+    r"token|password|secret|key|^id$|_id$|Id$|date|time|_at$|url|link|created|updated",
+    re.IGNORECASE,
+)
+# Top-level keys whose values are part of the contract and go into the
+# structural hash.
+CONTRACT_KEYS = {"success", "status", "message", "error"}
+MASK = "<volatile>"
+
+
+class SnapshotMismatch(AssertionError):
+    pass
+
+
+def normalize(body):
+    """Copy of a JSON body with volatile values replaced by ``MASK``."""
+    if isinstance(body, dict):
+        return {
+            k: MASK if VOLATILE_KEYS.search(k) else normalize(v)
+            for k, v in body.items()
+        }
+    if isinstance(body, list):
+        return [normalize(v) for v in body]
+    return body
+
+
+NULL = "NoneType"
+
+
+def merge_shapes(a, b):
+    """One shape covering ``a`` and ``b``; null (and a missing key) matches anything."""
+    if a == b:
+        return a
+    if a == NULL:
+        return b
+    if b == NULL:
+        return a
+    if isinstance(a, dict) and isinstance(b, dict):
+        return {k: merge_shapes(a.get(k, NULL), b.get(k, NULL)) for k in {**a, **b}}
+    if isinstance(a, list) and isinstance(b, list):
+        # ["list"] is an empty list, ["list", item_shape] a non-empty one.
+        items = a[1:] + b[1:]
+        if len(items) == 2:
+            items = [merge_shapes(*items)]
+        return ["list"] + items[:1]
+    # Different types at the same place: record the alternatives.
+    names = set()
+    for value in (a, b):
+        names.update(value.split("|") if isinstance(value, str) else [type(value).__name__])
+    return "|".join(sorted(names))
+
+
+def shape(body, top_level=True):
+    """The structure of a normalized body: keys and value types.
+
+    List items merge into one shape (``merge_shapes``), so a listing that
+    returns a different number of rows, or nulls in some rows, keeps its
+    shape. Values are kept only for top-level ``CONTRACT_KEYS``.
+    """
+    if isinstance(body, dict):
+        return {
+            k: v if top_level and k in CONTRACT_KEYS else shape(v, False)
+            for k, v in body.items()
+        }
+    if isinstance(body, list):
+        if not body:
+            return ["list"]
+        merged = shape(body[0], False)
+        for item in body[1:]:
+            merged = merge_shapes(merged, shape(item, False))
+        return ["list", merged]
+    if body == MASK:
+        return body
+    return type(body).__name__
+
+
+def structural_hash(normalized):
+    data = json.dumps(shape(normalized), sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+
+def diff(expected, actual, name="snapshot"):
+    """Unified diff of two normalized bodies."""
+    a = json.dumps(expected, indent=2, sort_keys=True).splitlines()
+    b = json.dumps(actual, indent=2, sort_keys=True).splitlines()
+    return "\n".join(
+        difflib.unified_diff(a, b, f"{name} (stored)", f"{name} (received)", lineterm="")
+    )
+
+
+def snapshot_path(directory, nodeid):
+    """``tests/videos/test_01.py::test_x[a]`` -> ``<dir>/tests/videos/test_01/test_x[a].json``."""
+    module, _, name = nodeid.partition("::")
+    name = re.sub(r"[^\w.\[\]-]+", "_", name)
+    return os.path.join(directory, os.path.splitext(module)[0], f"{name}.json")
+
+
+class SnapshotRecorder:
+    """APIClient listener that groups response shapes per test and endpoint.
+
+    Each ``METHOD /template STATUS`` seen during a test maps to the set of
+    structural hashes it returned, with one normalized example body per hash.
+    Checking a test compares hashes against the stored snapshot and only
+    builds a full diff for hashes the snapshot does not know.
+    """
+
+    def __init__(self, directory=DEFAULT_SNAPSHOT_DIR, update=False):
+        self.directory = directory
+        self.update = update
+        self.current_test = None
+        self._seen = defaultdict(dict)
+        self._lock = threading.Lock()
+
+    def __call__(self, method, endpoint, response, elapsed):
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text
+        normalized = normalize(body)
+        digest = structural_hash(normalized)
+        key = f"{method} {endpoint_template(endpoint)} {response.status_code}"
+        with self._lock:
+            self._seen[self.current_test].setdefault(key, {}).setdefault(digest, normalized)
+
+    def _load(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write(self, path, seen):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(seen, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    def discard(self, nodeid):
+        """Forget a test's responses, e.g. because the test failed."""
+        with self._lock:
+            self._seen.pop(nodeid, None)
+
+    def check(self, nodeid):
+        """Compare a finished test with its snapshot.
+
+        Returns a list of problems (empty when it matches). Missing snapshots
+        are written, and with ``update`` the stored snapshot is replaced.
+        """
+        with self._lock:
+            seen = self._seen.pop(nodeid, {})
+        if not seen:
+            return []
+        path = snapshot_path(self.directory, nodeid)
+        stored = None if self.update else self._load(path)
+        if stored is None:
+            self._write(path, seen)
+            return []
+
+        problems = []
+        for key, shapes in sorted(seen.items()):
+            known = stored.get(key)
+            if known is None:
+                problems.append(f"{key}: not in snapshot (stored: {sorted(stored)})")
+                continue
+            for digest, body in shapes.items():
+                if digest in known:
+                    continue
+                reference = next(iter(known.values()))
+                problems.append(f"{key}: response shape changed\n{diff(reference, body, key)}")
+        return problems
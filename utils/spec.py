@@ -0,0 +1,47 @@
+import json
+import os
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+SPEC_PATH = os.path.join(os.path.dirname(__file__), "api.json")
+
+
+@lru_cache(maxsize=None)
+def load_spec(path=SPEC_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def template_regex(template):
+    """Regex matching concrete paths for a spec template such as /api/video/{id}."""
+    regex = re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(template.rstrip("/")))
+    return re.compile(f"^{regex}/?$")
+
+
+@lru_cache(maxsize=None)
+def _path_patterns(path=SPEC_PATH):
+    patterns = []
+    for template in load_spec(path)["paths"]:
+        patterns.append((template.count("{"), template, template_regex(template)))
+    # Literal paths such as /api/video/list must win over /api/video/{id}.
+    patterns.sort(key=lambda p: p[0])
+    return patterns
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint, path=SPEC_PATH):
+    """Map a concrete request path to its ``utils/api.json`` template.
+
+    ``/api/video/90?key=abc`` becomes ``/api/video/{id}``. Paths the spec does
+    not describe are returned without their query string.
+    """
+    route = urlsplit(endpoint).path
+    for _, template, regex in _path_patterns(path):
+        if regex.match(route):
+            return template
+    return route
+
+
+def spec_version(path=SPEC_PATH):
+    return load_spec(path).get("info", {}).get("version", "unknown")
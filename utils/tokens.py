@@ -0,0 +1,71 @@
+"""Bearer tokens in each validation state, for auth overhead comparisons.
+
+Without the backend's signing secret an expired token can't be minted, so
+``expired_token`` prefers a real one recorded in ``VUT_EXPIRED_TOKEN`` and
+otherwise re-encodes the valid token's claims with ``exp`` in the past. That
+forgery fails signature verification before the expiry check, so label it as
+such when comparing.
+"""
+
+import base64
+import json
+import os
+import time
+
+GARBAGE_TOKEN = "not-a-jwt"
+
+
+def _b64url_decode(part):
+    return base64.urlsafe_b64decode(part + "=" * (-len(part) % 4))
+
+
+def _b64url_encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def decode_claims(token):
+    """Unverified JWT payload; None if ``token`` isn't a JWT."""
+    try:
+        return json.loads(_b64url_decode(token.split(".")[1]))
+    except (IndexError, ValueError):
+        return None
+
+
+def forge_jwt(claims, header=None, signature=b"forged"):
+    header = header or {"alg": "HS256", "typ": "JWT"}
+    return ".".join(
+        [
+            _b64url_encode(json.dumps(header, separators=(",", ":")).encode()),
+            _b64url_encode(json.dumps(claims, separators=(",", ":")).encode()),
+            _b64url_encode(signature),
+        ]
+    )
+
+
+def tampered_token(token):
+    """``token`` with its signature replaced: well-formed, fails verification."""
+    header, payload, _ = token.split(".")
+    return f"{header}.{payload}.{_b64url_encode(b'tampered-signature-' * 2)}"
+
+
+def expired_token(valid_token):
+    """``(token, kind)``; kind is "recorded" or "forged" (see module docstring)."""
+    recorded = os.environ.get("VUT_EXPIRED_TOKEN")
+    if recorded:
+        return recorded, "recorded"
+    claims = decode_claims(valid_token) or {}
+    now = int(time.time())
+    claims.update(iat=now - 7200, exp=now - 3600)
+    return forge_jwt(claims), "forged"
+
+
+def token_variants(valid_token):
+    """``{label: Authorization header value or None}`` for one request each."""
+    expired, kind = expired_token(valid_token)
+    return {
+        "anonymous": None,
+        "valid": f"Bearer {valid_token}",
+        f"expired ({kind})": f"Bearer {expired}",
+        "bad signature": f"Bearer {tampered_token(valid_token)}",
+        "garbage": f"Bearer {GARBAGE_TOKEN}",
+    }
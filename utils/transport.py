@@ -0,0 +1,198 @@
+"""HTTP backends behind APIClient.
+
+A transport turns ``request(method, url, **requests_style_kwargs)`` into a
+response object with the ``requests.Response`` surface the tests use
+(status_code, json(), text, content, headers, request). ``requests`` is the
+default; ``httpx`` adds HTTP/2, multiplexing concurrent requests from every
+thread over one connection.
+"""
+
+import os
+
+from requests.adapters import HTTPAdapter
+
+
+class RequestsTransport:
+    """requests.Session over HTTP/1.1 keep-alive; one session per thread."""
+
+    name = "requests"
+    # Sessions are not thread-safe, so APIClient.fork() builds a new transport.
+    shareable = False
+
+    def __init__(self, pool_connections, pool_maxsize, max_retries, connection_stats=None):
+        import requests
+
+        self.session = requests.Session()
+        adapter_kwargs = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "max_retries": max_retries,
+        }
+        if connection_stats is not None:
+            from utils.connstats import ProfilingAdapter
+
+            adapter = ProfilingAdapter(connection_stats, **adapter_kwargs)
+        else:
+            adapter = HTTPAdapter(**adapter_kwargs)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+class _HttpxRequest:
+    """Gives httpx.Request the ``body`` attribute requests-based code reads."""
+
+    def __init__(self, request, body):
+        self._request = request
+        self.body = body
+
+    def __getattr__(self, name):
+        return getattr(self._request, name)
+
+
+class _IterableBody:
+    """Hides ``read`` from httpx so it iterates the body, which restarts it.
+
+    A generator or a readable object is sent once; this can be resent on a
+    redirect.
+    """
+
+    def __init__(self, body):
+        self.body = body
+
+    def __iter__(self):
+        return iter(self.body)
+
+
+class _HttpxResponse:
+    def __init__(self, response, body=None):
+        self._response = response
+        self.request = _HttpxRequest(response.request, body)
+
+    @property
+    def ok(self):
+        return not self._response.is_error
+
+    def raise_for_status(self):
+        self._response.raise_for_status()
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def __bool__(self):
+        return self.ok
+
+
+class HttpxTransport:
+    """httpx.Client with HTTP/2; safe to share across threads.
+
+    Needs ``pip install "httpx[http2]"``. HTTP/2 is negotiated via TLS ALPN,
+    so plain ``http://`` targets stay on HTTP/1.1 unless
+    ``VUT_HTTP2_PRIOR_KNOWLEDGE=1`` forces cleartext HTTP/2 (which
+    ``utils.mock_server --http2`` speaks).
+    """
+
+    name = "httpx"
+    shareable = True
+
+    def __init__(self, pool_connections, pool_maxsize, max_retries, connection_stats=None):
+        try:
+            import httpx
+        except ImportError:
+            raise RuntimeError(
+                'The httpx backend needs: pip install "httpx[http2]"'
+            ) from None
+        self.connection_stats = connection_stats
+
+        prior_knowledge = os.environ.get("VUT_HTTP2_PRIOR_KNOWLEDGE") == "1"
+        self.httpx = httpx
+        # httpx ignores the client's limits and HTTP versions when given a
+        # transport, so they are set on the transport itself.
+        self.session = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http1=not prior_knowledge,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize
+                ),
+                retries=max_retries if isinstance(max_retries, int) else 0,
+            ),
+        )
+
+    def request(
+        self,
+        method,
+        url,
+        params=None,
+        data=None,
+        headers=None,
+        files=None,
+        json=None,
+        timeout=None,
+        allow_redirects=True,
+        **kwargs,
+    ):
+        if kwargs:
+            raise TypeError(f"httpx backend does not support per-request {sorted(kwargs)}")
+        options = {
+            "params": params,
+            "headers": dict(headers or {}),
+            "json": json,
+            "files": files,
+            "follow_redirects": allow_redirects,
+            # None means no timeout, as with requests; httpx would apply its
+            # own 5 s default.
+            "timeout": self.httpx.Timeout(None) if timeout is None else timeout,
+        }
+        if self.connection_stats is not None:
+            from utils.connstats import connection_trace
+
+            options["extensions"] = {"trace": connection_trace(self.connection_stats)}
+        if isinstance(data, (dict, list, tuple)):
+            options["data"] = data
+        elif isinstance(data, (str, bytes)):
+            options["content"] = data
+        elif data is not None:
+            # Streaming body such as MultipartEncoder: send its chunks with
+            # the known length instead of chunked transfer encoding.
+            options["headers"].setdefault("Content-Length", str(len(data)))
+            options["content"] = _IterableBody(data)
+        response = self.session.request(method, url, **options)
+        # Streamed bodies are not kept by httpx; report the encoder instead.
+        body = data if "content" in options and data is not None else None
+        if body is None and response.request.headers.get("Content-Length"):
+            body = response.request.content
+        return _HttpxResponse(response, body)
+
+    def close(self):
+        self.session.close()
+
+
+TRANSPORTS = {"requests": RequestsTransport, "httpx": HttpxTransport}
+
+
+def transport_errors():
+    """Connection-level errors of the installed backends, for ``except`` clauses."""
+    import requests
+
+    errors = (requests.ConnectionError,)
+    try:
+        import httpx
+    except ImportError:
+        return errors
+    return errors + (httpx.TransportError,)
+
+
+def create_transport(name, **options):
+    try:
+        cls = TRANSPORTS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown HTTP backend {name!r}; choose from {sorted(TRANSPORTS)}"
+        ) from None
+    return cls(**options)
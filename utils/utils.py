@@ -8,3 +8,32 @@ def generate_account_status_name():
     return (
         name.capitalize()
     )  # Capitalize the first letter for a more name-like appearance
+
+
+# -------------------- Dashboard Formatting --------------------
+
+STORAGE_UNITS = ["B", "KB", "MB", "GB", "TB"]
+
+
+def format_duration(seconds):
+    """Render seconds the way the admin dashboard does, e.g. "2 hrs 0 min"."""
+    minutes = int(seconds) // 60
+    return f"{minutes // 60} hrs {minutes % 60} min"
+
+
+def parse_duration(text):
+    """Inverse of format_duration, in whole seconds."""
+    hours, _, minutes, _ = text.split()
+    return (int(hours) * 60 + int(minutes)) * 60
+
+
+def parse_storage(text):
+    """Parse a dashboard size such as "1.85 GB" (1024-based).
+
+    Returns (bytes, resolution) where resolution is the byte value of the last
+    displayed digit, i.e. how far the shown figure can be from the real one.
+    """
+    value, unit = text.split()
+    scale = 1024 ** STORAGE_UNITS.index(unit)
+    decimals = len(value.partition(".")[2])
+    return float(value) * scale, scale / 10**decimals